@@ -8,11 +8,25 @@ This script:
 - Includes root cause analysis, consensus rationale, implementation steps, and verification
 """
 
+import argparse
+import hashlib
+import json
 import sys
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from dataclasses import asdict, dataclass, field
+
+# Sibling modules in execution/
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fix_rules import RULE_INDEX, RuleIndex
+from log_artifacts import ArtifactError, is_artifact, read_artifact, records_of_type
+from plan_cache import PlanCache, PlanCacheError
+
+# Bump whenever the rendered plan sections change, so cached plans are not reused
+PLAN_FORMAT_VERSION = 1
 
 
 @dataclass
@@ -39,13 +53,30 @@ class RootCauseAnalysis:
     error_count: int
     category: str
     evidence: List[str]
+    causal_chain: List[str] = field(default_factory=list)
+
+
+@dataclass
+class MasterPlan:
+    """Agent Gamma's output: the plan and the analysis it was built from."""
+    root_cause: RootCauseAnalysis
+    decision: ConsensusDecision
+    markdown: str
 
 
 class AgentGamma:
     """The Coordinator - Generates final execution plan."""
 
-    def __init__(self):
+    def __init__(self, rules: RuleIndex = RULE_INDEX, cache: Optional[PlanCache] = None):
+        """
+        Args:
+            rules: Fix catalog the decisions come from (its version is part of the cache key)
+            cache: Cache for the rendered plan sections that depend only on the
+                root-cause signature (default: no caching)
+        """
         self.name = "Agent Gamma (The Coordinator)"
+        self.rules = rules
+        self.cache = cache
 
     def parse_phase1_output(self, text: str) -> RootCauseAnalysis:
         """Extract root cause from Phase 1 diagnostic output."""
@@ -71,11 +102,19 @@ class AgentGamma:
                     count = int(parts[1].split()[0])
                     error_categories[category] = count
 
-        # Find primary root cause (first process in root causes section)
+        # Strongest causal source and its chain (CAUSAL CHAINS section)
+        causal_chain = []
+        for line in lines:
+            if line.startswith("Source:") and not causal_chain:
+                causal_chain = [line.split("(")[0].replace("Source:", "").strip()]
+            elif line.strip().startswith("Chain:") and len(causal_chain) == 1:
+                causal_chain = [process.strip() for process in line.split(":", 1)[1].split("→")]
+            elif "POTENTIAL ROOT CAUSES" in line:
+                break
+
+        # Ranked processes with their evidence (POTENTIAL ROOT CAUSES section)
         in_root_causes = False
-        primary_process = None
-        primary_error_count = 0
-        evidence = []
+        causes = []
 
         for i, line in enumerate(lines):
             if "POTENTIAL ROOT CAUSES" in line:
@@ -84,39 +123,80 @@ class AgentGamma:
 
             if in_root_causes:
                 if line.startswith("Process:"):
-                    if not primary_process:  # First process is primary cause
-                        parts = line.split("(")
-                        if len(parts) >= 2:
-                            primary_process = parts[0].replace("Process:", "").strip()
-                            primary_error_count = int(parts[1].split()[0])
-                    else:
-                        break  # Stop after first process
-                elif line.strip().startswith("[") and primary_process:
-                    evidence.append(line.strip().split("] ", 1)[-1][:80])
-
-        # Determine primary issue type
-        evidence_text = " ".join(evidence).lower()
-        if "framework" in evidence_text or "library" in evidence_text:
-            primary_issue = "Missing or corrupted system frameworks"
-        elif "memory" in evidence_text or "allocation" in evidence_text:
-            primary_issue = "Memory exhaustion and resource pressure"
-        elif "acpi" in evidence_text or "hardware" in evidence_text:
-            primary_issue = "Hardware initialization and ACPI errors"
-        elif "service" in evidence_text or "launchd" in evidence_text:
-            primary_issue = "System service initialization failures"
-        else:
-            primary_issue = "System instability and error cascades"
+                    parts = line.split("(")
+                    if len(parts) >= 2:
+                        causes.append((parts[0].replace("Process:", "").strip(),
+                                       int(parts[1].split()[0]), []))
+                elif line.strip().startswith("[") and causes:
+                    causes[-1][2].append(line.strip().split("] ", 1)[-1][:80])
 
         category = max(error_categories, key=error_categories.get) if error_categories else "System"
+        return self._build_root_cause(causes, causal_chain, category, total_errors)
+
+    def _build_root_cause(self, causes: List[Tuple[str, int, List[str]]], causal_chain: List[str],
+                          category: str, total_errors: int) -> RootCauseAnalysis:
+        """
+        Pick the primary cause from ranked processes and the causal chain.
+
+        The upstream causal source (first process of the chain), when Phase 1
+        found one, is the primary cause; otherwise the highest-ranked process.
+
+        Args:
+            causes: (process, error_count, evidence) in rank order
+            causal_chain: Strongest causal chain, source first (may be empty)
+            category: Dominant error category
+            total_errors: Total errors, used when no process stands out
+        """
+        source = causal_chain[0] if causal_chain else None
+        primary = next((cause for cause in causes if cause[0] == source), causes[0] if causes else None)
+
+        affected = list(causal_chain)
+        if primary and primary[0] not in affected:
+            affected.append(primary[0])
+        evidence = primary[2] if primary else []
 
         return RootCauseAnalysis(
-            primary_issue=primary_issue,
-            affected_processes=[primary_process] if primary_process else [],
-            error_count=primary_error_count or total_errors,
+            primary_issue=self._classify_issue(evidence),
+            affected_processes=affected,
+            error_count=(primary[1] if primary else 0) or total_errors,
             category=category,
-            evidence=evidence[:3]  # Top 3 evidence points
+            evidence=evidence[:3],  # Top 3 evidence points
+            causal_chain=causal_chain,
         )
 
+    def load_phase1_artifact(self, path: str) -> RootCauseAnalysis:
+        """Extract root cause from a Phase 1 JSON Lines artifact (parse_macos_logs.py --json)."""
+        return self.root_cause_from_records(read_artifact(path, phase=1))
+
+    def root_cause_from_records(self, records: Iterable[Dict[str, Any]]) -> RootCauseAnalysis:
+        """Extract root cause from Phase 1 artifact records, read from disk or built in memory."""
+        records = list(records)
+        summaries = records_of_type(records, "summary")
+        total_errors = summaries[0]["errors"] if summaries else 0
+        error_categories = {r["category"]: r["total"] for r in records_of_type(records, "category")}
+
+        causes = [(r["process"], r["error_count"], [item["template"][:80] for item in r.get("templates", [])])
+                  for r in sorted(records_of_type(records, "root_cause"), key=lambda r: r["rank"])]
+        sources = sorted(records_of_type(records, "causal_source"), key=lambda r: r["rank"])
+        causal_chain = (sources[0].get("chain") or [sources[0]["process"]]) if sources else []
+
+        category = max(error_categories, key=error_categories.get) if error_categories else "System"
+        return self._build_root_cause(causes, causal_chain, category, total_errors)
+
+    def _classify_issue(self, evidence: List[str]) -> str:
+        """Determine primary issue type from root-cause evidence."""
+        evidence_text = " ".join(evidence).lower()
+        if "framework" in evidence_text or "library" in evidence_text:
+            return "Missing or corrupted system frameworks"
+        elif "memory" in evidence_text or "allocation" in evidence_text:
+            return "Memory exhaustion and resource pressure"
+        elif "acpi" in evidence_text or "hardware" in evidence_text:
+            return "Hardware initialization and ACPI errors"
+        elif "service" in evidence_text or "launchd" in evidence_text:
+            return "System service initialization failures"
+        else:
+            return "System instability and error cascades"
+
     def parse_phase2_output(self, text: str) -> ConsensusDecision:
         """Extract consensus decision from Phase 2 debate output."""
         lines = text.split('\n')
@@ -203,6 +283,35 @@ class AgentGamma:
             concerns=concerns
         )
 
+    def load_phase2_artifact(self, path: str) -> ConsensusDecision:
+        """Extract consensus decision from a Phase 2 JSON Lines artifact (agent_debate.py --json)."""
+        records = read_artifact(path, phase=2)
+        if not records_of_type(records, "consensus"):
+            raise ArtifactError(f"{path} has no consensus record")
+        return self.decision_from_records(records)
+
+    def decision_from_records(self, records: Iterable[Dict[str, Any]]) -> ConsensusDecision:
+        """Extract consensus decision from Phase 2 artifact records, read from disk or built in memory."""
+        consensus = records_of_type(records, "consensus")
+        if not consensus:
+            raise ArtifactError("Phase 2 records have no consensus record")
+        fix = consensus[-1]["fix"]
+        critique = consensus[-1]["critique"]
+
+        return ConsensusDecision(
+            fix_id=fix["fix_id"],
+            title=fix["title"],
+            description=fix["description"],
+            commands=fix["commands"],
+            risk_level=fix["risk_level"],
+            targets=fix["targets"],
+            recommendation=critique["recommendation"],
+            system_impact=critique["system_impact"],
+            app_impact=critique["app_impact"],
+            benefits=critique["benefits"],
+            concerns=critique["concerns"]
+        )
+
     def get_implementation_steps(self, decision: ConsensusDecision) -> List[str]:
         """Generate detailed implementation steps based on the fix."""
         # Map fix titles to their implementation steps
@@ -357,7 +466,7 @@ class AgentGamma:
             "5. Verify resolution"
         ]
 
-    def get_verification_steps(self, decision: ConsensusDecision, root_cause: RootCauseAnalysis) -> List[str]:
+    def get_verification_steps(self, decision: ConsensusDecision) -> List[str]:
         """Generate verification steps to confirm the fix worked."""
         steps = [
             "**Immediate Verification:**",
@@ -415,11 +524,67 @@ class AgentGamma:
         return steps
 
     def generate_master_plan(self, phase1_text: str, phase2_text: str) -> str:
-        """Generate the complete master plan markdown document."""
+        """Generate the complete master plan markdown document from Phase 1/2 text reports."""
         # Parse inputs
         root_cause = self.parse_phase1_output(phase1_text)
         decision = self.parse_phase2_output(phase2_text)
-
+        return self.render_master_plan(root_cause, decision)
+
+    def generate_master_plan_from_artifacts(self, phase1_path: str, phase2_path: str) -> str:
+        """Generate the complete master plan markdown document from Phase 1/2 JSON artifacts."""
+        root_cause = self.load_phase1_artifact(phase1_path)
+        decision = self.load_phase2_artifact(phase2_path)
+        return self.render_master_plan(root_cause, decision)
+
+    def build_master_plan(self, root_cause: RootCauseAnalysis, decision: ConsensusDecision) -> MasterPlan:
+        """Render the master plan and keep it together with its inputs."""
+        return MasterPlan(root_cause=root_cause, decision=decision,
+                          markdown=self.render_master_plan(root_cause, decision))
+
+    def plan_signature(self, root_cause: RootCauseAnalysis, decision: ConsensusDecision) -> str:
+        """
+        Cache key of the plan sections that follow from the root cause and fix.
+
+        Normalized (primary issue, category, fix), a digest of every decision
+        field (the cached sections render description, benefits, concerns,
+        targets and more, which can differ for the same fix), plus the fix
+        catalog and plan format versions, so editing a rule or the rendering
+        invalidates older entries.
+        """
+        decision_digest = hashlib.sha1(
+            json.dumps(asdict(decision), sort_keys=True).encode('utf-8')).hexdigest()
+        signature = [
+            " ".join(root_cause.primary_issue.lower().split()),
+            root_cause.category.strip().lower(),
+            decision.fix_id,
+            " ".join(decision.title.lower().split()),
+            decision_digest,
+            self.rules.version,
+            PLAN_FORMAT_VERSION,
+        ]
+        return hashlib.sha1(json.dumps(signature).encode('utf-8')).hexdigest()
+
+    def render_master_plan(self, root_cause: RootCauseAnalysis, decision: ConsensusDecision) -> str:
+        """Render the master plan markdown for an already-parsed root cause and decision."""
+        head = "\n".join(self._render_root_cause_section(root_cause))
+        if self.cache is None:
+            return head + "\n" + "\n".join(self._render_decision_sections(decision))
+
+        # Everything after the root cause section depends only on the decision
+        key = self.plan_signature(root_cause, decision)
+        body = self.cache.get(key)
+        if body is None:
+            body = "\n".join(self._render_decision_sections(decision))
+            self.cache.put(key, body)
+        try:
+            self.cache.save()
+        except PlanCacheError as e:
+            # The plan itself is fine; only the next run loses the cached copy
+            print(f"Warning: {e}", file=sys.stderr)
+        return head + "\n" + body
+
+    def _render_root_cause_section(self, root_cause: RootCauseAnalysis) -> List[str]:
+        """Title block and section 1, which carry this run's timestamp and evidence."""
         # Generate plan sections
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -442,6 +607,9 @@ class AgentGamma:
         for proc in root_cause.affected_processes[:5]:
             plan.append(f"- {proc}")
         plan.append("")
+        if len(root_cause.causal_chain) > 1:
+            plan.append(f"**Causal Chain:** {' → '.join(root_cause.causal_chain)}")
+            plan.append("")
         plan.append(f"**Error Count:** {root_cause.error_count} errors detected")
         plan.append("")
         plan.append("**Evidence:**")
@@ -451,6 +619,12 @@ class AgentGamma:
         plan.append("---")
         plan.append("")
 
+        return plan
+
+    def _render_decision_sections(self, decision: ConsensusDecision) -> List[str]:
+        """Sections 2-4 and the notes; they depend on the decision only."""
+        plan = []
+
         # Section 2: Consensus Decision
         plan.append("## 2. CONSENSUS DECISION")
         plan.append("")
@@ -491,7 +665,7 @@ class AgentGamma:
         # Section 4: Verification Steps
         plan.append("## 4. VERIFICATION STEPS")
         plan.append("")
-        verification_steps = self.get_verification_steps(decision, root_cause)
+        verification_steps = self.get_verification_steps(decision)
         plan.extend(verification_steps)
         plan.append("")
         plan.append("---")
@@ -515,28 +689,50 @@ class AgentGamma:
         plan.append("Run the diagnostic again and the system will propose alternative solutions.")
         plan.append("")
 
-        return "\n".join(plan)
+        return plan
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 3:
-        print("Usage: python agent_coordinator.py <phase1_output.txt> <phase2_output.txt>")
-        print("Or pipe both: python parse_macos_logs.py logs.txt > p1.txt && python agent_debate.py p1.txt > p2.txt && python agent_coordinator.py p1.txt p2.txt")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Phase 3: master plan from Phase 1 and Phase 2 results",
+        epilog="Or chain the phases: python parse_macos_logs.py logs.txt > p1.txt && "
+               "python agent_debate.py p1.txt > p2.txt && python agent_coordinator.py p1.txt p2.txt",
+    )
+    parser.add_argument("phase1", help="Phase 1 report (.txt) or JSON Lines artifact (.jsonl)")
+    parser.add_argument("phase2", help="Phase 2 report (.txt) or JSON Lines artifact (.jsonl)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Render the whole plan instead of reusing cached sections")
+    parser.add_argument("--cache", metavar="PATH", help="Plan cache file (default: .tmp/plan_cache.json)")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print plan cache hit/miss statistics to stderr")
+    args = parser.parse_args()
 
-    # Read Phase 1 and Phase 2 outputs
-    with open(sys.argv[1], 'r') as f:
-        phase1_text = f.read()
+    # Initialize coordinator
+    cache = None if args.no_cache else PlanCache(args.cache)
+    gamma = AgentGamma(cache=cache)
 
-    with open(sys.argv[2], 'r') as f:
-        phase2_text = f.read()
+    # Load each phase from its JSON artifact when given one, else parse the text report
+    try:
+        if is_artifact(args.phase1):
+            root_cause = gamma.load_phase1_artifact(args.phase1)
+        else:
+            with open(args.phase1, 'r') as f:
+                root_cause = gamma.parse_phase1_output(f.read())
 
-    # Initialize coordinator
-    gamma = AgentGamma()
+        if is_artifact(args.phase2):
+            decision = gamma.load_phase2_artifact(args.phase2)
+        else:
+            with open(args.phase2, 'r') as f:
+                decision = gamma.parse_phase2_output(f.read())
+    except ArtifactError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
     # Generate master plan
-    print(gamma.generate_master_plan(phase1_text, phase2_text))
+    print(gamma.render_master_plan(root_cause, decision))
+    if args.cache_stats and cache is not None:
+        print(cache.format_stats(), file=sys.stderr)
 
 
 if __name__ == '__main__':
@@ -9,9 +9,17 @@ This script simulates the debate between:
 The agents debate until consensus is reached on the best solution.
 """
 
+import argparse
 import sys
-from typing import List, Tuple
-from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
+from dataclasses import dataclass, asdict
+
+# Sibling modules in execution/
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fix_rules import RULE_INDEX, FixRule, RuleIndex
+from log_artifacts import ArtifactError, is_artifact, read_artifact, records_of_type, write_artifact
 
 
 @dataclass
@@ -60,239 +68,110 @@ class DebateRound:
 class AgentAlpha:
     """The Investigator - Proposes immediate fixes based on error patterns."""
 
-    def __init__(self):
+    def __init__(self, rules: RuleIndex = RULE_INDEX):
         self.name = "Agent Alpha (The Investigator)"
+        self.rules = rules
 
     def analyze_patterns(self, errors: List[ErrorPattern]) -> List[ProposedFix]:
         """Analyze error patterns and propose fixes."""
-        fixes = []
-
-        # Group errors by category
-        system_errors = [e for e in errors if e.category == "System"]
-        app_errors = [e for e in errors if e.category in ["Apple Apps", "Third-Party Apps"]]
-
-        # Generate fixes based on patterns
-        fix_id = 1
-
-        # Check for kernel/system errors
-        kernel_errors = [e for e in system_errors if e.process == "kernel"]
-        if kernel_errors:
-            fixes.append(self._propose_kernel_fix(fix_id, kernel_errors))
-            fix_id += 1
-
-        # Check for framework/library issues
-        framework_errors = [e for e in errors if "framework" in str(e.messages).lower() or "library" in str(e.messages).lower()]
-        if framework_errors:
-            fixes.append(self._propose_framework_fix(fix_id, framework_errors))
-            fix_id += 1
-
-        # Check for resource exhaustion
-        resource_errors = [e for e in errors if any(keyword in str(e.messages).lower() for keyword in ["memory", "out of", "allocation"])]
-        if resource_errors:
-            fixes.append(self._propose_resource_fix(fix_id, resource_errors))
-            fix_id += 1
-
-        # Check for service/daemon issues
-        service_errors = [e for e in system_errors if "launchd" in e.process or "service" in str(e.messages).lower()]
-        if service_errors:
-            fixes.append(self._propose_service_fix(fix_id, service_errors))
-            fix_id += 1
-
+        # One pass over the messages scores every rule in the catalog
+        fixes = [self._propose_fix(fix_id, rule)
+                 for fix_id, (rule, _) in enumerate(self.rules.match(errors), 1)]
         return fixes[:3]  # Return top 3 fixes
 
-    def _propose_kernel_fix(self, fix_id: int, errors: List[ErrorPattern]) -> ProposedFix:
-        """Propose fix for kernel-related errors."""
-        return ProposedFix(
-            fix_id=fix_id,
-            title="Reset NVRAM and SMC",
-            description="Kernel ACPI and hardware enumeration errors suggest corrupted NVRAM or SMC state. Reset both to restore default hardware configuration.",
-            commands=[
-                "sudo nvram -c",
-                "# Then restart Mac and hold: Option + Command + P + R (NVRAM reset)",
-                "# For SMC: Shut down, press Shift + Control + Option + Power for 10s"
-            ],
-            targets=["kernel", "ACPI", "IOKit drivers"],
-            risk_level="Medium",
-            estimated_impact="May reset system preferences, but resolves hardware initialization issues"
-        )
-
-    def _propose_framework_fix(self, fix_id: int, errors: List[ErrorPattern]) -> ProposedFix:
-        """Propose fix for framework loading issues."""
-        return ProposedFix(
-            fix_id=fix_id,
-            title="Repair System Frameworks and Permissions",
-            description="Missing framework errors indicate corrupted system files or permission issues. Rebuild framework cache and repair permissions.",
-            commands=[
-                "sudo update_dyld_shared_cache -force",
-                "sudo /System/Library/Frameworks/CoreServices.framework/Frameworks/LaunchServices.framework/Support/lsregister -kill -r -domain local -domain system -domain user",
-                "sudo diskutil repairPermissions /"
-            ],
-            targets=["SpringBoard", "LaunchServices", "System Frameworks"],
-            risk_level="Low",
-            estimated_impact="Safe operation, rebuilds framework cache without data loss"
-        )
-
-    def _propose_resource_fix(self, fix_id: int, errors: List[ErrorPattern]) -> ProposedFix:
-        """Propose fix for resource exhaustion issues."""
-        return ProposedFix(
-            fix_id=fix_id,
-            title="Clear Caches and Free Memory",
-            description="Memory allocation failures suggest insufficient resources. Clear system caches, restart memory-hungry processes.",
-            commands=[
-                "sudo purge",
-                "sudo rm -rf /Library/Caches/*",
-                "sudo rm -rf ~/Library/Caches/*",
-                "killall -9 Safari  # Restart affected apps"
-            ],
-            targets=["Safari", "WebKit", "System Memory"],
-            risk_level="Low",
-            estimated_impact="Temporary performance impact during cache rebuild, but resolves memory pressure"
-        )
-
-    def _propose_service_fix(self, fix_id: int, errors: List[ErrorPattern]) -> ProposedFix:
-        """Propose fix for service/daemon issues."""
+    def _propose_fix(self, fix_id: int, rule: FixRule) -> ProposedFix:
+        """Propose the fix of a matched catalog rule."""
         return ProposedFix(
             fix_id=fix_id,
-            title="Reload Launch Services",
-            description="Service initialization failures indicate corrupted launch daemons. Reload launchd configuration and restart services.",
-            commands=[
-                "sudo launchctl list | grep com.apple | awk '{print $3}' | xargs -I {} sudo launchctl kickstart -k system/{}",
-                "killall Dock",
-                "killall Finder"
-            ],
-            targets=["launchd", "com.apple.xpc.launchd", "System Services"],
-            risk_level="Medium",
-            estimated_impact="Temporary UI disruption as Finder/Dock restart, but resolves service issues"
+            title=rule.title,
+            description=rule.description,
+            commands=list(rule.commands),
+            targets=list(rule.targets),
+            risk_level=rule.risk_level,
+            estimated_impact=rule.estimated_impact
         )
 
 
 class AgentBeta:
     """The Architect - Evaluates solutions for long-term stability."""
 
-    def __init__(self):
+    def __init__(self, rules: RuleIndex = RULE_INDEX):
         self.name = "Agent Beta (The Architect)"
+        self.rules = rules
 
     def critique_fix(self, fix: ProposedFix, errors: List[ErrorPattern]) -> Critique:
         """Critique a proposed fix based on system/app impact."""
-        concerns = []
-        benefits = []
-        system_impact = ""
-        app_impact = ""
-        recommendation = ""
-
-        # Analyze by fix type
-        if "NVRAM" in fix.title or "SMC" in fix.title:
-            concerns = [
-                "Requires physical restart and manual key combinations",
-                "Resets system preferences (time zone, startup disk, etc.)",
-                "May not address software-level issues"
-            ]
-            benefits = [
-                "Resolves deep hardware initialization problems",
-                "No data loss or software reinstallation required",
-                "Eliminates ACPI and power management errors"
-            ]
-            system_impact = "HIGH - Resets firmware-level configuration, requires manual intervention"
-            app_impact = "LOW - Apps unaffected, but system preferences reset"
-            recommendation = "MODIFY - Only use if software fixes fail, document preference backup first"
-
-        elif "Framework" in fix.title or "Permission" in fix.title:
-            concerns = [
-                "Rebuilding cache may take 5-10 minutes",
-                "Requires sudo privileges"
-            ]
-            benefits = [
-                "Safe, non-destructive operation",
-                "Fixes framework loading and permission issues",
-                "Standard macOS maintenance procedure"
-            ]
-            system_impact = "LOW - Standard system maintenance, no configuration changes"
-            app_impact = "LOW - May require app relaunches, but no data loss"
-            recommendation = "APPROVE - Safe first-line fix for framework issues"
-
-        elif "Cache" in fix.title or "Memory" in fix.title:
-            concerns = [
-                "Killing Safari loses unsaved work",
-                "Cache clearing may temporarily slow performance",
-                "Doesn't address root cause of memory leaks"
-            ]
-            benefits = [
-                "Immediate relief from memory pressure",
-                "Quick to execute",
-                "No system-level changes"
-            ]
-            system_impact = "MINIMAL - Temporary performance impact during cache rebuild"
-            app_impact = "MEDIUM - Active applications may need restart, potential data loss"
-            recommendation = "MODIFY - Warn user to save work first, investigate memory leak source"
-
-        elif "Launch" in fix.title or "Service" in fix.title:
-            concerns = [
-                "Restarting all Apple services may cause brief system instability",
-                "Dock/Finder restart interrupts workflow",
-                "May not fix underlying service corruption"
-            ]
-            benefits = [
-                "Reloads damaged service configurations",
-                "Quick recovery without full reboot",
-                "Fixes XPC service communication issues"
-            ]
-            system_impact = "MEDIUM - Brief UI disruption, services restart"
-            app_impact = "MEDIUM - Running apps may lose connection to system services"
-            recommendation = "APPROVE - Good middle-ground fix, less disruptive than full reboot"
+        rule = self.rules.rule_for_title(fix.title)
+        if rule is None:
+            # Not a catalog fix: nothing known about its impact
+            return Critique(fix_id=fix.fix_id, concerns=[], benefits=[],
+                            system_impact="", app_impact="", recommendation="")
 
         return Critique(
             fix_id=fix.fix_id,
-            concerns=concerns,
-            benefits=benefits,
-            system_impact=system_impact,
-            app_impact=app_impact,
-            recommendation=recommendation
+            concerns=list(rule.concerns),
+            benefits=list(rule.benefits),
+            system_impact=rule.system_impact,
+            app_impact=rule.app_impact,
+            recommendation=rule.recommendation
         )
 
 
 class DebateFacilitator:
     """Facilitates the debate between Alpha and Beta."""
 
-    def __init__(self, alpha: AgentAlpha, beta: AgentBeta):
+    def __init__(self, alpha: AgentAlpha, beta: AgentBeta, out: Optional[TextIO] = None):
+        """
+        Args:
+            alpha: Proposing agent
+            beta: Critiquing agent
+            out: Stream for the debate transcript (default: sys.stdout)
+        """
         self.alpha = alpha
         self.beta = beta
+        self.out = out
         self.debate_log: List[DebateRound] = []
+        self.proposed_fixes: List[ProposedFix] = []
+        self.critiques: List[Critique] = []
 
     def conduct_debate(self, errors: List[ErrorPattern]) -> Tuple[ProposedFix, Critique, List[DebateRound]]:
         """Conduct debate until consensus is reached."""
-        print(f"\n{'='*80}")
-        print("PHASE 2: DELIBERATION (Agent Alpha & Agent Beta)")
-        print(f"{'='*80}\n")
+        print(f"\n{'='*80}", file=self.out)
+        print("PHASE 2: DELIBERATION (Agent Alpha & Agent Beta)", file=self.out)
+        print(f"{'='*80}\n", file=self.out)
 
         # Alpha proposes fixes
-        print(f"[{self.alpha.name}]")
-        print("Analyzing error patterns and proposing solutions...\n")
+        print(f"[{self.alpha.name}]", file=self.out)
+        print("Analyzing error patterns and proposing solutions...\n", file=self.out)
         proposed_fixes = self.alpha.analyze_patterns(errors)
+        self.proposed_fixes = proposed_fixes
 
-        print(f"I propose {len(proposed_fixes)} immediate fixes:\n")
+        print(f"I propose {len(proposed_fixes)} immediate fixes:\n", file=self.out)
         for fix in proposed_fixes:
-            print(f"Fix #{fix.fix_id}: {fix.title}")
-            print(f"  Description: {fix.description}")
-            print(f"  Risk Level: {fix.risk_level}")
-            print(f"  Targets: {', '.join(fix.targets)}")
-            print()
+            print(f"Fix #{fix.fix_id}: {fix.title}", file=self.out)
+            print(f"  Description: {fix.description}", file=self.out)
+            print(f"  Risk Level: {fix.risk_level}", file=self.out)
+            print(f"  Targets: {', '.join(fix.targets)}", file=self.out)
+            print(file=self.out)
 
         # Beta critiques each fix
-        print(f"\n[{self.beta.name}]")
-        print("Evaluating proposed solutions for system stability...\n")
+        print(f"\n[{self.beta.name}]", file=self.out)
+        print("Evaluating proposed solutions for system stability...\n", file=self.out)
 
         critiques = []
         for fix in proposed_fixes:
             critique = self.beta.critique_fix(fix, errors)
             critiques.append(critique)
 
-            print(f"Fix #{fix.fix_id} Analysis:")
-            print(f"  System Impact: {critique.system_impact}")
-            print(f"  App Impact: {critique.app_impact}")
-            print(f"  Recommendation: {critique.recommendation}")
-            print(f"  Benefits: {', '.join(critique.benefits[:2])}")
-            print(f"  Concerns: {', '.join(critique.concerns[:2])}")
-            print()
+            print(f"Fix #{fix.fix_id} Analysis:", file=self.out)
+            print(f"  System Impact: {critique.system_impact}", file=self.out)
+            print(f"  App Impact: {critique.app_impact}", file=self.out)
+            print(f"  Recommendation: {critique.recommendation}", file=self.out)
+            print(f"  Benefits: {', '.join(critique.benefits[:2])}", file=self.out)
+            print(f"  Concerns: {', '.join(critique.concerns[:2])}", file=self.out)
+            print(file=self.out)
+
+        self.critiques = critiques
 
         # Find consensus
         best_fix, best_critique = self._reach_consensus(proposed_fixes, critiques)
@@ -303,6 +182,16 @@ class DebateFacilitator:
 
         return best_fix, best_critique, self.debate_log
 
+    def print_consensus(self, best_fix: ProposedFix, best_critique: Critique):
+        """Print the consensus summary that closes the debate transcript."""
+        print(f"\n{'='*80}", file=self.out)
+        print("CONSENSUS REACHED", file=self.out)
+        print(f"{'='*80}\n", file=self.out)
+        print(f"Selected Fix: #{best_fix.fix_id} - {best_fix.title}", file=self.out)
+        print(f"Recommendation: {best_critique.recommendation}", file=self.out)
+        print(f"\nThis decision will be passed to Agent Gamma (The Coordinator) for execution planning.",
+              file=self.out)
+
     def _reach_consensus(self, fixes: List[ProposedFix], critiques: List[Critique]) -> Tuple[ProposedFix, Critique]:
         """Determine the best fix based on recommendations."""
         # Prioritize: APPROVE > MODIFY > REJECT
@@ -328,11 +217,11 @@ class DebateFacilitator:
             resolution="Continue"
         ))
 
-        print(f"\n{'='*80}")
-        print("DEBATE - Round 1")
-        print(f"{'='*80}")
-        print(f"[Alpha]: {alpha_statement}")
-        print(f"[Beta]: {beta_response}\n")
+        print(f"\n{'='*80}", file=self.out)
+        print("DEBATE - Round 1", file=self.out)
+        print(f"{'='*80}", file=self.out)
+        print(f"[Alpha]: {alpha_statement}", file=self.out)
+        print(f"[Beta]: {beta_response}\n", file=self.out)
 
     def _debate_round_2(self, fix: ProposedFix, critique: Critique):
         """Second round - reach consensus."""
@@ -346,11 +235,11 @@ class DebateFacilitator:
             resolution="Accept"
         ))
 
-        print(f"{'='*80}")
-        print("DEBATE - Round 2 (Consensus)")
-        print(f"{'='*80}")
-        print(f"[Alpha]: {alpha_statement}")
-        print(f"[Beta]: {beta_response}\n")
+        print(f"{'='*80}", file=self.out)
+        print("DEBATE - Round 2 (Consensus)", file=self.out)
+        print(f"{'='*80}", file=self.out)
+        print(f"[Alpha]: {alpha_statement}", file=self.out)
+        print(f"[Beta]: {beta_response}\n", file=self.out)
 
 
 def parse_phase1_output(text: str) -> List[ErrorPattern]:
@@ -411,22 +300,65 @@ def parse_phase1_output(text: str) -> List[ErrorPattern]:
     return errors
 
 
+def load_phase1_artifact(path: str) -> List[ErrorPattern]:
+    """Load error patterns from a Phase 1 JSON Lines artifact (parse_macos_logs.py --json)."""
+    return error_patterns_from_records(read_artifact(path, phase=1))
+
+
+def error_patterns_from_records(records: Iterable[Dict[str, Any]]) -> List[ErrorPattern]:
+    """Error patterns from Phase 1 artifact records, read from disk or built in memory."""
+    errors = []
+    for cause in records_of_type(records, "root_cause"):
+        errors.append(ErrorPattern(
+            process=cause["process"],
+            subsystem=cause.get("subsystem", "Unknown"),
+            category=cause["category"],
+            error_count=cause["error_count"],
+            messages=[item["template"] for item in cause.get("templates", [])],
+            severity="Fault" if cause.get("fault_count") else "Error"
+        ))
+    return errors
+
+
+def phase2_artifact_records(facilitator: DebateFacilitator, best_fix: ProposedFix,
+                            best_critique: Critique) -> List[Dict[str, Any]]:
+    """Phase 2 results as artifact records (see log_artifacts.py)."""
+    records: List[Dict[str, Any]] = []
+    records.extend({"type": "proposed_fix", **asdict(fix)} for fix in facilitator.proposed_fixes)
+    records.extend({"type": "critique", **asdict(critique)} for critique in facilitator.critiques)
+    records.extend({"type": "debate_round", **asdict(round_)} for round_ in facilitator.debate_log)
+    records.append({"type": "consensus", "fix": asdict(best_fix), "critique": asdict(best_critique)})
+    return records
+
+
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python agent_debate.py <phase1_output.txt>")
+    parser = argparse.ArgumentParser(description="Phase 2: agent debate over Phase 1 results")
+    parser.add_argument("phase1", nargs="?",
+                        help="Phase 1 text report or .jsonl artifact, or '-' for text on stdin")
+    parser.add_argument("--json", metavar="PATH",
+                        help="Also write a JSON Lines artifact for agent_coordinator.py")
+    args = parser.parse_args()
+
+    if args.phase1 is None:
+        print("Usage: python agent_debate.py <phase1_output.txt|phase1.jsonl> [--json phase2.jsonl]")
         print("Or pipe: python parse_macos_logs.py logs.txt | python agent_debate.py -")
         sys.exit(1)
 
-    # Read Phase 1 output
-    if sys.argv[1] == '-':
-        phase1_text = sys.stdin.read()
+    # Read Phase 1 output: structured artifact if given, else the text report
+    if args.phase1 != '-' and is_artifact(args.phase1):
+        try:
+            errors = load_phase1_artifact(args.phase1)
+        except ArtifactError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     else:
-        with open(sys.argv[1], 'r') as f:
-            phase1_text = f.read()
-
-    # Parse errors
-    errors = parse_phase1_output(phase1_text)
+        if args.phase1 == '-':
+            phase1_text = sys.stdin.read()
+        else:
+            with open(args.phase1, 'r') as f:
+                phase1_text = f.read()
+        errors = parse_phase1_output(phase1_text)
 
     if not errors:
         print("No errors found in Phase 1 output. Cannot proceed with debate.")
@@ -441,12 +373,10 @@ def main():
     best_fix, best_critique, debate_log = facilitator.conduct_debate(errors)
 
     # Output consensus
-    print(f"\n{'='*80}")
-    print("CONSENSUS REACHED")
-    print(f"{'='*80}\n")
-    print(f"Selected Fix: #{best_fix.fix_id} - {best_fix.title}")
-    print(f"Recommendation: {best_critique.recommendation}")
-    print(f"\nThis decision will be passed to Agent Gamma (The Coordinator) for execution planning.")
+    facilitator.print_consensus(best_fix, best_critique)
+
+    if args.json:
+        write_artifact(args.json, 2, phase2_artifact_records(facilitator, best_fix, best_critique))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the macOS log parser (Phase 1).
+
+Generates a deterministic synthetic unified-log fixture (synthetic_logs.py)
+and measures parse throughput (lines/sec) of:
+- legacy:  one LogEntry object per line (the original per-line path)
+- batch:   LogAnalyzer.add_log_lines (precompiled pattern, columnar arrays)
+
+With --workers N (requires --fixture), compares a single-process
+parse_file() against N sharded worker processes on the on-disk fixture.
+
+With --errors-only (requires --fixture), compares a full parse_file() of the
+fixture against the memory-mapped, byte-prefiltered errors-only scan.
+
+With --memory, measures retained memory (tracemalloc) of the legacy
+entries/errors/warnings lists against the compact LogColumns store and exits
+non-zero if the reduction is below MEMORY_REDUCTION_TARGET. This is the
+memory regression check for LogColumns; it defaults to a MEMORY_CHECK_LINES
+fixture so it finishes in seconds.
+
+With --timestamps, microbenchmarks decoding every timestamp to epoch
+microseconds with datetime.strptime against the prefix-caching
+TimestampDecoder, and checks that both agree.
+
+Usage:
+    python3 execution/benchmark_log_parsing.py                 # 5M-line fixture
+    python3 execution/benchmark_log_parsing.py --lines 200000
+    python3 execution/benchmark_log_parsing.py --fixture .tmp/bench_logs.txt
+    python3 execution/benchmark_log_parsing.py --fixture .tmp/bench_logs.txt --workers 8
+    python3 execution/benchmark_log_parsing.py --fixture .tmp/bench_logs.txt --errors-only
+    python3 execution/benchmark_log_parsing.py --memory                # exit 1 below 5x
+    python3 execution/benchmark_log_parsing.py --timestamps --lines 1000000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from log_timeline import TimestampDecoder
+from parse_macos_logs import LOG_LINE_PATTERN, LogAnalyzer, LogEntry, parse_file
+from synthetic_logs import generate_lines, write_fixture
+
+# Minimum retained-memory reduction of LogColumns vs. legacy LogEntry lists
+MEMORY_REDUCTION_TARGET = 5.0
+
+# Default fixture sizes: throughput runs vs. the --memory check
+DEFAULT_LINES = 5_000_000
+MEMORY_CHECK_LINES = 200_000
+
+
+def build_legacy(lines: List[str]) -> Tuple[list, list, list]:
+    """Baseline: build a LogEntry per line and keep three lists of objects."""
+    entries, errors, warnings = [], [], []
+    for line in lines:
+        entry = LogEntry(line)
+        if entry.message:
+            entries.append(entry)
+            if entry.is_error():
+                errors.append(entry)
+            elif entry.is_warning():
+                warnings.append(entry)
+    return entries, errors, warnings
+
+
+def parse_legacy(lines: List[str]) -> int:
+    """Baseline parse, returning the number of valid entries."""
+    return len(build_legacy(lines)[0])
+
+
+def parse_batch(lines: List[str]) -> int:
+    """Batch path: precompiled pattern filling columnar arrays."""
+    analyzer = LogAnalyzer()
+    return analyzer.add_log_lines(lines)
+
+
+def run(name: str, func: Callable[[], int], line_count: int) -> float:
+    """Time one parser run (func returns entries parsed) and print lines/sec."""
+    start = time.perf_counter()
+    parsed = func()
+    elapsed = time.perf_counter() - start
+    rate = line_count / elapsed if elapsed else float('inf')
+    print(f"  {name:8} {parsed:>10,} entries in {elapsed:7.2f}s  →  {rate:>12,.0f} lines/sec")
+    return rate
+
+
+def retained_bytes(build: Callable[[], object]) -> int:
+    """Bytes still allocated after build() returns, as seen by tracemalloc."""
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+def run_memory(lines: List[str]) -> bool:
+    """Compare retained memory of legacy lists vs. LogColumns; True if on target."""
+    def build_compact():
+        analyzer = LogAnalyzer()
+        analyzer.add_log_lines(lines)
+        return analyzer
+
+    legacy = retained_bytes(lambda: build_legacy(lines))
+    compact = retained_bytes(build_compact)
+    ratio = legacy / compact if compact else float('inf')
+
+    print(f"\n{'='*80}")
+    print("RETAINED MEMORY (tracemalloc)")
+    print(f"{'='*80}")
+    print(f"  legacy   {legacy / 1e6:10.1f} MB  ({legacy / len(lines):6.1f} bytes/line)")
+    print(f"  compact  {compact / 1e6:10.1f} MB  ({compact / len(lines):6.1f} bytes/line)")
+    print(f"\nReduction: {ratio:.2f}x (target: {MEMORY_REDUCTION_TARGET:.0f}x)")
+    return ratio >= MEMORY_REDUCTION_TARGET
+
+
+def decode_strptime(timestamps: List[str]) -> List[int]:
+    """Baseline: full datetime.strptime per timestamp."""
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    micro = timedelta(microseconds=1)
+    return [(datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S.%f%z') - epoch) // micro
+            for timestamp in timestamps]
+
+
+def decode_cached(timestamps: List[str]) -> List[int]:
+    """TimestampDecoder: cached minute prefix, only seconds and fraction parsed."""
+    decode = TimestampDecoder()
+    return [decode(timestamp) for timestamp in timestamps]
+
+
+def run_timestamps(lines: List[str]) -> bool:
+    """Time both timestamp decoders on the fixture's timestamps; True if they agree."""
+    timestamps = [m.group(1) for m in map(LOG_LINE_PATTERN.match, lines) if m]
+
+    print(f"\n{'='*80}")
+    print(f"TIMESTAMP DECODING ({len(timestamps):,} timestamps)")
+    print(f"{'='*80}")
+    results = {}
+    rates = {}
+    for name, decode in (("strptime", decode_strptime), ("cached", decode_cached)):
+        start = time.perf_counter()
+        results[name] = decode(timestamps)
+        elapsed = time.perf_counter() - start
+        rates[name] = len(timestamps) / elapsed if elapsed else float('inf')
+        print(f"  {name:8} {elapsed:7.2f}s  →  {rates[name]:>12,.0f} timestamps/sec")
+    print(f"\nSpeedup: {rates['cached'] / rates['strptime']:.2f}x")
+    return results["strptime"] == results["cached"]
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark macOS log parsing throughput")
+    parser.add_argument("--lines", type=int,
+                        help=f"Synthetic fixture size (default: 5M; {MEMORY_CHECK_LINES:,} with --memory)")
+    parser.add_argument("--fixture", type=Path, help="Write the fixture here and read it back from disk")
+    parser.add_argument("--memory", action="store_true", help="Measure retained memory instead of throughput")
+    parser.add_argument("--timestamps", action="store_true",
+                        help="Compare timestamp decoding with datetime.strptime instead of parsing")
+    parser.add_argument("--workers", type=int, default=1, help="Compare sharded parsing with N workers (needs --fixture)")
+    parser.add_argument("--errors-only", action="store_true",
+                        help="Compare full parsing with the prefiltered errors-only scan (needs --fixture)")
+    args = parser.parse_args()
+    if args.lines is None:
+        args.lines = MEMORY_CHECK_LINES if args.memory else DEFAULT_LINES
+
+    if args.workers > 1 or args.errors_only:
+        if not args.fixture:
+            parser.error("--workers and --errors-only require --fixture")
+        if not args.fixture.exists():
+            print(f"Writing {args.lines:,}-line fixture to {args.fixture}...")
+            write_fixture(args.fixture, args.lines)
+        with open(args.fixture, 'rb') as f:
+            line_count = sum(1 for _ in f)
+        path = str(args.fixture)
+        print(f"\n{'='*80}")
+        print(f"FILE PARSING ({line_count:,} lines)")
+        print(f"{'='*80}")
+        before = run("full", lambda: len(parse_file(path).columns), line_count)
+        after = run("sharded" if args.workers > 1 else "errors",
+                    lambda: len(parse_file(path, workers=args.workers, errors_only=args.errors_only).columns),
+                    line_count)
+        print(f"\nSpeedup: {after / before:.2f}x")
+        return
+
+    if args.fixture:
+        if not args.fixture.exists():
+            print(f"Writing {args.lines:,}-line fixture to {args.fixture}...")
+            write_fixture(args.fixture, args.lines)
+        with open(args.fixture, 'r') as f:
+            lines = f.readlines()
+    else:
+        print(f"Generating {args.lines:,} synthetic log lines...")
+        lines = list(generate_lines(args.lines))
+
+    if args.memory:
+        if not run_memory(lines):
+            print("✗ Memory reduction below target")
+            sys.exit(1)
+        print("✓ Memory reduction on target")
+        return
+
+    if args.timestamps:
+        if not run_timestamps(lines):
+            print("✗ Decoded timestamps differ from datetime.strptime")
+            sys.exit(1)
+        return
+
+    print(f"\n{'='*80}")
+    print("LOG PARSING THROUGHPUT")
+    print(f"{'='*80}")
+    before = run("legacy", lambda: parse_legacy(lines), len(lines))
+    after = run("batch", lambda: parse_batch(lines), len(lines))
+    print(f"\nSpeedup: {after / before:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
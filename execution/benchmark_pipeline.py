@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the whole resolution pipeline at several log sizes.
+
+For each size a synthetic log (synthetic_logs.py) is written once and cached,
+then measured in a fresh process so peak RSS belongs to that size alone:
+- log_entry: LogEntry per line, the per-line object path (lines/sec)
+- parse:     parse_file into a LogAnalyzer (lines/sec)
+- report:    Phase 1 artifact records and full text report (latency)
+- debate:    Phase 2 Alpha/Beta debate (latency)
+- plan:      Phase 3 master plan, uncached (latency)
+- peak RSS of the process
+
+Results can be saved as a baseline and later runs compared against it; the
+run fails (exit 1) if any metric regressed by more than the threshold.
+
+Usage:
+    python3 execution/benchmark_pipeline.py                          # 10k, 1M, 10M lines
+    python3 execution/benchmark_pipeline.py --sizes 10k,1M --save-baseline
+    python3 execution/benchmark_pipeline.py --sizes 10k,1M --threshold 0.2
+"""
+
+import argparse
+import io
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Sibling modules in execution/
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agent_coordinator import AgentGamma
+from agent_debate import AgentAlpha, AgentBeta, DebateFacilitator, error_patterns_from_records, \
+    phase2_artifact_records
+from parse_macos_logs import LogEntry, parse_file
+from synthetic_logs import SyntheticLogConfig, write_fixture
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_FIXTURE_DIR = PROJECT_ROOT / ".tmp" / "bench"
+DEFAULT_BASELINE = PROJECT_ROOT / ".tmp" / "benchmark_baseline.json"
+
+DEFAULT_SIZES = "10k,1M,10M"
+
+# Allowed relative regression per metric before the run fails
+DEFAULT_THRESHOLD = 0.25
+
+# Latency changes below this many seconds are timer noise, not regressions
+MIN_LATENCY_DELTA = 0.05
+
+THROUGHPUT_PHASES = ("log_entry", "parse")
+LATENCY_PHASES = ("report", "debate", "plan")
+
+# Many processes and a few bursts, so templates, bursts and causality all have work to do
+BENCH_CONFIG = SyntheticLogConfig(processes=50, bursts=3)
+
+
+def parse_size(text: str) -> int:
+    """Line count from '10k', '1M', '250000', ..."""
+    text = text.strip()
+    multiplier = {'k': 1_000, 'm': 1_000_000}.get(text[-1:].lower(), 1)
+    number = text[:-1] if multiplier > 1 else text
+    try:
+        return int(float(number) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid size {text!r}; expected e.g. 10k, 1M or 250000")
+
+
+def size_label(lines: int) -> str:
+    """Short label for a line count (10k, 1M, ...)."""
+    if lines % 1_000_000 == 0:
+        return f"{lines // 1_000_000}M"
+    if lines % 1_000 == 0:
+        return f"{lines // 1_000}k"
+    return str(lines)
+
+
+def fixture_path(fixture_dir: Path, lines: int, config: SyntheticLogConfig) -> Path:
+    """Cached fixture file for a size and configuration."""
+    return fixture_dir / f"synthetic_{size_label(lines)}_p{config.processes}_b{config.bursts}_s{config.seed}.txt"
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes on Linux
+    return peak / 1e6 if sys.platform == 'darwin' else peak / 1e3
+
+
+def measure(path: str, lines: int) -> Dict[str, Any]:
+    """
+    Worker entry point: run every phase on one fixture.
+
+    Returns:
+        {"lines", "seconds": {phase: s}, "lines_per_sec": {phase: rate}, "peak_rss_mb"}
+    """
+    seconds: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            LogEntry(line)
+    seconds["log_entry"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analyzer = parse_file(path)
+    seconds["parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    phase1_records = list(analyzer.artifact_records())
+    analyzer.write_full_report(io.StringIO())
+    seconds["report"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    facilitator = DebateFacilitator(AgentAlpha(), AgentBeta(), out=io.StringIO())
+    best_fix, best_critique, _ = facilitator.conduct_debate(error_patterns_from_records(phase1_records))
+    facilitator.print_consensus(best_fix, best_critique)
+    seconds["debate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gamma = AgentGamma()
+    gamma.build_master_plan(
+        gamma.root_cause_from_records(phase1_records),
+        gamma.decision_from_records(phase2_artifact_records(facilitator, best_fix, best_critique)),
+    )
+    seconds["plan"] = time.perf_counter() - start
+
+    return {
+        "lines": lines,
+        "seconds": seconds,
+        "lines_per_sec": {phase: lines / seconds[phase] if seconds[phase] else 0.0
+                          for phase in THROUGHPUT_PHASES},
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_size(path: Path, lines: int) -> Dict[str, Any]:
+    """Measure one fixture in a freshly spawned process (clean peak RSS)."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(measure, str(path), lines).result()
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float) -> List[Tuple[str, str, float, float]]:
+    """
+    Metrics that regressed beyond threshold relative to baseline.
+
+    Returns:
+        (size, metric, baseline value, current value) per regression
+    """
+    regressions = []
+    for size, current in results.items():
+        base = baseline.get(size)
+        if base is None:
+            continue
+        for phase in THROUGHPUT_PHASES:
+            if current["lines_per_sec"][phase] < base["lines_per_sec"][phase] * (1 - threshold):
+                regressions.append((size, f"{phase} lines/sec", base["lines_per_sec"][phase],
+                                    current["lines_per_sec"][phase]))
+        for phase in LATENCY_PHASES:
+            before, after = base["seconds"][phase], current["seconds"][phase]
+            if after > before * (1 + threshold) and after - before > MIN_LATENCY_DELTA:
+                regressions.append((size, f"{phase} seconds", before, after))
+        if current["peak_rss_mb"] > base["peak_rss_mb"] * (1 + threshold):
+            regressions.append((size, "peak RSS MB", base["peak_rss_mb"], current["peak_rss_mb"]))
+    return regressions
+
+
+def print_results(results: Dict[str, Any]):
+    """Per-size table of throughput, phase latency and peak RSS."""
+    print(f"\n{'='*80}")
+    print("PIPELINE BENCHMARK")
+    print(f"{'='*80}")
+    print(f"{'size':>6} {'LogEntry/s':>12} {'parse/s':>12} {'report':>10} {'debate':>10} {'plan':>10} {'RSS MB':>9}")
+    for size, result in results.items():
+        rates, seconds = result["lines_per_sec"], result["seconds"]
+        print(f"{size:>6} {rates['log_entry']:>12,.0f} {rates['parse']:>12,.0f} "
+              f"{seconds['report']:>9.3f}s {seconds['debate']:>9.3f}s {seconds['plan']:>9.3f}s "
+              f"{result['peak_rss_mb']:>9.1f}")
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    """Saved baseline results, or None if there is none yet."""
+    if not path.exists():
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the log resolution pipeline at several log sizes")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Comma-separated line counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--processes", type=int, default=BENCH_CONFIG.processes,
+                        help=f"Distinct processes in the synthetic logs (default: {BENCH_CONFIG.processes})")
+    parser.add_argument("--bursts", type=int, default=BENCH_CONFIG.bursts,
+                        help=f"Error bursts in the synthetic logs (default: {BENCH_CONFIG.bursts})")
+    parser.add_argument("--fixture-dir", type=Path, default=DEFAULT_FIXTURE_DIR,
+                        help="Where generated fixtures are cached (default: .tmp/bench)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Baseline results file (default: .tmp/benchmark_baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed relative regression per metric (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+    if args.threshold < 0:
+        parser.error("--threshold must not be negative")
+
+    try:
+        sizes = [parse_size(size) for size in args.sizes.split(',')]
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    config = SyntheticLogConfig(processes=args.processes, bursts=args.bursts)
+
+    results: Dict[str, Any] = {}
+    for lines in sizes:
+        path = fixture_path(args.fixture_dir, lines, config)
+        if not path.exists():
+            print(f"Writing {lines:,}-line fixture to {path}...")
+            write_fixture(path, lines, config)
+        print(f"Measuring {size_label(lines)}...")
+        results[size_label(lines)] = run_size(path, lines)
+
+    print_results(results)
+    fingerprint = {"processes": config.processes, "bursts": config.bursts, "seed": config.seed}
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump({"config": fingerprint, "results": results}, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    if baseline.get("config") != fingerprint:
+        print(f"\n✗ Baseline was recorded with {baseline.get('config')}, not {fingerprint}")
+        sys.exit(1)
+
+    regressions = compare(results, baseline["results"], args.threshold)
+    compared = [size for size in results if size in baseline["results"]]
+    if not regressions:
+        print(f"\n✓ No regressions beyond {args.threshold:.0%} vs baseline ({', '.join(compared) or 'no common sizes'})")
+        return
+    print(f"\n✗ Regressions beyond {args.threshold:.0%} vs baseline:")
+    for size, metric, before, after in regressions:
+        print(f"  {size:>6} {metric:<20} {before:>14,.2f} → {after:>14,.2f}")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
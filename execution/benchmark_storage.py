@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Multi-process stress benchmark for the MCP JSON storage (mcp_tools/storage.py).
+
+Seeds a todos.json with synthetic items, then runs N reader processes (and
+optionally writer processes) against it at the same time for a fixed
+duration. Readers take shared locks, so total read throughput should grow
+with the number of readers up to the number of CPU cores; writers take
+exclusive locks and their lock-wait time is reported from LockStats.
+
+With --check, the stress rounds double as the locking regression check and
+exit non-zero if any lock attempt timed out, if readers without writers ever
+found the lock held (reads must take shared locks), or if read throughput
+scales by less than READ_SCALING_FLOOR per reader, counting at most one
+reader per CPU core.
+
+With --repeat N, instead times N repeated reads of the unchanged file in one
+process: read() parses every time, read_view() is served from the
+validated DocumentCache after the first miss.
+
+With --mutations N, times N add_todo, update_todo and update(fn) calls
+against the seeded list: the json backend rewrites the whole file per mutation, the
+journal backend appends one line (--backend, --fsync).
+
+With --sizes, compares backends (--backends) at several list sizes, each in
+a fresh process: seeding, add/update/get by id, filtered listings and a full
+listing. The sqlite backend answers filters from its indexes instead of
+loading every item.
+
+Usage:
+    python3 execution/benchmark_storage.py                         # 1, 2, 4, 8 readers
+    python3 execution/benchmark_storage.py --readers 1,4 --writers 1 --todos 5000
+    python3 execution/benchmark_storage.py --check                 # exit 1 if reads stop scaling
+    python3 execution/benchmark_storage.py --repeat 100 --todos 30000        # ~10 MB file
+    python3 execution/benchmark_storage.py --mutations 200 --todos 100000 --backend journal
+    python3 execution/benchmark_storage.py --sizes 1k,100k,1M --backends json,journal,sqlite
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Sibling modules in execution/
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmark_pipeline import parse_size, peak_rss_mb, size_label
+from mcp_tools.storage import (FSYNC_POLICIES, TODO_BACKENDS, DocumentCache, TodoStorage,
+                               open_todo_storage)
+
+DEFAULT_READERS = "1,2,4,8"
+
+DEFAULT_BACKENDS = ",".join(TODO_BACKENDS)
+
+# Each timed loop in the backend comparison stops after --ops operations or
+# this many seconds, whichever comes first (whole-file JSON at 1M is slow)
+MAX_LOOP_SECONDS = 10.0
+
+COMPARE_COLUMNS = ("seed", "add", "update", "get", "status", "tag", "all")
+
+# Workers start together this many seconds after being submitted
+START_DELAY = 0.5
+
+# --check: minimum read scaling per concurrent reader (up to one per CPU core)
+READ_SCALING_FLOOR = 0.5
+
+
+def synthetic_todo(k: int, now: str) -> Dict[str, Any]:
+    """One synthetic TODO item."""
+    return {
+        "id": f"todo_bench_{k:08d}",
+        "title": f"Benchmark item {k}",
+        "description": "Synthetic TODO for the storage benchmark",
+        "priority": ("low", "medium", "high")[k % 3],
+        "tags": [f"tag{k % 10}"],
+        "status": "pending",
+        "created_at": now,
+        "updated_at": now,
+        "due_date": None,
+        "completed_at": None,
+    }
+
+
+def seed_todos(path: Path, count: int, backend: str = "json"):
+    """Write a todos.json (or todos.sqlite3) holding count synthetic items."""
+    now = datetime.now().isoformat()
+    storage = open_todo_storage(path, backend)
+    if backend == "sqlite":
+        # Streamed in one transaction, so 1M items are never all in memory
+        storage.import_todos(synthetic_todo(k, now) for k in range(count))
+        return
+    storage.write({"version": "1.0", "todos": [synthetic_todo(k, now) for k in range(count)]})
+
+
+def reader(path: str, backend: str, start_at: float, seconds: float) -> Dict[str, Any]:
+    """Worker: read the whole list until the deadline."""
+    storage = open_todo_storage(Path(path), backend)
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = start_at + seconds
+    reads = 0
+    while time.time() < deadline:
+        storage.get_all_todos()
+        reads += 1
+    return {"ops": reads, "locks": storage.lock_stats.snapshot()}
+
+
+def writer(path: str, backend: str, start_at: float, seconds: float) -> Dict[str, Any]:
+    """Worker: update the first item until the deadline."""
+    storage = open_todo_storage(Path(path), backend)
+    time.sleep(max(0.0, start_at - time.time()))
+    deadline = start_at + seconds
+    writes = 0
+    while time.time() < deadline:
+        storage.update_todo("todo_bench_00000000", {"description": f"write {writes}"})
+        writes += 1
+    return {"ops": writes, "locks": storage.lock_stats.snapshot()}
+
+
+def run_round(path: Path, backend: str, readers: int, writers: int, seconds: float) -> Dict[str, Any]:
+    """Run readers and writers concurrently; aggregate their throughput and lock waits."""
+    start_at = time.time() + START_DELAY
+    with ProcessPoolExecutor(max_workers=readers + writers) as executor:
+        read_jobs = [executor.submit(reader, str(path), backend, start_at, seconds) for _ in range(readers)]
+        write_jobs = [executor.submit(writer, str(path), backend, start_at, seconds) for _ in range(writers)]
+        reads = [job.result() for job in read_jobs]
+        writes = [job.result() for job in write_jobs]
+
+    def total(results: List[Dict[str, Any]], key: str) -> float:
+        return sum(result["locks"][key] for result in results)
+
+    return {
+        "reads_per_sec": sum(result["ops"] for result in reads) / seconds,
+        "writes_per_sec": sum(result["ops"] for result in writes) / seconds,
+        "read_wait_max": max((result["locks"]["wait_seconds_max"] for result in reads), default=0.0),
+        "read_contended": total(reads, "contended"),
+        "write_wait_total": total(writes, "wait_seconds_total"),
+        "write_wait_max": max((result["locks"]["wait_seconds_max"] for result in writes), default=0.0),
+        "timeouts": total(reads, "timeouts") + total(writes, "timeouts"),
+    }
+
+
+def check_round(readers: int, writers: int, scaling: float, result: Dict[str, Any]) -> List[str]:
+    """Locking regressions in one stress round (see --check); empty if none."""
+    problems = []
+    if result["timeouts"]:
+        problems.append(f"{readers} readers: {result['timeouts']:.0f} lock attempts timed out")
+    if not writers and result["read_contended"]:
+        problems.append(f"{readers} readers: readers waited for each other {result['read_contended']:.0f} "
+                        f"times (reads should take shared locks)")
+    expected = READ_SCALING_FLOOR * min(readers, os.cpu_count() or 1)
+    if readers > 1 and scaling < expected:
+        problems.append(f"{readers} readers: read throughput scaled {scaling:.2f}x, expected at least "
+                        f"{expected:.2f}x")
+    return problems
+
+
+def run_repeated_reads(path: Path, repeat: int):
+    """Time repeated full reads of an unchanged file, uncached vs. cached."""
+    storage = TodoStorage(path, cache=DocumentCache())
+    print(f"\n{'='*80}")
+    print(f"REPEATED READS ({repeat} reads of {path.stat().st_size / 1e6:.1f} MB)")
+    print(f"{'='*80}")
+
+    def per_read(read) -> float:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            read()
+        return (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    storage.read_view()
+    first = time.perf_counter() - start
+    uncached, cached = per_read(storage.read), per_read(storage.read_view)
+    print(f"  read()              {uncached * 1000:10.3f} ms/read")
+    print(f"  read_view(), miss   {first * 1000:10.3f} ms")
+    print(f"  read_view(), hit    {cached * 1000:10.3f} ms/read")
+    stats = storage.cache.stats()
+    print(f"\nSpeedup: {uncached / cached:,.0f}x (cache: {stats['hits']} hits, {stats['misses']} misses)")
+
+
+def run_mutations(path: Path, backend: str, mutations: int, fsync: str):
+    """Time add_todo and update_todo calls against the seeded list."""
+    options = {"fsync": fsync} if backend == "journal" else {}
+    storage = open_todo_storage(path, backend, **options)
+    storage.get_all_todos()  # load outside the timed loops
+    now = datetime.now().isoformat()
+    print(f"\n{'='*80}")
+    print(f"MUTATIONS ({backend} backend, {len(storage.get_all_todos()):,} todos"
+          f"{f', fsync={fsync}' if backend == 'journal' else ''})")
+    print(f"{'='*80}")
+
+    start = time.perf_counter()
+    for k in range(mutations):
+        storage.add_todo(synthetic_todo(10_000_000 + k, now))
+    added = (time.perf_counter() - start) / mutations
+    start = time.perf_counter()
+    for k in range(mutations):
+        storage.update_todo(f"todo_bench_{10_000_000 + k:08d}", {"status": "in_progress"})
+    updated = (time.perf_counter() - start) / mutations
+    start = time.perf_counter()
+    for k in range(mutations):
+        storage.update(f"todo_bench_{10_000_000 + k:08d}",
+                       lambda todo: {"status": "completed", "completed_at": todo["updated_at"]})
+    read_modify_write = (time.perf_counter() - start) / mutations
+    print(f"  add_todo     {added * 1000:10.3f} ms/op")
+    print(f"  update_todo  {updated * 1000:10.3f} ms/op")
+    print(f"  update(fn)   {read_modify_write * 1000:10.3f} ms/op")
+
+
+def timed_loop(operation: Callable[[int], Any], ops: int) -> float:
+    """Seconds per call of operation(k) for k = 0..ops-1, stopping early after MAX_LOOP_SECONDS."""
+    start = time.perf_counter()
+    done = 0
+    while done < ops:
+        operation(done)
+        done += 1
+        if time.perf_counter() - start > MAX_LOOP_SECONDS:
+            break
+    return (time.perf_counter() - start) / done
+
+
+def measure_backend(path: str, backend: str, todos: int, ops: int) -> Dict[str, Any]:
+    """
+    Worker entry point: seed one backend and time its operations.
+
+    Returns:
+        {"seconds": {column: s}, "matches": {"status", "tag"}, "peak_rss_mb"}
+    """
+    seconds: Dict[str, float] = {}
+    start = time.perf_counter()
+    seed_todos(Path(path), todos, backend)
+    seconds["seed"] = time.perf_counter() - start
+
+    storage = open_todo_storage(Path(path), backend, **({"cache": DocumentCache()}
+                                                        if backend != "sqlite" else {}))
+    storage.get_all_todos()  # load outside the timed loops
+    now = datetime.now().isoformat()
+    step = max(1, todos // ops)
+    seconds["add"] = timed_loop(lambda k: storage.add_todo(synthetic_todo(10_000_000 + k, now)), ops)
+    seconds["update"] = timed_loop(
+        lambda k: storage.update_todo(f"todo_bench_{k * step:08d}", {"status": "in_progress"}), ops)
+    # Reads are cheap for the cached json/journal views, so each read pass counts separately
+    seconds["get"] = timed_loop(lambda k: storage.get_todo_by_id(f"todo_bench_{(k * 7919) % todos:08d}"),
+                                ops)
+    seconds["status"] = timed_loop(lambda k: storage.query_todos(status="in_progress"), ops)
+    seconds["tag"] = timed_loop(lambda k: storage.query_todos(tags=["tag3"], priority="high"), ops)
+    seconds["all"] = timed_loop(lambda k: storage.get_all_todos(), min(ops, 3))
+    return {
+        "seconds": seconds,
+        "matches": {"status": len(storage.query_todos(status="in_progress")),
+                    "tag": len(storage.query_todos(tags=["tag3"], priority="high"))},
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_comparison(sizes: List[int], backends: List[str], ops: int):
+    """Compare backends at each size, one fresh process per (size, backend)."""
+    print(f"\n{'='*80}")
+    print(f"BACKEND COMPARISON (up to {ops} ops per operation, ms/op; seed in s)")
+    print(f"{'='*80}")
+    print(f"{'size':>5} {'backend':>8} {'seed s':>8} {'add':>9} {'update':>9} {'get':>8} "
+          f"{'status=':>8} {'tag+prio':>9} {'all':>9} {'RSS MB':>7}")
+    for todos in sizes:
+        for backend in backends:
+            with tempfile.TemporaryDirectory() as tmp, ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+                result = executor.submit(measure_backend, str(Path(tmp) / "todos.json"), backend,
+                                         todos, ops).result()
+            ms = {column: result["seconds"][column] * 1000 for column in COMPARE_COLUMNS}
+            print(f"{size_label(todos):>5} {backend:>8} {result['seconds']['seed']:>8.2f} "
+                  f"{ms['add']:>9.2f} {ms['update']:>9.2f} {ms['get']:>8.3f} {ms['status']:>8.2f} "
+                  f"{ms['tag']:>9.2f} {ms['all']:>9.1f} {result['peak_rss_mb']:>7.0f}")
+    print("\nstatus= lists the updated items (status=in_progress); tag+prio lists tag3 items of "
+          "high priority;\nall copies the cached view for json/journal and reads fresh rows for sqlite")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Stress the MCP JSON storage with concurrent processes")
+    parser.add_argument("--readers", default=DEFAULT_READERS,
+                        help=f"Comma-separated reader process counts (default: {DEFAULT_READERS})")
+    parser.add_argument("--writers", type=int, default=0, help="Concurrent writer processes (default: 0)")
+    parser.add_argument("--todos", type=int, default=1000, help="Items in the seeded list (default: 1000)")
+    parser.add_argument("--seconds", type=float, default=2.0, help="Duration of each round (default: 2)")
+    parser.add_argument("--backend", choices=TODO_BACKENDS, default="json",
+                        help="TODO storage backend (default: json)")
+    parser.add_argument("--fsync", choices=FSYNC_POLICIES, default="interval",
+                        help="Journal fsync policy for --backend journal (default: interval)")
+    parser.add_argument("--mutations", type=int, default=0,
+                        help="Time this many adds and updates in one process instead of the stress rounds")
+    parser.add_argument("--repeat", type=int, default=0,
+                        help="Time this many repeated reads in one process instead of the stress rounds")
+    parser.add_argument("--sizes",
+                        help="Compare backends at these comma-separated list sizes (e.g. 1k,100k,1M)")
+    parser.add_argument("--backends", default=DEFAULT_BACKENDS,
+                        help=f"Backends for --sizes (default: {DEFAULT_BACKENDS})")
+    parser.add_argument("--ops", type=int, default=100,
+                        help="Operations per timed loop for --sizes (default: 100)")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit non-zero if the stress rounds show a locking regression "
+                             "(timeouts, readers blocking readers, reads not scaling)")
+    args = parser.parse_args()
+
+    if args.sizes:
+        backends = args.backends.split(',')
+        unknown = [backend for backend in backends if backend not in TODO_BACKENDS]
+        if unknown or args.ops < 1:
+            parser.error(f"--backends must be among {DEFAULT_BACKENDS} and --ops positive")
+        try:
+            sizes = [parse_size(size) for size in args.sizes.split(',')]
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        run_comparison(sizes, backends, args.ops)
+        return
+
+    try:
+        reader_counts = [int(count) for count in args.readers.split(',')]
+    except ValueError:
+        parser.error(f"Invalid --readers {args.readers!r}; expected e.g. 1,2,4,8")
+    if any(count < 1 for count in reader_counts) or args.writers < 0 or args.seconds <= 0:
+        parser.error("--readers must be positive, --writers non-negative and --seconds positive")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "todos.json"
+        seed_todos(path, args.todos, args.backend)
+
+        if args.mutations > 0:
+            run_mutations(path, args.backend, args.mutations, args.fsync)
+            return
+        if args.repeat > 0:
+            run_repeated_reads(path, args.repeat)
+            return
+
+        print(f"\n{'='*80}")
+        print(f"STORAGE STRESS ({args.backend} backend, {args.todos:,} todos, {args.writers} writer(s), "
+              f"{os.cpu_count()} CPUs)")
+        print(f"{'='*80}")
+        print(f"{'readers':>8} {'reads/s':>12} {'scaling':>8} {'max read wait':>14} "
+              f"{'writes/s':>10} {'max write wait':>15} {'timeouts':>9}")
+        single = None
+        problems = []
+        for count in reader_counts:
+            result = run_round(path, args.backend, count, args.writers, args.seconds)
+            single = single or result["reads_per_sec"]
+            scaling = result["reads_per_sec"] / single if single else 0.0
+            print(f"{count:>8} {result['reads_per_sec']:>12,.0f} {scaling:>7.2f}x "
+                  f"{result['read_wait_max'] * 1000:>12.1f}ms {result['writes_per_sec']:>10,.0f} "
+                  f"{result['write_wait_max'] * 1000:>13.1f}ms {result['timeouts']:>9.0f}")
+            problems.extend(check_round(count, args.writers, scaling, result))
+
+    if args.check:
+        if problems:
+            for problem in problems:
+                print(f"✗ {problem}")
+            sys.exit(1)
+        print("✓ No locking regressions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Fix rule catalog for the Phase 2 debate.
+
+Each FixRule says which error patterns it applies to (message keywords,
+process names, categories), the fix Agent Alpha proposes for them, and
+Agent Beta's assessment of that fix. Rules are plain data: add a FixRule to
+FIX_RULES to teach both agents a new fix. Earlier rules take priority.
+
+RuleIndex compiles the keywords of all rules into one combined regex, so each
+message is scanned once no matter how many rules there are:
+
+    index = RuleIndex()
+    for rule, matched in index.match(error_patterns):
+        print(rule.title, len(matched))
+"""
+
+import hashlib
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class FixRule:
+    """A fix, the error patterns it addresses, and its critique."""
+    name: str
+    # Proposal (Agent Alpha)
+    title: str
+    description: str
+    commands: Tuple[str, ...]
+    targets: Tuple[str, ...]
+    risk_level: str  # Low, Medium, High
+    estimated_impact: str
+    # Critique (Agent Beta)
+    concerns: Tuple[str, ...]
+    benefits: Tuple[str, ...]
+    system_impact: str
+    app_impact: str
+    recommendation: str  # APPROVE / MODIFY / REJECT - reason
+    # Matching: a pattern matches if any message contains a keyword
+    # (case-insensitive), its process is one of processes, or its process name
+    # contains one of process_keywords; categories (None = any) restricts all three
+    keywords: Tuple[str, ...] = ()
+    processes: Tuple[str, ...] = ()
+    process_keywords: Tuple[str, ...] = ()
+    categories: Optional[Tuple[str, ...]] = None
+
+
+FIX_RULES: Tuple[FixRule, ...] = (
+    FixRule(
+        name="kernel",
+        processes=("kernel",),
+        categories=("System",),
+        title="Reset NVRAM and SMC",
+        description="Kernel ACPI and hardware enumeration errors suggest corrupted NVRAM or SMC state. Reset both to restore default hardware configuration.",
+        commands=(
+            "sudo nvram -c",
+            "# Then restart Mac and hold: Option + Command + P + R (NVRAM reset)",
+            "# For SMC: Shut down, press Shift + Control + Option + Power for 10s",
+        ),
+        targets=("kernel", "ACPI", "IOKit drivers"),
+        risk_level="Medium",
+        estimated_impact="May reset system preferences, but resolves hardware initialization issues",
+        concerns=(
+            "Requires physical restart and manual key combinations",
+            "Resets system preferences (time zone, startup disk, etc.)",
+            "May not address software-level issues",
+        ),
+        benefits=(
+            "Resolves deep hardware initialization problems",
+            "No data loss or software reinstallation required",
+            "Eliminates ACPI and power management errors",
+        ),
+        system_impact="HIGH - Resets firmware-level configuration, requires manual intervention",
+        app_impact="LOW - Apps unaffected, but system preferences reset",
+        recommendation="MODIFY - Only use if software fixes fail, document preference backup first",
+    ),
+    FixRule(
+        name="framework",
+        keywords=("framework", "library"),
+        title="Repair System Frameworks and Permissions",
+        description="Missing framework errors indicate corrupted system files or permission issues. Rebuild framework cache and repair permissions.",
+        commands=(
+            "sudo update_dyld_shared_cache -force",
+            "sudo /System/Library/Frameworks/CoreServices.framework/Frameworks/LaunchServices.framework/Support/lsregister -kill -r -domain local -domain system -domain user",
+            "sudo diskutil repairPermissions /",
+        ),
+        targets=("SpringBoard", "LaunchServices", "System Frameworks"),
+        risk_level="Low",
+        estimated_impact="Safe operation, rebuilds framework cache without data loss",
+        concerns=(
+            "Rebuilding cache may take 5-10 minutes",
+            "Requires sudo privileges",
+        ),
+        benefits=(
+            "Safe, non-destructive operation",
+            "Fixes framework loading and permission issues",
+            "Standard macOS maintenance procedure",
+        ),
+        system_impact="LOW - Standard system maintenance, no configuration changes",
+        app_impact="LOW - May require app relaunches, but no data loss",
+        recommendation="APPROVE - Safe first-line fix for framework issues",
+    ),
+    FixRule(
+        name="resource",
+        keywords=("memory", "out of", "allocation"),
+        title="Clear Caches and Free Memory",
+        description="Memory allocation failures suggest insufficient resources. Clear system caches, restart memory-hungry processes.",
+        commands=(
+            "sudo purge",
+            "sudo rm -rf /Library/Caches/*",
+            "sudo rm -rf ~/Library/Caches/*",
+            "killall -9 Safari  # Restart affected apps",
+        ),
+        targets=("Safari", "WebKit", "System Memory"),
+        risk_level="Low",
+        estimated_impact="Temporary performance impact during cache rebuild, but resolves memory pressure",
+        concerns=(
+            "Killing Safari loses unsaved work",
+            "Cache clearing may temporarily slow performance",
+            "Doesn't address root cause of memory leaks",
+        ),
+        benefits=(
+            "Immediate relief from memory pressure",
+            "Quick to execute",
+            "No system-level changes",
+        ),
+        system_impact="MINIMAL - Temporary performance impact during cache rebuild",
+        app_impact="MEDIUM - Active applications may need restart, potential data loss",
+        recommendation="MODIFY - Warn user to save work first, investigate memory leak source",
+    ),
+    FixRule(
+        name="service",
+        keywords=("service",),
+        process_keywords=("launchd",),
+        categories=("System",),
+        title="Reload Launch Services",
+        description="Service initialization failures indicate corrupted launch daemons. Reload launchd configuration and restart services.",
+        commands=(
+            "sudo launchctl list | grep com.apple | awk '{print $3}' | xargs -I {} sudo launchctl kickstart -k system/{}",
+            "killall Dock",
+            "killall Finder",
+        ),
+        targets=("launchd", "com.apple.xpc.launchd", "System Services"),
+        risk_level="Medium",
+        estimated_impact="Temporary UI disruption as Finder/Dock restart, but resolves service issues",
+        concerns=(
+            "Restarting all Apple services may cause brief system instability",
+            "Dock/Finder restart interrupts workflow",
+            "May not fix underlying service corruption",
+        ),
+        benefits=(
+            "Reloads damaged service configurations",
+            "Quick recovery without full reboot",
+            "Fixes XPC service communication issues",
+        ),
+        system_impact="MEDIUM - Brief UI disruption, services restart",
+        app_impact="MEDIUM - Running apps may lose connection to system services",
+        recommendation="APPROVE - Good middle-ground fix, less disruptive than full reboot",
+    ),
+)
+
+
+def catalog_version(rules: Sequence[FixRule]) -> str:
+    """Short hash of a rule catalog; changes whenever any rule is added, removed or edited."""
+    return hashlib.sha1(repr(tuple(rules)).encode('utf-8')).hexdigest()[:12]
+
+
+def trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Regex matching any of the keywords, shaped as a prefix trie.
+
+    A flat alternation is tried branch by branch, so its cost grows with the
+    number of keywords; in the trie form each character selects one branch,
+    and matching costs roughly the length of the longest keyword. Optional
+    tails are greedy, so the longest keyword at a position wins.
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[None] = True
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(
+            (item for item in node.items() if item[0] is not None))]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if None not in node:
+            return body
+        return (body if len(branches) > 1 else '(?:' + body + ')') + '?'
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Counts occurrences of many keywords in one pass over a text.
+
+    The keywords are compiled into a single trie-shaped regex inside a
+    lookahead, so the engine reports the longest keyword starting at every
+    position (overlapping occurrences included). Shorter keywords that are a
+    prefix of the one found at a position are credited with it.
+    """
+
+    def __init__(self, keyword_rules: Dict[str, Iterable[int]]):
+        """
+        Args:
+            keyword_rules: Lowercase keyword -> indices of the rules it belongs to
+        """
+        keywords = sorted(keyword_rules, key=len, reverse=True)
+        self._pattern = re.compile('(?=(' + trie_pattern(keywords) + '))') if keywords else None
+        self._credits: Dict[str, Tuple[int, ...]] = {
+            keyword: tuple(rule for prefix in keywords if keyword.startswith(prefix)
+                           for rule in keyword_rules[prefix])
+            for keyword in keywords
+        }
+
+    def count(self, text: str, hits: Counter):
+        """Add the rule hits of every keyword occurrence in (lowercase) text to hits."""
+        if self._pattern is None:
+            return
+        credits = self._credits
+        for match in self._pattern.finditer(text):
+            for rule in credits[match.group(1)]:
+                hits[rule] += 1
+
+
+class RuleIndex:
+    """A rule catalog compiled for matching error patterns against all rules at once."""
+
+    def __init__(self, rules: Sequence[FixRule] = FIX_RULES):
+        """
+        Args:
+            rules: Catalog in priority order (default: FIX_RULES)
+        """
+        self.rules = tuple(rules)
+        self.version = catalog_version(self.rules)
+        self._by_title = {rule.title: rule for rule in self.rules}
+
+        message_keywords: Dict[str, List[int]] = {}
+        process_keywords: Dict[str, List[int]] = {}
+        self._process_rules: Dict[str, List[int]] = {}
+        for index, rule in enumerate(self.rules):
+            for keyword in rule.keywords:
+                message_keywords.setdefault(keyword.lower(), []).append(index)
+            for keyword in rule.process_keywords:
+                process_keywords.setdefault(keyword.lower(), []).append(index)
+            for process in rule.processes:
+                self._process_rules.setdefault(process, []).append(index)
+        self._messages = KeywordMatcher(message_keywords)
+        self._process_names = KeywordMatcher(process_keywords)
+
+    def rule_for_title(self, title: str) -> Optional[FixRule]:
+        """The rule whose fix has this title, if any."""
+        return self._by_title.get(title)
+
+    def rule_hits(self, error) -> Counter:
+        """
+        Hit counts of every rule for one error pattern, from a single scan of its messages.
+
+        Args:
+            error: Object with process, category and messages (e.g. ErrorPattern)
+
+        Returns:
+            Counter of rule index -> keyword/process hits, for rules whose
+            categories admit the pattern
+        """
+        hits: Counter = Counter()
+        count = self._messages.count
+        for message in error.messages:
+            count(message.lower(), hits)
+        self._process_names.count(error.process.lower(), hits)
+        for index in self._process_rules.get(error.process, ()):
+            hits[index] += 1
+
+        rules = self.rules
+        for index in [index for index in hits
+                      if rules[index].categories is not None and error.category not in rules[index].categories]:
+            del hits[index]
+        return hits
+
+    def match(self, errors: Iterable) -> List[Tuple[FixRule, list]]:
+        """
+        Rules that apply to any of the error patterns, in catalog order.
+
+        Returns:
+            (rule, matching error patterns) for every rule with at least one match
+        """
+        matched: List[list] = [[] for _ in self.rules]
+        for error in errors:
+            for index in self.rule_hits(error):
+                matched[index].append(error)
+        return [(rule, patterns) for rule, patterns in zip(self.rules, matched) if patterns]
+
+
+# Shared by Agent Alpha and Agent Beta
+RULE_INDEX = RuleIndex()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Machine-readable hand-off between the log resolution phases.
+
+Each phase can write a JSON Lines artifact next to its human-readable report.
+Downstream phases load the artifact directly instead of re-parsing the text:
+
+    parse_macos_logs.py logs.txt --json p1.jsonl > p1.txt
+    agent_debate.py p1.jsonl --json p2.jsonl > p2.txt
+    agent_coordinator.py p1.jsonl p2.jsonl
+
+File format: one JSON object per line, each with a "type" field. The first
+record is a header: {"type": "header", "phase": N, "version": 1}.
+
+Phase 1 records:  summary, category, burst, causal_source, root_cause
+Phase 2 records:  proposed_fix, critique, debate_round, consensus
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+ARTIFACT_VERSION = 1
+ARTIFACT_SUFFIX = ".jsonl"
+
+
+class ArtifactError(Exception):
+    """Raised when an artifact is missing, malformed, or from the wrong phase."""
+    pass
+
+
+def is_artifact(path: str) -> bool:
+    """True if path names a JSON Lines artifact rather than a text report."""
+    return Path(path).suffix == ARTIFACT_SUFFIX
+
+
+def write_artifact(path: str, phase: int, records: Iterable[Dict[str, Any]]):
+    """
+    Write a phase artifact.
+
+    Args:
+        path: Output file (conventionally *.jsonl)
+        phase: Producing phase number (1 or 2)
+        records: Records to write after the header, each with a "type" field
+    """
+    with open(path, 'w') as f:
+        f.write(json.dumps({"type": "header", "phase": phase, "version": ARTIFACT_VERSION}) + "\n")
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def read_artifact(path: str, phase: int) -> List[Dict[str, Any]]:
+    """
+    Read a phase artifact, checking its header.
+
+    Args:
+        path: Artifact file
+        phase: Phase the artifact must come from
+
+    Returns:
+        All records after the header, in file order
+    """
+    try:
+        with open(path, 'r') as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    except (OSError, json.JSONDecodeError) as e:
+        raise ArtifactError(f"Could not read artifact {path}: {e}")
+
+    if not records or records[0].get("type") != "header":
+        raise ArtifactError(f"{path} is missing the artifact header")
+    header = records[0]
+    if header.get("phase") != phase:
+        raise ArtifactError(f"{path} is a phase {header.get('phase')} artifact, expected phase {phase}")
+    if header.get("version") != ARTIFACT_VERSION:
+        raise ArtifactError(f"{path} has unsupported artifact version {header.get('version')}")
+    return records[1:]
+
+
+def records_of_type(records: Iterable[Dict[str, Any]], record_type: str) -> List[Dict[str, Any]]:
+    """Filter artifact records by their "type" field."""
+    return [record for record in records if record.get("type") == record_type]
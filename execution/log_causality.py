@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Time-window precedence graph between erroring processes.
+
+For every pair of processes A and B, errors are checked for company within
+a time window Δt:
+
+    before[A, B]   B errors with an A error in the Δt before them
+    after[A, B]    B errors with an A error in the Δt after them
+
+If A and B fail independently, time reversal changes nothing and A comes
+first as often as second, whatever their volumes. A process whose errors
+consistently come first is a likely upstream source of a cascade:
+
+    graph = CausalityGraph.build(times, process_codes, window_seconds=2)
+    for source in graph.sources(limit=3):
+        print(source.process, source.score, graph.chain(source.process))
+
+Errors come in storms, so they are not independent samples: the sign test
+uses a cluster-robust variance, where the errors of one process less than Δt
+apart form one episode (cluster). A storm of identical errors then widens
+the variance instead of inflating the z-score.
+
+The counts come from sweeping the errors in time order with two pointers
+bounding the window: the sweep keeps a count of errors per process
+currently inside the window, O(n × processes active in a window). With
+numpy the same sweep is vectorized (window bounds via searchsorted, then
+each process's windows merged into position ranges). Neither compares
+error pairs, and the matrices are stored sparsely as Counters keyed by (A, B).
+"""
+
+import math
+from array import array
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Default Δt: errors within this many seconds of each other count as related
+DEFAULT_WINDOW_SECONDS = 2.0
+
+# Longest chain followed from a source
+MAX_CHAIN_LENGTH = 4
+
+# Sign-test z-score an A-first vs. B-first imbalance must reach to count as
+# precedence rather than coincidence
+MIN_PRECEDENCE_Z = 3.0
+
+
+class CausalSource(NamedTuple):
+    """A process whose errors tend to precede errors elsewhere."""
+    process: int
+    score: int
+    downstream: List[Tuple[int, int, int]]  # (process, A first, B first)
+
+
+def _chronological_order(times: Sequence[int]) -> Optional[Sequence[int]]:
+    """Stable sort order of times, or None if they are already sorted."""
+    if all(times[i] <= times[i + 1] for i in range(len(times) - 1)):
+        return None
+    if NUMPY_AVAILABLE:
+        return np.argsort(np.asarray(times, dtype=np.int64), kind='stable').tolist()
+    return sorted(range(len(times)), key=times.__getitem__)
+
+
+def _episodes(times: Sequence[int], processes: Sequence[int], window: int) -> Tuple[list, list]:
+    """
+    Split each process's errors into episodes: runs with gaps of at most window.
+
+    Returns:
+        (episode id of each error, process of each episode)
+    """
+    episode_of: List[int] = []
+    episode_process: List[int] = []
+    current: Dict[int, Tuple[int, int]] = {}  # process -> (episode id, last time)
+    for time, process in zip(times, processes):
+        previous = current.get(process)
+        if previous is None or time - previous[1] > window:
+            episode = len(episode_process)
+            episode_process.append(process)
+        else:
+            episode = previous[0]
+        current[process] = (episode, time)
+        episode_of.append(episode)
+    return episode_of, episode_process
+
+
+def _sweep(times: Sequence[int], processes: Sequence[int], episodes: Sequence[int],
+           window: int, counts: Counter, signs: Counter, sign: int):
+    """
+    Two-pointer sweep over errors in time order.
+
+    For every B error with an A error among the earlier errors no more than
+    window before it: counts[A, B] += 1 and signs[A, episode of the B error] += sign.
+    """
+    # Errors per process between the two pointers: [times[right] - window, times[right])
+    active: Dict[int, int] = {}
+    left = 0
+    for time, target, episode in zip(times, processes, episodes):
+        horizon = time - window
+        while times[left] < horizon:
+            expired = processes[left]
+            remaining = active[expired] - 1
+            if remaining:
+                active[expired] = remaining
+            else:
+                del active[expired]
+            left += 1
+        for source in active:
+            if source != target:
+                counts[source, target] += 1
+                signs[source, episode] += sign
+        active[target] = active.get(target, 0) + 1
+
+
+def _covered(starts, ends):
+    """Positions in the union of the ranges [starts[k], ends[k]); both must be non-decreasing."""
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    if not len(starts):
+        return starts
+    # A range opens a new merged run unless it overlaps the previous one
+    opens = np.empty(len(starts), dtype=bool)
+    opens[0] = True
+    opens[1:] = starts[1:] > ends[:-1]
+    run_starts = starts[opens]
+    run_ends = ends[np.append(np.flatnonzero(opens)[1:] - 1, len(ends) - 1)]
+    lengths = run_ends - run_starts
+    # Concatenated aranges: each position is its run's start plus its offset in the run
+    return np.repeat(run_starts - (np.cumsum(lengths) - lengths), lengths) + np.arange(lengths.sum())
+
+
+def _sweep_numpy(graph: 'CausalityGraph', times: Sequence[int], processes: Sequence[int]):
+    """
+    Vectorized _sweep, in both time directions at once.
+
+    Error j has source error i shortly before it exactly when j lies in
+    (i, right[i]), so the errors a source precedes are the union of those
+    ranges over its own errors (and likewise [left[i], i) for after). Each
+    source costs only the positions its windows cover.
+    """
+    window = graph.window_micros
+    t = np.asarray(times, dtype=np.int64)
+    p = np.asarray(processes, dtype=np.int64)
+    size = int(p.max()) + 1
+    # Window of error j: positions [left[j], j) before it, (j, right[j]) after it
+    left = np.searchsorted(t, t - window, side='left')
+    right = np.searchsorted(t, t + window, side='right')
+    # Positions of each process's errors, ascending within each process
+    by_process = np.argsort(p, kind='stable')
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(p, minlength=size))))
+
+    # Episodes: a process's error opens one if its gap to the previous exceeds window
+    t_sorted, p_sorted = t[by_process], p[by_process]
+    opens = np.ones(len(p), dtype=bool)
+    opens[1:] = (p_sorted[1:] != p_sorted[:-1]) | (t_sorted[1:] - t_sorted[:-1] > window)
+    episode_of = np.empty(len(p), dtype=np.int64)
+    episode_of[by_process] = np.cumsum(opens) - 1
+    episode_process = p_sorted[opens]
+
+    for source in range(size):
+        positions = by_process[bounds[source]:bounds[source + 1]]
+        if not len(positions):
+            continue
+        before_hits = _covered(positions + 1, right[positions])
+        after_hits = _covered(left[positions], positions)
+        before_hits = before_hits[p[before_hits] != source]
+        after_hits = after_hits[p[after_hits] != source]
+        for counts, hits in ((graph.before, before_hits), (graph.after, after_hits)):
+            per_target = np.bincount(p[hits], minlength=size)
+            for target in np.flatnonzero(per_target).tolist():
+                counts[source, target] = int(per_target[target])
+
+        # Net sign (+1 before, -1 after) per target episode, squared and summed per target
+        hit_episodes = np.concatenate((episode_of[before_hits], episode_of[after_hits]))
+        if not len(hit_episodes):
+            continue
+        weights = np.concatenate((np.ones(len(before_hits)), -np.ones(len(after_hits))))
+        if len(hit_episodes) * 8 < len(episode_process):
+            # Few hits: compact them instead of touching every episode
+            episodes, inverse = np.unique(hit_episodes, return_inverse=True)
+            signs = np.bincount(inverse, weights=weights)
+        else:
+            episodes = np.arange(len(episode_process))
+            signs = np.bincount(hit_episodes, weights=weights, minlength=len(episode_process))
+        variance = np.bincount(episode_process[episodes], weights=signs * signs, minlength=size)
+        for target in np.flatnonzero(variance).tolist():
+            graph.variance[source, target] = int(variance[target])
+
+
+class CausalityGraph:
+    """Sparse process-to-process precedence counts among errors."""
+
+    def __init__(self, window_micros: int):
+        self.window_micros = window_micros
+        self.before: Counter = Counter()    # (A, B) -> B errors with an A error shortly before
+        self.after: Counter = Counter()     # (A, B) -> B errors with an A error shortly after
+        self.variance: Counter = Counter()  # (A, B) -> sum over B episodes of (before - after)²
+        self.first_seen: Dict[int, int] = {}
+
+    @classmethod
+    def build(cls, times: Sequence[int], processes: Sequence[int],
+              window_seconds: float = DEFAULT_WINDOW_SECONDS) -> 'CausalityGraph':
+        """
+        Build the graph from parallel sequences of error times and processes.
+
+        Args:
+            times: Error timestamps in epoch microseconds (any order)
+            processes: Process code (small non-negative int) of each error
+            window_seconds: Δt within which errors count as before/after each other
+        """
+        graph = cls(int(window_seconds * 1_000_000))
+        if not len(times):
+            return graph
+        order = _chronological_order(times)
+        if order is not None:
+            times = array('q', (times[i] for i in order))
+            processes = array('q', (processes[i] for i in order))
+
+        if NUMPY_AVAILABLE:
+            _sweep_numpy(graph, times, processes)
+        else:
+            episode_of, episode_process = _episodes(times, processes, graph.window_micros)
+            signs: Counter = Counter()  # (A, B episode) -> net before/after hits
+            _sweep(times, processes, episode_of, graph.window_micros, graph.before, signs, 1)
+            # Sweeping the reversed, negated timeline turns "after" into "before"
+            _sweep(array('q', (-time for time in reversed(times))), processes[::-1],
+                   episode_of[::-1], graph.window_micros, graph.after, signs, -1)
+            for (source, episode), sign in signs.items():
+                if sign:
+                    graph.variance[source, episode_process[episode]] += sign * sign
+
+        first_seen = graph.first_seen
+        for time, process in zip(times, processes):
+            if process not in first_seen:
+                first_seen[process] = time
+        return graph
+
+    def precedence(self, source: int, target: int) -> Tuple[int, int]:
+        """
+        How often source's errors came first vs. second around target's.
+
+        Counted from both sides: a target error with a source error shortly
+        before it, and a source error with a target error shortly after it,
+        both count towards source first.
+
+        Returns:
+            (source first, target first)
+        """
+        first = self.before[source, target] + self.after[target, source]
+        second = self.after[source, target] + self.before[target, source]
+        return first, second
+
+    def z_score(self, source: int, target: int) -> float:
+        """
+        Sign-test z-score of source coming first, with episode-clustered variance.
+
+        Both sides see the same co-occurrences, so their deviations are
+        correlated; their standard deviations are added rather than their
+        variances, which bounds the combined deviation from above.
+        """
+        first, second = self.precedence(source, target)
+        spread = math.sqrt(self.variance[source, target]) + math.sqrt(self.variance[target, source])
+        return (first - second) / spread if spread else 0.0
+
+    def leads(self, source: int, target: int, min_z: float = MIN_PRECEDENCE_Z) -> bool:
+        """True if source's errors come before target's significantly more often than after."""
+        return self.z_score(source, target) >= min_z
+
+    def threshold(self, min_z: float = MIN_PRECEDENCE_Z) -> float:
+        """
+        z-score an edge has to reach given how many process pairs were tested.
+
+        With hundreds of processes some pairs look imbalanced by chance; the
+        bound is raised to about the largest |z| noise alone would produce
+        among that many pairs (sqrt(2 ln pairs)), and never below min_z.
+        """
+        pairs = len({frozenset(pair) for pair in set(self.before) | set(self.after)})
+        return max(min_z, math.sqrt(2 * math.log(pairs))) if pairs > 1 else min_z
+
+    def _forward_edges(self, z: float) -> Dict[int, List[Tuple[int, int, int]]]:
+        """Edges reaching z-score z, by source: {A: [(B, A first, B first), ...]}."""
+        forward: Dict[int, List[Tuple[int, int, int]]] = {}
+        for source, target in set(self.before) | set(self.after):
+            if self.leads(source, target, z):
+                forward.setdefault(source, []).append((target, *self.precedence(source, target)))
+        return forward
+
+    def sources(self, limit: int = 3, downstream_limit: int = 3,
+                min_z: float = MIN_PRECEDENCE_Z) -> List[CausalSource]:
+        """
+        Rank processes by how much more often they come before others than after.
+
+        Only significant edges (see leads and threshold) count. The score of
+        A is the sum of (A first - B first) over the processes B it
+        significantly leads, minus the same for processes that significantly
+        lead A. Processes erroring independently of each other produce no
+        significant edges at all.
+
+        Returns:
+            Up to `limit` sources with a positive score, highest first (ties:
+            earliest first error), each with its strongest downstream
+            processes. Processes nothing significantly leads (the roots of the
+            graph) rank ahead of intermediate links of a chain.
+        """
+        forward = self._forward_edges(self.threshold(min_z))
+        scores: Counter = Counter()
+        led = set()
+        for source, targets in forward.items():
+            for target, first, second in targets:
+                scores[source] += first - second
+                scores[target] -= first - second
+                led.add(target)
+
+        ranked = sorted((process for process, score in scores.items() if score > 0),
+                        key=lambda process: (process in led, -scores[process], self.first_seen[process]))
+        return [CausalSource(process, scores[process],
+                             sorted(forward[process], key=lambda item: (-item[1], item[0]))[:downstream_limit])
+                for process in ranked[:limit]]
+
+    def chain(self, source: int, max_length: int = MAX_CHAIN_LENGTH,
+              min_z: float = MIN_PRECEDENCE_Z) -> List[int]:
+        """
+        Follow the strongest significant edges from source.
+
+        Each step moves to a not-yet-visited process the current process
+        significantly leads, preferring direct successors: when the current
+        process leads both B and C and B also leads C, the step goes to B.
+        Among equals, the most frequent co-occurrence wins.
+        """
+        z = self.threshold(min_z)
+        forward = self._forward_edges(z)
+        chain = [source]
+        while len(chain) < max_length:
+            candidates = [(first, target) for target, first, _ in forward.get(chain[-1], ())
+                          if target not in chain]
+            if not candidates:
+                break
+            direct = [(first, target) for first, target in candidates
+                      if not any(self.leads(other, target, z) for _, other in candidates if other != target)]
+            chain.append(max(direct or candidates,
+                             key=lambda item: (item[0], -self.first_seen[item[1]]))[1])
+        return chain
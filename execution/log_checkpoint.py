@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Resumable Phase 1 analysis: persist analyzer state between runs.
+
+A checkpoint records the analyzer state together with where it stopped in
+the log file, so the next run over a growing (rolling) log only has to
+parse the lines appended since:
+
+    parse_macos_logs.py system.log --checkpoint .tmp/system.ckpt   # full parse
+    parse_macos_logs.py system.log --checkpoint .tmp/system.ckpt   # new lines only
+
+A checkpoint is only resumed when the log file is still the same file:
+- same device and inode (a rotated log is a new file)
+- at least as large as the consumed offset (a truncated log starts over)
+- the first and last bytes before the offset are unchanged (a rewritten log
+  starts over)
+
+Anything else, including an unreadable checkpoint, one from an older format
+or one written with different parse options, is ignored and the log is
+parsed from byte 0.
+
+Checkpoints are JSON and hold only mergeable aggregates, never parsed rows:
+the string and template tables, and error counts per (process, subsystem,
+level, template, minute) plus warning counts per process (RowSummary). Their
+size grows with the number of distinct templates and minutes, not lines.
+Counters, timeline, bursts and root causes of a resumed run cover the whole
+log; sections that list individual errors (error flow, causal chains) and
+the SQLite index cover the lines appended since the checkpoint.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Bump whenever the checkpoint state changes shape
+CHECKPOINT_VERSION = 6
+
+# Bytes at each end of the consumed region hashed to detect a rewritten log
+FINGERPRINT_BYTES = 4096
+
+
+class CheckpointError(Exception):
+    """Raised when a checkpoint file cannot be read or written."""
+    pass
+
+
+class RowSummary:
+    """
+    Mergeable counters standing in for log rows no longer held column by column.
+
+    Process, subsystem and template values are codes into the analyzer's
+    string tables and template miner, which are saved alongside.
+    """
+
+    def __init__(self):
+        self.entries = 0
+        self.warnings: Counter = Counter()  # process code -> warnings
+        # (process code, subsystem code, level code, template id, epoch minute) -> errors
+        self.errors: Counter = Counter()
+        # First error's timestamp text; the report shows times in its UTC offset
+        self.first_error_timestamp: Optional[str] = None
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def warning_count(self) -> int:
+        return sum(self.warnings.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible form; groups keep their first-seen order."""
+        return {
+            "entries": self.entries,
+            "warnings": [[code, count] for code, count in self.warnings.items()],
+            "errors": [[*key, count] for key, count in self.errors.items()],
+            "first_error_timestamp": self.first_error_timestamp,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RowSummary':
+        summary = cls()
+        summary.entries = data["entries"]
+        summary.warnings.update({code: count for code, count in data["warnings"]})
+        summary.errors.update({tuple(group[:5]): group[5] for group in data["errors"]})
+        summary.first_error_timestamp = data["first_error_timestamp"]
+        return summary
+
+
+def _fingerprint(path: str, offset: int) -> str:
+    """Hash of the consumed region's first and last FINGERPRINT_BYTES bytes."""
+    digest = hashlib.sha1()
+    tail = max(0, offset - FINGERPRINT_BYTES)
+    with open(path, 'rb') as f:
+        digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+        f.seek(tail)
+        digest.update(f.read(offset - tail))
+    return digest.hexdigest()
+
+
+def complete_lines_end(path: str, start: int = 0) -> int:
+    """
+    Offset just past the last newline at or after start.
+
+    A line still being written has no trailing newline yet; stopping before it
+    means the next run picks it up whole instead of as two fragments.
+
+    Returns:
+        End offset of the last complete line, or start if there is none
+    """
+    with open(path, 'rb') as f:
+        position = os.fstat(f.fileno()).st_size
+        block = 65536
+        while position > start:
+            read_from = max(start, position - block)
+            f.seek(read_from)
+            newline = f.read(position - read_from).rfind(b'\n')
+            if newline >= 0:
+                return read_from + newline + 1
+            position = read_from
+    return start
+
+
+def save_checkpoint(checkpoint_path: str, log_path: str, offset: int,
+                    state: Dict[str, Any], options: Dict[str, Any]):
+    """
+    Write a checkpoint atomically.
+
+    Args:
+        checkpoint_path: Checkpoint file to (over)write
+        log_path: Log file the state was built from
+        offset: Byte offset up to which the log has been consumed
+        state: JSON-compatible analysis state (see LogAnalyzer.checkpoint_state)
+        options: Parse options the state depends on; a resume with different
+            options starts over
+    """
+    st = os.stat(log_path)
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "device": st.st_dev,
+        "inode": st.st_ino,
+        "offset": offset,
+        "fingerprint": _fingerprint(log_path, offset),
+        "options": options,
+        "state": state,
+    }
+    target = Path(checkpoint_path)
+    temp = None
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer, so concurrent runs never share one
+        fd, temp = tempfile.mkstemp(dir=target.parent, prefix=target.name + '.', suffix='.tmp')
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp, target)
+    except OSError as e:
+        if temp is not None and os.path.exists(temp):
+            os.unlink(temp)
+        raise CheckpointError(f"Could not write checkpoint {checkpoint_path}: {e}")
+
+
+def load_checkpoint(checkpoint_path: str, log_path: str,
+                    options: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], int]]:
+    """
+    Load a checkpoint if it can be resumed against log_path.
+
+    Args:
+        checkpoint_path: Checkpoint file (missing is fine)
+        log_path: Log file about to be parsed
+        options: Parse options of this run
+
+    Returns:
+        (state, offset) to resume from, or None to parse from the start
+        (also when the checkpoint is unreadable or not a checkpoint at all)
+    """
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(checkpoint, dict) or checkpoint.get("version") != CHECKPOINT_VERSION:
+        return None
+    if checkpoint.get("options") != options:
+        return None
+
+    try:
+        st = os.stat(log_path)
+        offset = checkpoint["offset"]
+        if (st.st_dev, st.st_ino) != (checkpoint["device"], checkpoint["inode"]):
+            return None
+        if st.st_size < offset or _fingerprint(log_path, offset) != checkpoint["fingerprint"]:
+            return None
+        return checkpoint["state"], offset
+    except (OSError, KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Transparent decompression of archived log captures (gzip, bzip2, zstd).
+
+The format is chosen by the file's magic bytes, not its name. Decompression
+runs in a background thread that hands chunks to the parser through a bounded
+queue, so reading and inflating overlap with parsing (zlib, bz2 and zstd all
+release the GIL) while memory stays bounded:
+
+    with open_decompressed("system_errors.txt.gz") as f:
+        analyzer.add_log_lines(f)
+
+Files made of several independent members (concatenated or bgzip'd gzip,
+pbzip2 output, multi-frame or seekable zstd) can be cut on member boundaries
+with member_ranges() and the ranges decompressed in parallel processes.
+
+zstd input needs the optional zstandard package.
+"""
+
+import bz2
+import io
+import os
+import queue
+import re
+import threading
+import zlib
+from typing import BinaryIO, Iterator, List, Optional, TextIO, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Leading bytes of each supported format
+MAGIC_BYTES = {
+    'gzip': b'\x1f\x8b',
+    'bzip2': b'BZh',
+    'zstd': b'\x28\xb5\x2f\xfd',
+}
+
+# Member headers searched for when splitting a file; stricter than the magic
+# bytes so fewer positions inside compressed data look like a member start
+_MEMBER_HEADERS = {
+    'gzip': re.compile(rb'\x1f\x8b\x08[\x00-\x1f]'),  # deflate, no reserved flags
+    'bzip2': re.compile(rb'BZh[1-9]1AY&SY'),           # stream header + first block magic
+    'zstd': re.compile(re.escape(MAGIC_BYTES['zstd'])),
+}
+
+# Compressed bytes fed to the decompressor per step
+READ_SIZE = 65536
+
+# Decompressed chunks buffered between the decompression thread and the parser
+DECOMPRESS_QUEUE_SIZE = 64
+
+_DECOMPRESS_ERRORS = (zlib.error, OSError, EOFError, ValueError) + \
+    ((zstandard.ZstdError,) if ZSTD_AVAILABLE else ())
+
+
+class CompressionError(Exception):
+    """Raised when compressed input is corrupt, truncated, or needs a missing package."""
+    pass
+
+
+def detect_compression(header: bytes) -> Optional[str]:
+    """Compression format ('gzip', 'bzip2', 'zstd') of data starting with header, or None."""
+    for compression, magic in MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return compression
+    return None
+
+
+def file_compression(path: str) -> Optional[str]:
+    """Compression format of a file, from its magic bytes (None for plain text)."""
+    with open(path, 'rb') as f:
+        return detect_compression(f.read(4))
+
+
+def _check_supported(compression: str):
+    if compression == 'zstd' and not ZSTD_AVAILABLE:
+        raise CompressionError("zstd input needs the zstandard package (pip install zstandard)")
+
+
+def _decompressor(compression: str):
+    """Fresh single-member decompressor with decompress()/eof/unused_data."""
+    if compression == 'gzip':
+        return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    if compression == 'bzip2':
+        return bz2.BZ2Decompressor()
+    _check_supported(compression)
+    return zstandard.ZstdDecompressor().decompressobj()
+
+
+def iter_decompressed(stream: BinaryIO, compression: str,
+                      limit: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Decompress consecutive members from a binary stream's current position.
+
+    Args:
+        stream: Binary stream positioned at a member start
+        compression: Format of the members
+        limit: Compressed bytes to consume (default: to end of stream); the
+            last member must end exactly there
+
+    Yields:
+        Decompressed chunks, in order
+
+    Raises:
+        CompressionError: corrupt data, or input ending inside a member
+    """
+    decompressor = _decompressor(compression)
+    in_member = False
+    remaining = limit
+    while remaining is None or remaining > 0:
+        data = stream.read(READ_SIZE if remaining is None else min(READ_SIZE, remaining))
+        if not data:
+            break
+        if remaining is not None:
+            remaining -= len(data)
+        while data:
+            if not in_member and compression == 'gzip':
+                # gzip archives may be zero-padded after a member
+                data = data.lstrip(b'\0')
+                if not data:
+                    break
+            try:
+                chunk = decompressor.decompress(data)
+            except _DECOMPRESS_ERRORS as e:
+                raise CompressionError(f"Corrupt {compression} data: {e}")
+            in_member = True
+            if chunk:
+                yield chunk
+            if not decompressor.eof:
+                break
+            data = decompressor.unused_data
+            decompressor = _decompressor(compression)
+            in_member = False
+    if in_member:
+        raise CompressionError(f"{compression} input ends inside a member (truncated or misaligned)")
+
+
+class _QueueReader(io.RawIOBase):
+    """
+    Raw binary stream over chunks produced by a background thread.
+
+    The producer blocks once the bounded queue is full, so a slow consumer
+    caps memory at queue_size chunks. Errors in the producer are re-raised
+    from read().
+    """
+
+    def __init__(self, chunks: Iterator[bytes], queue_size: int = DECOMPRESS_QUEUE_SIZE):
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._pending = memoryview(b'')
+        self._finished = False
+        self._thread = threading.Thread(target=self._produce, args=(chunks,), daemon=True)
+        self._thread.start()
+
+    def _produce(self, chunks: Iterator[bytes]):
+        try:
+            for chunk in chunks:
+                if not self._put(chunk):
+                    return
+            self._put(None)
+        except Exception as e:
+            self._put(e)
+        finally:
+            chunks.close()
+
+    def _put(self, item) -> bool:
+        """Queue an item, giving up (False) once the reader has been closed."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            if self._finished:
+                return 0
+            item = self._queue.get()
+            if item is None or isinstance(item, Exception):
+                self._finished = True
+                if item is None:
+                    return 0
+                raise item
+            self._pending = memoryview(item)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        self._stop.set()
+        super().close()
+
+
+def _text_stream(chunks: Iterator[bytes], queue_size: int) -> TextIO:
+    """Text stream (UTF-8, invalid bytes replaced, universal newlines) over background-produced chunks."""
+    return io.TextIOWrapper(io.BufferedReader(_QueueReader(chunks, queue_size)),
+                            encoding='utf-8', errors='replace')
+
+
+def open_decompressed(path: str, compression: Optional[str] = None, start: int = 0,
+                      end: Optional[int] = None,
+                      queue_size: int = DECOMPRESS_QUEUE_SIZE) -> TextIO:
+    """
+    Open a compressed log file as a text stream, decompressed in a background thread.
+
+    Lines read from it are the same as from the uncompressed file opened with
+    open(path, 'r', encoding='utf-8', errors='replace').
+
+    Args:
+        path: Compressed file
+        compression: Format (default: detected from the magic bytes)
+        start: Byte offset of the first member to read
+        end: Byte offset where the last member ends (default: end of file)
+        queue_size: Decompressed chunks buffered ahead of the reader
+    """
+    compression = compression or file_compression(path)
+    if compression is None:
+        raise CompressionError(f"{path} is not gzip, bzip2 or zstd compressed")
+    _check_supported(compression)
+
+    def chunks() -> Iterator[bytes]:
+        with open(path, 'rb') as f:
+            f.seek(start)
+            yield from iter_decompressed(f, compression, None if end is None else end - start)
+
+    return _text_stream(chunks(), queue_size)
+
+
+def decompress_stream(stream: BinaryIO, compression: str,
+                      queue_size: int = DECOMPRESS_QUEUE_SIZE) -> TextIO:
+    """Text stream over a compressed binary stream (e.g. stdin), decompressed in a background thread."""
+    _check_supported(compression)
+    return _text_stream(iter_decompressed(stream, compression), queue_size)
+
+
+def _next_member(f: BinaryIO, compression: str, position: int, end: int) -> Optional[int]:
+    """Offset of the first plausible member header in [position, end), if any."""
+    pattern = _MEMBER_HEADERS[compression]
+    overlap = 16
+    while position < end:
+        f.seek(position)
+        block = f.read(min(READ_SIZE * 16, end - position))
+        for match in pattern.finditer(block):
+            offset = position + match.start()
+            # Data that merely looks like a header almost never decompresses
+            f.seek(offset)
+            try:
+                _decompressor(compression).decompress(f.read(READ_SIZE))
+            except _DECOMPRESS_ERRORS:
+                continue
+            return offset
+        if position + len(block) >= end:
+            break
+        position += len(block) - overlap
+    return None
+
+
+def member_ranges(path: str, compression: str, parts: int, start: int = 0,
+                  end: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split a compressed file into up to `parts` byte ranges starting at member headers.
+
+    Split points are positions that look like a member header and begin
+    decompressing cleanly. That is a strong hint, not proof: decompress each
+    range with iter_decompressed(limit=range length), which raises
+    CompressionError if a range does not end exactly on a member boundary,
+    and fall back to one sequential read when it does. A single-member file
+    yields one range.
+
+    Args:
+        path: Compressed file
+        compression: Its format
+        parts: Maximum number of ranges
+        start: Byte offset of the first member
+        end: End offset of the last member (default: end of file)
+
+    Returns:
+        List of (start, end) byte offsets covering [start, end), in order
+    """
+    _check_supported(compression)
+    end = os.path.getsize(path) if end is None else end
+    bounds = [start]
+    with open(path, 'rb') as f:
+        for k in range(1, parts):
+            target = max(start + (end - start) * k // parts, bounds[-1] + 1)
+            offset = _next_member(f, compression, target, end)
+            if offset is None:
+                # No member starts after target, so none after later targets either
+                break
+            bounds.append(offset)
+    bounds.append(end)
+    return list(zip(bounds, bounds[1:]))
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Mergeable error aggregates for analyzing logs from many hosts (fleet mode).
+
+Each host's log is reduced to a FleetAggregate: error counts per process,
+per message template and per minute, keyed by host where it matters. Merging
+only adds counters, so it is associative and commutative; per-host
+aggregates can be combined in any grouping (per rack, per site, then fleet)
+and saved to JSON in between:
+
+    parse_macos_logs.py --fleet logs_by_host/ --workers 8
+    parse_macos_logs.py --fleet site_a/ --save-aggregate site_a.fleet.json
+    parse_macos_logs.py --fleet sites/          # site_*.fleet.json are merged as-is
+
+Templates are matched across hosts by their exact (process, template) text.
+"""
+
+import json
+from array import array
+from collections import Counter
+from datetime import timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from log_timeline import ErrorHistogram, iter_histogram_lines
+
+AGGREGATE_VERSION = 1
+
+# File name suffix of saved aggregates; such files in a --fleet directory are
+# merged instead of parsed
+AGGREGATE_SUFFIX = ".fleet.json"
+
+# Rows shown per report section
+FLEET_REPORT_ROWS = 15
+
+
+class FleetAggregate:
+    """Error counters for one host or any group of hosts."""
+
+    def __init__(self):
+        self.hosts: Counter = Counter()            # host -> errors (0 for clean hosts)
+        self.totals: Counter = Counter()           # entries, errors, warnings
+        self.process_errors: Counter = Counter()   # process -> errors
+        self.category_errors: Counter = Counter()  # category type -> errors
+        self.template_hosts: Dict[Tuple[str, str], Counter] = {}  # (process, template) -> host -> errors
+        self.minute_errors: Counter = Counter()    # epoch minute -> errors
+
+    @classmethod
+    def for_host(cls, host: str, entries: int, warnings: int,
+                 errors: Iterable[Tuple[str, str, str, int]]) -> 'FleetAggregate':
+        """
+        Aggregate of one host's log.
+
+        Args:
+            host: Host name
+            entries: Number of parsed entries
+            warnings: Number of warnings
+            errors: (process, category type, template, epoch minute) per error
+        """
+        aggregate = cls()
+        aggregate.hosts[host] = 0
+        templates: Counter = Counter()
+        for process, category, template, minute in errors:
+            aggregate.process_errors[process] += 1
+            aggregate.category_errors[category] += 1
+            aggregate.minute_errors[minute] += 1
+            templates[(process, template)] += 1
+        for key, count in templates.items():
+            aggregate.template_hosts[key] = Counter({host: count})
+        error_count = sum(templates.values())
+        aggregate.hosts[host] = error_count
+        aggregate.totals.update(entries=entries, errors=error_count, warnings=warnings)
+        return aggregate
+
+    def merge(self, other: 'FleetAggregate') -> 'FleetAggregate':
+        """Add other's counts into this aggregate (associative and commutative); returns self."""
+        # Counter.update keeps zero counts, so clean hosts stay listed
+        self.hosts.update(other.hosts)
+        self.totals.update(other.totals)
+        self.process_errors.update(other.process_errors)
+        self.category_errors.update(other.category_errors)
+        self.minute_errors.update(other.minute_errors)
+        for key, hosts in other.template_hosts.items():
+            self.template_hosts.setdefault(key, Counter()).update(hosts)
+        return self
+
+    @classmethod
+    def combine(cls, aggregates: Iterable['FleetAggregate']) -> 'FleetAggregate':
+        """Merge any number of aggregates into a new one."""
+        combined = cls()
+        for aggregate in aggregates:
+            combined.merge(aggregate)
+        return combined
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FleetAggregate) and self.to_dict() == other.to_dict()
+
+    # ---- persistence -------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible form, with keys sorted so equal aggregates serialize equally."""
+        return {
+            "version": AGGREGATE_VERSION,
+            "hosts": dict(sorted(self.hosts.items())),
+            "totals": dict(sorted(self.totals.items())),
+            "process_errors": dict(sorted(self.process_errors.items())),
+            "category_errors": dict(sorted(self.category_errors.items())),
+            "templates": [
+                {"process": process, "template": template, "hosts": dict(sorted(hosts.items()))}
+                for (process, template), hosts in sorted(self.template_hosts.items())
+            ],
+            "minute_errors": {str(minute): count for minute, count in sorted(self.minute_errors.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FleetAggregate':
+        if data.get("version") != AGGREGATE_VERSION:
+            raise ValueError(f"unsupported aggregate version {data.get('version')}")
+        aggregate = cls()
+        aggregate.hosts.update(data["hosts"])
+        aggregate.totals.update(data["totals"])
+        aggregate.process_errors.update(data["process_errors"])
+        aggregate.category_errors.update(data["category_errors"])
+        for item in data["templates"]:
+            aggregate.template_hosts[(item["process"], item["template"])] = Counter(item["hosts"])
+        aggregate.minute_errors.update({int(minute): count for minute, count in data["minute_errors"].items()})
+        return aggregate
+
+    def save(self, path: str):
+        """Write the aggregate as JSON (conventionally *.fleet.json)."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'FleetAggregate':
+        """Read an aggregate written by save()."""
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+    # ---- analysis ----------------------------------------------------------
+
+    def template_spread(self) -> List[Tuple[str, str, int, int]]:
+        """
+        Every error template with how widely it occurs.
+
+        Returns:
+            (process, template, hosts affected, errors) tuples, most
+            widespread first, then by error count
+        """
+        spread = [(process, template, len(hosts), sum(hosts.values()))
+                  for (process, template), hosts in self.template_hosts.items()]
+        spread.sort(key=lambda item: (-item[2], -item[3], item[0], item[1]))
+        return spread
+
+    def common_templates(self, min_hosts: int = 2) -> List[Tuple[str, str, int, int]]:
+        """Templates seen on at least min_hosts hosts (see template_spread)."""
+        return [item for item in self.template_spread() if item[2] >= min_hosts]
+
+    def host_specific_templates(self) -> List[Tuple[str, str, str, int]]:
+        """
+        Templates seen on exactly one host.
+
+        Returns:
+            (host, process, template, errors) tuples, most errors first
+        """
+        specific = [(next(iter(hosts)), process, template, sum(hosts.values()))
+                    for (process, template), hosts in self.template_hosts.items() if len(hosts) == 1]
+        specific.sort(key=lambda item: (-item[3], item[0], item[1], item[2]))
+        return specific
+
+    def error_histogram(self) -> Optional[ErrorHistogram]:
+        """Fleet-wide errors per minute (None if there are no errors)."""
+        if not self.minute_errors:
+            return None
+        first, last = min(self.minute_errors), max(self.minute_errors)
+        get = self.minute_errors.get
+        return ErrorHistogram(first, 1, array('q', (get(minute, 0) for minute in range(first, last + 1))))
+
+    # ---- report ------------------------------------------------------------
+
+    def _iter_report_lines(self, rows: int) -> Iterator[str]:
+        host_count = len(self.hosts)
+        yield "=" * 80
+        yield "FLEET REPORT"
+        yield "=" * 80
+        yield f"Hosts: {host_count}"
+        yield f"Total Log Entries: {self.totals['entries']}"
+        yield f"Errors (Error + Fault): {self.totals['errors']}"
+        yield f"Warnings: {self.totals['warnings']}"
+
+        yield "\n" + "=" * 80
+        yield "ERRORS PER HOST"
+        yield "=" * 80
+        width = max((len(host) for host in self.hosts), default=0)
+        for host, errors in sorted(self.hosts.items(), key=lambda item: (-item[1], item[0]))[:rows]:
+            yield f"{host:<{width}}  {errors:>8}"
+        if host_count > rows:
+            yield f"... and {host_count - rows} more hosts"
+
+        yield "\n" + "=" * 80
+        yield "ERROR TEMPLATES COMMON ACROSS HOSTS"
+        yield "=" * 80
+        common = self.common_templates()
+        if not common:
+            yield "No error template occurs on more than one host."
+        for process, template, hosts, errors in common[:rows]:
+            yield f"[{hosts}/{host_count} hosts] {errors:>7}×  {process}: {template}"
+
+        yield "\n" + "=" * 80
+        yield "HOST-SPECIFIC ERROR TEMPLATES"
+        yield "=" * 80
+        specific = self.host_specific_templates() if host_count > 1 else []
+        if not specific:
+            yield "No error template is unique to one host."
+        for host, process, template, errors in specific[:rows]:
+            yield f"{host}: {errors:>7}×  {process}: {template}"
+
+        histogram = self.error_histogram()
+        if histogram is not None:
+            yield "\n" + "=" * 80
+            yield "FLEET ERROR TIMELINE (UTC)"
+            yield "=" * 80
+            yield from iter_histogram_lines(histogram, timezone.utc)
+
+    def generate_report(self, rows: int = FLEET_REPORT_ROWS) -> str:
+        """Fleet report: per-host errors, common and host-specific templates, timeline."""
+        return "\n".join(self._iter_report_lines(rows))
+
+    def write_report(self, out: TextIO, rows: int = FLEET_REPORT_ROWS):
+        """Stream the fleet report to a file handle."""
+        for line in self._iter_report_lines(rows):
+            out.write(line + "\n")
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+SQLite index over parsed log entries for ad-hoc drill-down after Phase 1.
+
+Phase 1 can save every parsed entry to a SQLite database instead of throwing
+it away after the report, so later questions are answered from indexes
+instead of by re-reading the raw capture:
+
+    parse_macos_logs.py logs.txt --index logs.sqlite > report.txt
+    log_index.py logs.sqlite errors --process kernel --since "2026-01-08 10:00" --until "2026-01-08 10:05"
+    log_index.py logs.sqlite search "ACPI AND checksum"
+
+Schema:
+    entries(id, ts, timestamp, level, pid, process, subsystem, category, thread_id, message)
+        id is the entry's position in the log, ts its time in epoch
+        microseconds (UTC), timestamp the time as logged
+        indexed on (level, ts) and (process, ts)
+    entries_fts: FTS5 full-text index over entries.message (rowid = entries.id)
+    meta(key, value): source file, UTC offset of the log, entry count
+
+The database is always written from scratch to a temporary file and moved
+into place, so readers never see a half-built index.
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Sibling modules in execution/
+sys.path.insert(0, str(Path(__file__).parent))
+
+from log_timeline import utc_offset_of
+
+INDEX_VERSION = 1
+
+# Rows inserted per transaction while building
+INSERT_BATCH_SIZE = 200_000
+
+ERROR_LEVELS = ('Error', 'Fault')
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    ts INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    level TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    process TEXT NOT NULL,
+    subsystem TEXT NOT NULL,
+    category TEXT NOT NULL,
+    thread_id TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE entries_fts USING fts5(message, content='entries', content_rowid='id');
+"""
+
+# Built after the bulk insert; maintaining them row by row is much slower
+INDEXES = """
+CREATE INDEX entries_level_ts ON entries (level, ts);
+CREATE INDEX entries_process_ts ON entries (process, ts);
+INSERT INTO entries_fts (entries_fts) VALUES ('rebuild');
+"""
+
+ENTRY_COLUMNS = "id, timestamp, level, pid, process, subsystem, category, message"
+
+
+class LogIndexError(Exception):
+    """Raised when an index cannot be built, opened, or queried."""
+    pass
+
+
+def build_index(path: str, rows: Iterable[Tuple], source: str = "",
+                utc_offset: str = "+0000") -> int:
+    """
+    Write a new index database from entry rows.
+
+    Args:
+        path: Database file to (over)write
+        rows: (ts, timestamp, level, pid, process, subsystem, category,
+            thread_id, message) tuples in log order
+        source: Log file the rows came from (recorded in meta)
+        utc_offset: The log's ±HHMM offset, used to read query times
+
+    Returns:
+        Number of entries written
+    """
+    target = Path(path)
+    temp = target.with_name(target.name + '.tmp')
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if temp.exists():
+            temp.unlink()
+        conn = sqlite3.connect(temp)
+        try:
+            # The temp file is discarded on failure, so durability is not needed
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.executescript(SCHEMA)
+            count = 0
+            batch: List[Tuple] = []
+            insert = ("INSERT INTO entries (ts, timestamp, level, pid, process, subsystem, category, "
+                      "thread_id, message) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)")
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= INSERT_BATCH_SIZE:
+                    with conn:
+                        conn.executemany(insert, batch)
+                    count += len(batch)
+                    batch = []
+            with conn:
+                conn.executemany(insert, batch)
+            count += len(batch)
+            conn.executescript(INDEXES)
+            with conn:
+                conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", [
+                    ("version", str(INDEX_VERSION)),
+                    ("source", source),
+                    ("utc_offset", utc_offset),
+                    ("entries", str(count)),
+                ])
+        finally:
+            conn.close()
+        os.replace(temp, target)
+    except (OSError, sqlite3.Error) as e:
+        raise LogIndexError(f"Could not write index {path}: {e}")
+    return count
+
+
+def open_index(path: str) -> sqlite3.Connection:
+    """Open an existing index read-only, checking its version."""
+    if not os.path.exists(path):
+        raise LogIndexError(f"Index not found: {path}")
+    try:
+        conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        version = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    except sqlite3.Error as e:
+        raise LogIndexError(f"Could not open index {path}: {e}")
+    if version is None or version[0] != str(INDEX_VERSION):
+        raise LogIndexError(f"{path} has unsupported index version {version[0] if version else None}")
+    return conn
+
+
+def index_meta(conn: sqlite3.Connection) -> Dict[str, str]:
+    """The meta key/value pairs of an index."""
+    return {row[0]: row[1] for row in conn.execute("SELECT key, value FROM meta")}
+
+
+def to_epoch_micros(value: str, utc_offset: str) -> int:
+    """
+    Epoch microseconds for a query time.
+
+    Args:
+        value: "YYYY-MM-DD HH:MM[:SS[.ffffff]]", optionally with a UTC offset;
+            times without one are in the log's own timezone
+        utc_offset: The log's ±HHMM offset
+    """
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise LogIndexError(f"Invalid time {value!r}; expected YYYY-MM-DD HH:MM[:SS]")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=utc_offset_of(utc_offset))
+    return (moment - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1)
+
+
+def _filters(process: Optional[str], since: Optional[int], until: Optional[int],
+             levels: Optional[Sequence[str]], column_prefix: str = "") -> Tuple[str, List[Any]]:
+    """SQL conditions and parameters for the common entry filters."""
+    conditions, params = [], []
+    if levels:
+        conditions.append(f"{column_prefix}level IN ({', '.join('?' * len(levels))})")
+        params.extend(levels)
+    if process is not None:
+        conditions.append(f"{column_prefix}process = ?")
+        params.append(process)
+    if since is not None:
+        conditions.append(f"{column_prefix}ts >= ?")
+        params.append(since)
+    if until is not None:
+        conditions.append(f"{column_prefix}ts < ?")
+        params.append(until)
+    return " AND ".join(conditions) or "1", params
+
+
+def query_entries(conn: sqlite3.Connection, process: Optional[str] = None,
+                  since: Optional[int] = None, until: Optional[int] = None,
+                  levels: Optional[Sequence[str]] = ERROR_LEVELS,
+                  limit: Optional[int] = None) -> List[sqlite3.Row]:
+    """
+    Entries matching level/process/time filters, in log order.
+
+    Args:
+        conn: Open index
+        process: Exact process name
+        since: Inclusive lower bound, epoch microseconds
+        until: Exclusive upper bound, epoch microseconds
+        levels: Levels to include (default: Error and Fault; None = all)
+        limit: Maximum rows
+    """
+    where, params = _filters(process, since, until, levels)
+    sql = f"SELECT {ENTRY_COLUMNS} FROM entries WHERE {where} ORDER BY ts, id"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    try:
+        return conn.execute(sql, params).fetchall()
+    except sqlite3.Error as e:
+        raise LogIndexError(f"Query failed: {e}")
+
+
+def search_entries(conn: sqlite3.Connection, text: str, process: Optional[str] = None,
+                   since: Optional[int] = None, until: Optional[int] = None,
+                   levels: Optional[Sequence[str]] = None,
+                   limit: Optional[int] = None) -> List[sqlite3.Row]:
+    """
+    Full-text search over messages (FTS5 query syntax), in log order.
+
+    Args:
+        conn: Open index
+        text: FTS5 query, e.g. 'ACPI AND checksum' or '"connection invalidated"'
+        process, since, until, levels, limit: As for query_entries (all levels by default)
+    """
+    where, params = _filters(process, since, until, levels, column_prefix="e.")
+    sql = (f"SELECT {', '.join('e.' + column for column in ENTRY_COLUMNS.split(', '))} "
+           f"FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid "
+           f"WHERE entries_fts MATCH ? AND {where} ORDER BY e.id")
+    params.insert(0, text)
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    try:
+        return conn.execute(sql, params).fetchall()
+    except sqlite3.Error as e:
+        raise LogIndexError(f"Search failed: {e}")
+
+
+def format_row(row: sqlite3.Row) -> str:
+    """One result row rendered like the original log line."""
+    return (f"{row['timestamp']} {row['level']:<7} {row['process']}[{row['pid']}]: "
+            f"({row['subsystem']}) [{row['category']}] {row['message']}")
+
+
+def main():
+    """Query CLI for an index written by parse_macos_logs.py --index."""
+    parser = argparse.ArgumentParser(description="Query a Phase 1 log index (parse_macos_logs.py --index)")
+    parser.add_argument("index", help="Index database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    errors = commands.add_parser("errors", help="Error/Fault entries, optionally for one process and time range")
+    search = commands.add_parser("search", help="Full-text search over messages (FTS5 syntax)")
+    search.add_argument("query", help="e.g. 'ACPI AND checksum', '\"connection invalidated\"', 'sandbox*'")
+    for command in (errors, search):
+        command.add_argument("--process", help="Only this process (exact name)")
+        command.add_argument("--since", metavar="TIME", help="From this time (inclusive), log timezone unless given")
+        command.add_argument("--until", metavar="TIME", help="Up to this time (exclusive)")
+        command.add_argument("--limit", type=int, default=100, help="Maximum rows (default: 100, 0 = all)")
+    errors.add_argument("--all-levels", action="store_true", help="Include every level, not just Error/Fault")
+    search.add_argument("--errors", action="store_true", help="Only Error/Fault entries")
+    args = parser.parse_args()
+
+    try:
+        conn = open_index(args.index)
+        utc_offset = index_meta(conn).get("utc_offset", "+0000")
+        since = to_epoch_micros(args.since, utc_offset) if args.since else None
+        until = to_epoch_micros(args.until, utc_offset) if args.until else None
+        limit = args.limit or None
+        if args.command == "errors":
+            rows = query_entries(conn, args.process, since, until,
+                                 levels=None if args.all_levels else ERROR_LEVELS, limit=limit)
+        else:
+            rows = search_entries(conn, args.query, args.process, since, until,
+                                  levels=ERROR_LEVELS if args.errors else None, limit=limit)
+    except LogIndexError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for row in rows:
+        print(format_row(row))
+    print(f"({len(rows)} {'row' if len(rows) == 1 else 'rows'}"
+          f"{', limit reached' if limit is not None and len(rows) == limit else ''})", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
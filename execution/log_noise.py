@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Known-noise store: error templates to ignore across captures.
+
+Benign faults reappear in every capture and crowd new problems out of the
+root-cause ranking. Their (process, message template) pairs can be recorded
+once as known noise; later runs then leave them out of root causes and
+causal chains, so only novel templates are surfaced:
+
+    parse_macos_logs.py baseline.txt --learn-noise .tmp/known_noise.bin
+    parse_macos_logs.py today.txt --noise .tmp/known_noise.bin
+
+Templates are kept as 64-bit BLAKE2b fingerprints: on disk a sorted array
+after a short header, in memory a set, so a membership check is one hash
+lookup. A template the miner generalizes differently in a later capture
+(e.g. one more <*>) has a different fingerprint; learn from that capture too.
+"""
+
+import hashlib
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Set, Tuple
+
+NOISE_MAGIC = b'HVNOISE1'
+
+
+class NoiseStoreError(Exception):
+    """Raised when a known-noise store cannot be read or written."""
+    pass
+
+
+def template_fingerprint(process: str, template: str) -> int:
+    """64-bit fingerprint of a (process, message template) pair."""
+    digest = hashlib.blake2b(f"{process}\0{template}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class NoiseStore:
+    """Set of known-noise template fingerprints, persisted as a sorted uint64 array."""
+
+    def __init__(self, path: str):
+        """
+        Open a store, loading its fingerprints if the file exists.
+
+        Args:
+            path: Store file (created by save())
+        """
+        self.path = Path(path)
+        self._fingerprints: Set[int] = set()
+        if self.path.exists():
+            self._load()
+
+    def _load(self):
+        try:
+            data = self.path.read_bytes()
+        except OSError as e:
+            raise NoiseStoreError(f"Could not read noise store {self.path}: {e}")
+        if not data.startswith(NOISE_MAGIC) or (len(data) - len(NOISE_MAGIC)) % 8:
+            raise NoiseStoreError(f"{self.path} is not a known-noise store")
+        fingerprints = array('Q')
+        fingerprints.frombytes(data[len(NOISE_MAGIC):])
+        if sys.byteorder == 'big':
+            fingerprints.byteswap()
+        self._fingerprints = set(fingerprints)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        return fingerprint in self._fingerprints
+
+    def is_known(self, process: str, template: str) -> bool:
+        """True if the (process, template) pair was recorded as noise."""
+        return template_fingerprint(process, template) in self._fingerprints
+
+    def add(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        Record (process, template) pairs as noise.
+
+        Returns:
+            Number of pairs that were not known yet
+        """
+        before = len(self._fingerprints)
+        self._fingerprints.update(template_fingerprint(process, template) for process, template in pairs)
+        return len(self._fingerprints) - before
+
+    def save(self):
+        """Write the store atomically (temp file + rename)."""
+        fingerprints = array('Q', sorted(self._fingerprints))
+        if sys.byteorder == 'big':
+            fingerprints.byteswap()
+        temp = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp, 'wb') as f:
+                f.write(NOISE_MAGIC)
+                f.write(fingerprints.tobytes())
+            os.replace(temp, self.path)
+        except OSError as e:
+            raise NoiseStoreError(f"Could not write noise store {self.path}: {e}")
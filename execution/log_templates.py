@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Online log message template mining (Drain-style) for the log resolution framework.
+
+Messages that differ only in variable parts (PIDs, addresses, UUIDs, counts)
+are grouped under one template such as:
+
+    Memory allocation of <*> bytes failed
+
+How it works:
+- Variable tokens are masked with regexes (mask_message)
+- Messages are routed through a fixed-depth prefix tree keyed by token count
+  and the first few tokens, so each lookup touches a bounded number of nodes
+- At the leaf, the message joins the most similar cluster (or starts a new
+  one); positions where cluster members disagree become <*>
+
+Memory grows with the number of distinct templates, not the number of lines.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+WILDCARD = '<*>'
+
+# Variable tokens masked out of messages when deriving a message template:
+# UUIDs, hex literals/addresses, and numbers (standalone or embedded in paths/ids)
+MESSAGE_VARIABLE_PATTERN = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|0x[0-9a-fA-F]+'
+    r'|\d+'
+)
+
+
+def mask_message(message: str) -> str:
+    """Replace variable tokens (UUIDs, hex values, numbers) in a message with <*>."""
+    return MESSAGE_VARIABLE_PATTERN.sub(WILDCARD, message)
+
+
+class LogCluster:
+    """A group of messages sharing one template."""
+
+    __slots__ = ('cluster_id', 'tokens', 'size')
+
+    def __init__(self, cluster_id: int, tokens: List[str]):
+        self.cluster_id = cluster_id
+        self.tokens = tokens
+        self.size = 0
+
+    @property
+    def template(self) -> str:
+        return ' '.join(self.tokens)
+
+
+class TemplateMiner:
+    """
+    Drain-style online template miner.
+
+    Usage:
+        miner = TemplateMiner()
+        cluster_id = miner.add_message("Connection 42 invalidated after timeout")
+        print(miner.template(cluster_id))  # Connection <*> invalidated after timeout
+    """
+
+    def __init__(self, depth: int = 4, similarity_threshold: float = 0.4,
+                 max_children: int = 100, cache_size: int = 4096):
+        """
+        Initialize an empty miner.
+
+        Args:
+            depth: Tree depth; the first (depth - 2) tokens route a message
+            similarity_threshold: Minimum fraction of matching tokens to join a cluster
+            max_children: Branching limit per node before tokens fall into <*>
+            cache_size: Recently seen masked messages remembered for a direct hit
+        """
+        if depth < 3:
+            raise ValueError("depth must be at least 3")
+        self.depth = depth
+        self.similarity_threshold = similarity_threshold
+        self.max_children = max_children
+        self.cache_size = cache_size
+        self.clusters: List[LogCluster] = []
+        # token count -> nested {token: node}; leaf nodes keep cluster ids under None
+        self.root: Dict[int, dict] = {}
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+    def template(self, cluster_id: int) -> str:
+        """Current template text of a cluster."""
+        return self.clusters[cluster_id].template
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-compatible state; from_dict(to_dict()) goes on assigning the same
+        cluster ids as this miner would.
+        """
+        def encode(node: dict) -> Dict[str, Any]:
+            return {
+                "children": {token: encode(child) for token, child in node.items() if token is not None},
+                "clusters": node.get(None),
+            }
+
+        return {
+            "depth": self.depth,
+            "similarity_threshold": self.similarity_threshold,
+            "max_children": self.max_children,
+            "cache_size": self.cache_size,
+            "clusters": [[cluster.tokens, cluster.size] for cluster in self.clusters],
+            "root": {str(length): encode(node) for length, node in self.root.items()},
+            "cache": list(self._cache.items()),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TemplateMiner':
+        """Rebuild a miner saved with to_dict()."""
+        def decode(encoded: Dict[str, Any]) -> dict:
+            node = {token: decode(child) for token, child in encoded["children"].items()}
+            if encoded["clusters"] is not None:
+                node[None] = list(encoded["clusters"])
+            return node
+
+        miner = cls(depth=data["depth"], similarity_threshold=data["similarity_threshold"],
+                    max_children=data["max_children"], cache_size=data["cache_size"])
+        for cluster_id, (tokens, size) in enumerate(data["clusters"]):
+            cluster = LogCluster(cluster_id, list(tokens))
+            cluster.size = size
+            miner.clusters.append(cluster)
+        miner.root = {int(length): decode(node) for length, node in data["root"].items()}
+        miner._cache.update((masked, cluster_id) for masked, cluster_id in data["cache"])
+        return miner
+
+    def add_message(self, message: str) -> int:
+        """
+        Assign a message to a cluster, creating or generalizing one as needed.
+
+        Returns:
+            Cluster id (stable for the lifetime of the miner)
+        """
+        masked = mask_message(message)
+        cache = self._cache
+        cluster_id = cache.get(masked)
+        if cluster_id is not None:
+            cache.move_to_end(masked)
+            self.clusters[cluster_id].size += 1
+            return cluster_id
+
+        tokens = masked.split()
+        leaf = self._leaf(tokens)
+        cluster = self._best_match(leaf, tokens)
+        if cluster is None:
+            cluster = LogCluster(len(self.clusters), tokens)
+            self.clusters.append(cluster)
+            leaf.append(cluster.cluster_id)
+        else:
+            cluster.tokens = [t if t == token else WILDCARD
+                              for t, token in zip(cluster.tokens, tokens)]
+        cluster.size += 1
+
+        cache[masked] = cluster.cluster_id
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return cluster.cluster_id
+
+    def _leaf(self, tokens: List[str]) -> List[int]:
+        """Walk (and grow) the prefix tree; return the leaf's cluster id list."""
+        node = self.root.setdefault(len(tokens), {})
+        for token in tokens[:self.depth - 2]:
+            if WILDCARD in token:
+                token = WILDCARD
+            child = node.get(token)
+            if child is None:
+                if token != WILDCARD and len(node) >= self.max_children:
+                    token = WILDCARD
+                    child = node.get(token)
+                if child is None:
+                    child = node[token] = {}
+            node = child
+        return node.setdefault(None, [])
+
+    def _best_match(self, leaf: List[int], tokens: List[str]) -> Optional[LogCluster]:
+        """Most similar cluster in a leaf, if it clears the similarity threshold."""
+        best: Optional[LogCluster] = None
+        best_score: Tuple[float, int] = (-1.0, -1)
+        for cluster_id in leaf:
+            cluster = self.clusters[cluster_id]
+            same = params = 0
+            for t, token in zip(cluster.tokens, tokens):
+                if t == token:
+                    same += 1
+                elif t == WILDCARD:
+                    params += 1
+            score = (same / len(tokens) if tokens else 1.0, params)
+            if score > best_score:
+                best, best_score = cluster, score
+        if best is not None and best_score[0] >= self.similarity_threshold:
+            return best
+        return None
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Time-bucketed error counts and burst detection for the log resolution framework.
+
+Errors are counted per minute of log time. The per-minute series is rendered
+as a scaled bar chart and fed through an online EWMA/z-score detector that
+flags the minutes where the error rate spikes above its recent baseline:
+
+    histogram = ErrorHistogram.from_minutes(error_minutes)
+    for burst in find_bursts(histogram):
+        print(burst.first_minute, burst.errors)
+
+numpy is used for counting and rebinning when installed; otherwise the same
+results are produced with the standard library.
+"""
+
+import math
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+MICROS_PER_MINUTE = 60_000_000
+
+# Width in characters of a full-scale bar
+BAR_WIDTH = 40
+
+# Partial blocks for the fractional end of a bar, in eighths
+_BAR_EIGHTHS = ('', '▏', '▎', '▍', '▌', '▋', '▊', '▉')
+
+# Burst detector defaults: EWMA smoothing, z-score to flag, minimum errors in
+# a flagged minute, and minutes of baseline before anything can be flagged
+BURST_ALPHA = 0.3
+BURST_Z_THRESHOLD = 3.0
+BURST_MIN_COUNT = 5
+BURST_WARMUP = 5
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=65536)
+def _epoch_minute(day: str, hhmm: str, utc_offset: str) -> int:
+    """Epoch minute of "YYYY-MM-DD", "HH:MM" and "±HHMM", by calendar arithmetic."""
+    hour, minute = int(hhmm[:2]), int(hhmm[3:5])
+    if hour > 23 or minute > 59:
+        raise ValueError(f"invalid time {hhmm!r}")
+    offset = int(utc_offset[1:3]) * 60 + int(utc_offset[3:5])
+    ordinal = date(int(day[:4]), int(day[5:7]), int(day[8:10])).toordinal()
+    return ((ordinal - _EPOCH_ORDINAL) * 1440 + hour * 60 + minute
+            - (offset if utc_offset[0] == '+' else -offset))
+
+
+class TimestampDecoder:
+    """
+    Decodes unified-log timestamps to epoch microseconds.
+
+    Consecutive log lines almost always share their date, hour, minute and
+    UTC offset, so the decoder remembers the last "YYYY-MM-DD HH:MM" prefix,
+    offset and their epoch value; while they repeat, only the seconds and the
+    fraction are parsed. Other prefixes go through a shared LRU cache.
+
+    Usage:
+        decode = TimestampDecoder()
+        micros = [decode(timestamp) for timestamp in timestamps]
+    """
+
+    __slots__ = ('_last',)
+
+    def __init__(self):
+        # (prefix, offset, epoch micros of the prefix's minute), replaced as one tuple
+        self._last = ('', '', 0)
+
+    def __call__(self, timestamp: str) -> int:
+        # Canonical form "YYYY-MM-DD HH:MM:SS.ffffff±HHMM"
+        if len(timestamp) == 31 and timestamp[10] == ' ':
+            prefix, offset, base = self._last
+            if timestamp[:16] != prefix or timestamp[26:] != offset:
+                prefix, offset = timestamp[:16], timestamp[26:]
+                base = _epoch_minute(prefix[:10], prefix[11:], offset) * MICROS_PER_MINUTE
+                self._last = (prefix, offset, base)
+            return base + int(timestamp[17:19]) * 1_000_000 + int(timestamp[20:26])
+
+        # Other fraction lengths or separators
+        day, clock = timestamp.split(None, 1)
+        seconds, _, fraction = clock[6:-5].partition('.')
+        return (_epoch_minute(day, clock[:5], clock[-5:]) * MICROS_PER_MINUTE
+                + int(seconds) * 1_000_000 + int(fraction[:6].ljust(6, '0')))
+
+
+# Shared by epoch_micros() and LogEntry, which decode one timestamp at a time
+_decode = TimestampDecoder()
+
+
+def epoch_minute(timestamp: str) -> int:
+    """
+    Minutes since the Unix epoch for a unified-log timestamp.
+
+    Args:
+        timestamp: e.g. "2026-01-08 10:23:45.123456-0500"
+    """
+    day, clock = timestamp.split(None, 1)
+    return _epoch_minute(day, clock[:5], clock[-5:])
+
+
+def epoch_micros(timestamp: str) -> int:
+    """
+    Microseconds since the Unix epoch for a unified-log timestamp.
+
+    Args:
+        timestamp: e.g. "2026-01-08 10:23:45.123456-0500"
+    """
+    return _decode(timestamp)
+
+
+def utc_offset_of(timestamp: str) -> timezone:
+    """Fixed timezone of a unified-log timestamp's trailing ±HHMM offset."""
+    offset = timestamp[-5:]
+    minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+    return timezone(timedelta(minutes=-minutes if offset[0] == '-' else minutes))
+
+
+def format_minute(minute: int, tz: timezone) -> str:
+    """Render an epoch minute as "YYYY-MM-DD HH:MM" in the log's timezone."""
+    return datetime.fromtimestamp(minute * 60, tz).strftime('%Y-%m-%d %H:%M')
+
+
+def render_bar(count: float, max_count: float, width: int = BAR_WIDTH) -> str:
+    """
+    Bar for count, scaled so max_count spans width characters.
+
+    Fractions of a character are drawn with eighth blocks, and any non-zero
+    count gets at least a sliver, so small values stay visible next to large ones.
+    """
+    if count <= 0 or max_count <= 0:
+        return ''
+    eighths = max(1, round(count * width * 8 / max_count))
+    full, partial = divmod(eighths, 8)
+    return '█' * full + _BAR_EIGHTHS[partial]
+
+
+class ErrorHistogram:
+    """Dense error counts per fixed-width bucket of log time."""
+
+    def __init__(self, first_minute: int, bucket_minutes: int, counts: Sequence[int]):
+        """
+        Args:
+            first_minute: Epoch minute at which bucket 0 starts
+            bucket_minutes: Width of each bucket in minutes
+            counts: Errors per bucket (numpy int64 array or array('q'))
+        """
+        self.first_minute = first_minute
+        self.bucket_minutes = bucket_minutes
+        self.counts = counts
+
+    @classmethod
+    def from_minutes(cls, minutes: Sequence[int]) -> Optional['ErrorHistogram']:
+        """Per-minute histogram of a sequence of epoch minutes (None if empty)."""
+        if not len(minutes):
+            return None
+        if NUMPY_AVAILABLE:
+            values = np.frombuffer(minutes, dtype=np.int64) if isinstance(minutes, array) \
+                else np.asarray(minutes, dtype=np.int64)
+            first = int(values.min())
+            return cls(first, 1, np.bincount(values - first))
+        first = min(minutes)
+        counts = array('q', bytes(8 * (max(minutes) - first + 1)))
+        for minute in minutes:
+            counts[minute - first] += 1
+        return cls(first, 1, counts)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def bucket_start(self, index: int) -> int:
+        """Epoch minute at which bucket index starts."""
+        return self.first_minute + index * self.bucket_minutes
+
+    def rebin(self, max_buckets: int) -> 'ErrorHistogram':
+        """Merge adjacent buckets so that at most max_buckets remain."""
+        factor = math.ceil(len(self.counts) / max_buckets)
+        if factor <= 1:
+            return self
+        if NUMPY_AVAILABLE:
+            counts = np.add.reduceat(np.asarray(self.counts), np.arange(0, len(self.counts), factor))
+        else:
+            counts = array('q', (sum(self.counts[i:i + factor])
+                                 for i in range(0, len(self.counts), factor)))
+        return ErrorHistogram(self.first_minute, self.bucket_minutes * factor, counts)
+
+
+class BurstDetector:
+    """
+    Online spike detector over a stream of per-bucket counts.
+
+    Keeps an exponentially weighted mean and variance of past counts; a count
+    is a burst when its z-score against that baseline reaches the threshold.
+    State is a few numbers, so it can follow an unbounded stream.
+    """
+
+    def __init__(self, alpha: float = BURST_ALPHA, threshold: float = BURST_Z_THRESHOLD,
+                 min_count: int = BURST_MIN_COUNT, warmup: int = BURST_WARMUP):
+        """
+        Args:
+            alpha: EWMA smoothing factor (higher adapts faster)
+            threshold: z-score at or above which a count is a burst
+            min_count: Counts below this are never bursts
+            warmup: Counts observed before bursts can be flagged
+        """
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_count = min_count
+        self.warmup = warmup
+        self.mean = 0.0
+        self.variance = 0.0
+        self.seen = 0
+
+    def update(self, count: float) -> Optional[float]:
+        """
+        Score count against the baseline, then fold it into the baseline.
+
+        Returns:
+            The z-score if count is a burst, otherwise None
+        """
+        # Floor the deviation at one error so a flat baseline does not turn
+        # every small wobble into an infinite z-score
+        z = (count - self.mean) / max(math.sqrt(self.variance), 1.0)
+        is_burst = self.seen >= self.warmup and count >= self.min_count and z >= self.threshold
+
+        diff = count - self.mean
+        increment = self.alpha * diff
+        self.mean += increment
+        # The spread is only learned from normal buckets: a spike must not
+        # widen its own baseline, while the mean still drifts towards a
+        # sustained new level until it stops being flagged
+        if not is_burst:
+            self.variance = (1 - self.alpha) * (self.variance + diff * increment)
+        self.seen += 1
+        return z if is_burst else None
+
+
+class Burst:
+    """A run of consecutive buckets flagged by the burst detector."""
+
+    __slots__ = ('first_minute', 'last_minute', 'errors', 'peak', 'max_z')
+
+    def __init__(self, first_minute: int, last_minute: int, errors: int, peak: int, max_z: float):
+        self.first_minute = first_minute
+        self.last_minute = last_minute
+        self.errors = errors
+        self.peak = peak
+        self.max_z = max_z
+
+    def __contains__(self, minute: int) -> bool:
+        return self.first_minute <= minute <= self.last_minute
+
+
+def find_bursts(histogram: Optional[ErrorHistogram],
+                detector: Optional[BurstDetector] = None) -> List[Burst]:
+    """
+    Run a burst detector over a histogram and merge adjacent flagged buckets.
+
+    Args:
+        histogram: Error counts per bucket (None yields no bursts)
+        detector: Detector to use (default: BurstDetector())
+
+    Returns:
+        Bursts in chronological order
+    """
+    if histogram is None:
+        return []
+    detector = detector or BurstDetector()
+    bursts: List[Burst] = []
+    current: Optional[Burst] = None
+    for index, count in enumerate(_as_ints(histogram.counts)):
+        z = detector.update(count)
+        if z is None:
+            current = None
+            continue
+        start = histogram.bucket_start(index)
+        end = start + histogram.bucket_minutes - 1
+        if current is None:
+            current = Burst(start, end, count, count, z)
+            bursts.append(current)
+        else:
+            current.last_minute = end
+            current.errors += count
+            current.peak = max(current.peak, count)
+            current.max_z = max(current.max_z, z)
+    return bursts
+
+
+def _as_ints(counts: Sequence[int]) -> Iterable[int]:
+    """Plain ints from either counts container (numpy scalars are slow to iterate)."""
+    return counts.tolist() if NUMPY_AVAILABLE and isinstance(counts, np.ndarray) else counts
+
+
+def iter_histogram_lines(histogram: ErrorHistogram, tz: timezone,
+                         max_rows: int = 60) -> Iterator[str]:
+    """Render a histogram as one scaled bar per bucket, at most max_rows rows."""
+    shown = histogram.rebin(max_rows)
+    counts = list(_as_ints(shown.counts))
+    peak = max(counts)
+    width = len(str(peak))
+    for index, count in enumerate(counts):
+        label = format_minute(shown.bucket_start(index), tz)
+        yield f"{label}  [{count:>{width}}] {render_bar(count, peak)}".rstrip()
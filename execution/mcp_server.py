@@ -61,12 +61,14 @@ from execution.mcp_tools.mindmap_tools import MindMapManager
 # Initialize managers
 try:
     todo_file = Path(os.getenv("MCP_TODO_FILE", ".tmp/user_data/todos.json"))
+    todo_backend = os.getenv("MCP_TODO_BACKEND", "json")
     mindmap_dir = Path(os.getenv("MCP_MINDMAP_DIR", ".tmp/user_data/mindmaps"))
+    mindmap_backend = os.getenv("MCP_MINDMAP_BACKEND", "json")
     reminder_list = os.getenv("MCP_REMINDER_LIST_NAME", "Claude Reminders")
 
     reminder_mgr = ReminderManager(reminder_list)
-    todo_mgr = TodoManager(todo_file)
-    mindmap_mgr = MindMapManager(mindmap_dir)
+    todo_mgr = TodoManager(todo_file, backend=todo_backend)
+    mindmap_mgr = MindMapManager(mindmap_dir, backend=mindmap_backend)
 
     logger.info("All managers initialized successfully")
 except Exception as e:
@@ -5,18 +5,26 @@ This package provides tool implementations for the MCP server:
 - reminder_tools: macOS Reminders integration
 - todo_tools: TODO list management
 - mindmap_tools: Mind mapping functionality
-- storage: JSON storage abstraction
+- storage: JSON storage abstraction (plain or journaled TODO storage)
+- sqlite_storage: SQLite TODO and mind map storage (WAL, indexed filters)
 """
 
 from .reminder_tools import ReminderManager
 from .todo_tools import TodoManager
 from .mindmap_tools import MindMapManager
-from .storage import TodoStorage, MindMapStorage
+from .storage import TodoStorage, JournaledTodoStorage, MindMapStorage, open_todo_storage, \
+    open_mindmap_storage
+from .sqlite_storage import SQLiteTodoStorage, SQLiteMindMapStorage
 
 __all__ = [
     'ReminderManager',
     'TodoManager',
     'MindMapManager',
     'TodoStorage',
+    'JournaledTodoStorage',
     'MindMapStorage',
+    'open_todo_storage',
+    'open_mindmap_storage',
+    'SQLiteTodoStorage',
+    'SQLiteMindMapStorage',
 ]
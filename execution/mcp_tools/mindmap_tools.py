@@ -13,7 +13,7 @@ from dataclasses import dataclass, asdict, field
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
-from .storage import MindMapStorage
+from .storage import open_mindmap_storage
 
 logger = logging.getLogger("mcp_server.mindmap_tools")
 
@@ -161,15 +161,16 @@ class MindMapManager:
         print(result.message)
     """
 
-    def __init__(self, mindmaps_dir: Path):
+    def __init__(self, mindmaps_dir: Path, backend: str = "json"):
         """
         Initialize mind map manager.
 
         Args:
             mindmaps_dir: Directory for mind map storage
+            backend: Storage backend: json or sqlite (see storage.open_mindmap_storage)
         """
-        self.storage = MindMapStorage(mindmaps_dir)
-        logger.info(f"MindMap manager initialized with storage: {mindmaps_dir}")
+        self.storage = open_mindmap_storage(mindmaps_dir, backend)
+        logger.info(f"MindMap manager initialized with {backend} storage: {mindmaps_dir}")
 
     def _generate_mindmap_id(self) -> str:
         """
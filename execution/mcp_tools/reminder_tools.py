@@ -344,7 +344,7 @@ class GenericReminderBackend(ReminderBackend):
     def list_reminders(self) -> List[ReminderItem]:
         """List reminders from JSON storage."""
         try:
-            data = self.storage.read()
+            data = self.storage.read_view()
             if data is None:
                 return []
 
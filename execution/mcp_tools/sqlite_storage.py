@@ -0,0 +1,616 @@
+#!/usr/bin/env python3
+"""
+SQLite Storage Backend for MCP Thought-to-Action System
+
+Drop-in alternatives to the JSON stores in storage.py:
+- SQLiteTodoStorage: same interface as TodoStorage, one row per TODO
+- SQLiteMindMapStorage: same interface as MindMapStorage, one row per mind map
+
+Databases run in WAL mode, so readers never block the writer. TODO status,
+priority and due_date are indexed columns and tags live in a junction table,
+which lets query_todos() filter in SQL instead of loading every item.
+
+Existing JSON data is imported once with migrate_todos() / migrate_mindmaps()
+(see execution/migrate_to_sqlite.py).
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from .storage import (DEFAULT_LOCK_TIMEOUT, LockStats, StorageError, open_todo_storage,
+                      validate_todo_changes)
+
+logger = logging.getLogger("mcp_server.sqlite_storage")
+
+SCHEMA_VERSION = 1
+
+# TODO fields stored as columns; any other field is kept in the "extra" JSON column
+TODO_COLUMNS = ("id", "title", "description", "priority", "status",
+                "created_at", "updated_at", "due_date", "completed_at")
+
+TODO_SCHEMA = """
+CREATE TABLE IF NOT EXISTS todos (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,  -- insertion order, as in todos.json
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    priority TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT,
+    due_date TEXT,
+    completed_at TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS todos_status ON todos(status);
+CREATE INDEX IF NOT EXISTS todos_priority ON todos(priority);
+CREATE INDEX IF NOT EXISTS todos_due_date ON todos(due_date);
+CREATE TABLE IF NOT EXISTS todo_tags (
+    todo_seq INTEGER NOT NULL REFERENCES todos(seq) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (todo_seq, position)
+);
+CREATE INDEX IF NOT EXISTS todo_tags_tag ON todo_tags(tag, todo_seq);
+"""
+
+MINDMAP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mindmaps (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    document TEXT NOT NULL
+);
+"""
+
+# Selects a TODO row with its tags (in order) as a JSON array
+TODO_SELECT = f"""
+SELECT {', '.join('t.' + column for column in TODO_COLUMNS)}, t.extra,
+       (SELECT json_group_array(tag) FROM
+           (SELECT tag FROM todo_tags WHERE todo_seq = t.seq ORDER BY position)) AS tags
+FROM todos t
+"""
+
+TODO_INSERT = (f"INSERT INTO todos ({', '.join(TODO_COLUMNS)}, extra) "
+               f"VALUES ({', '.join('?' * (len(TODO_COLUMNS) + 1))})")
+
+
+def _extra_fields(todo: Mapping[str, Any]) -> Dict[str, Any]:
+    """Fields of a TODO that have no column of their own."""
+    return {key: value for key, value in todo.items() if key not in TODO_COLUMNS and key != "tags"}
+
+
+def _insert_tags(conn: sqlite3.Connection, seq: int, tags: Iterable[str]):
+    conn.executemany("INSERT INTO todo_tags (todo_seq, position, tag) VALUES (?, ?, ?)",
+                     [(seq, position, tag) for position, tag in enumerate(tags)])
+
+
+class SQLiteStorage:
+    """
+    Base class for SQLite-backed storage.
+
+    Features:
+    - WAL journal mode with synchronous=NORMAL
+    - busy timeout instead of a separate lock file
+    - Schema versioning in a meta table
+    - sqlite3 errors surfaced as StorageError
+    """
+
+    schema = ""
+
+    def __init__(self, db_path: Path, lock_timeout: float = DEFAULT_LOCK_TIMEOUT):
+        """
+        Open (and if needed create) a SQLite database.
+
+        Args:
+            db_path: Path to the database file
+            lock_timeout: Seconds to wait for another writer before raising StorageError
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock_timeout = lock_timeout
+        self.lock_stats = LockStats()
+        self._mutex = threading.RLock()
+        try:
+            self.conn = sqlite3.connect(str(self.db_path), timeout=lock_timeout,
+                                        isolation_level=None, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA foreign_keys=ON")
+            with self._write_txn() as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                self._create_schema(conn)
+                row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+                if row is None:
+                    conn.execute("INSERT INTO meta VALUES ('schema_version', ?)",
+                                 (str(SCHEMA_VERSION),))
+                elif int(row[0]) != SCHEMA_VERSION:
+                    raise StorageError(f"{self.db_path} has unsupported schema version {row[0]}")
+        except sqlite3.Error as e:
+            raise StorageError(f"Could not open {self.db_path}: {e}")
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        # executescript() would COMMIT the open transaction, so run statement by statement
+        for statement in self.schema.split(';'):
+            if statement.strip():
+                conn.execute(statement)
+
+    def _begin(self):
+        """BEGIN IMMEDIATE: try once without waiting, then wait up to lock_timeout."""
+        start = time.perf_counter()
+        contended = False
+        try:
+            self.conn.execute("PRAGMA busy_timeout = 0")
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError:
+                contended = True
+            finally:
+                self.conn.execute(f"PRAGMA busy_timeout = {int(self.lock_timeout * 1000)}")
+            if contended:
+                self.conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as e:
+            self.lock_stats.record(False, time.perf_counter() - start, contended, False)
+            raise StorageError(f"Could not lock {self.db_path} within {self.lock_timeout}s: {e}")
+        self.lock_stats.record(False, time.perf_counter() - start, contended, True)
+
+    @contextmanager
+    def _write_txn(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a write transaction (BEGIN IMMEDIATE ... COMMIT, rolled back on error).
+
+        Yields:
+            The connection
+        """
+        with self._mutex:
+            self._begin()
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            try:
+                self.conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self.conn.execute("ROLLBACK")
+                raise StorageError(f"Could not commit to {self.db_path}: {e}")
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """Run a read query and fetch all rows."""
+        with self._mutex:
+            try:
+                return self.conn.execute(sql, params).fetchall()
+            except sqlite3.Error as e:
+                raise StorageError(f"Query on {self.db_path} failed: {e}")
+
+    def close(self):
+        """Close the database connection."""
+        with self._mutex:
+            self.conn.close()
+
+
+class SQLiteTodoStorage(SQLiteStorage):
+    """
+    TODO storage in SQLite, with the TodoStorage interface.
+
+    Items are returned as plain dictionaries in the todos.json item format,
+    in insertion order.
+    """
+
+    schema = TODO_SCHEMA
+
+    @staticmethod
+    def _row_to_todo(row: tuple) -> Dict[str, Any]:
+        todo = dict(zip(TODO_COLUMNS, row))
+        todo["tags"] = json.loads(row[-1])
+        if row[-2]:
+            todo.update(json.loads(row[-2]))
+        return todo
+
+    def _insert(self, conn: sqlite3.Connection, todo: Mapping[str, Any]):
+        extra = _extra_fields(todo)
+        cursor = conn.execute(
+            TODO_INSERT,
+            [todo.get(column, "" if column == "description" else None) for column in TODO_COLUMNS]
+            + [json.dumps(extra) if extra else None])
+        _insert_tags(conn, cursor.lastrowid, todo.get("tags", []))
+
+    def import_todos(self, todos: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Append many TODO items in one transaction.
+
+        Args:
+            todos: TODO dictionaries in the todos.json item format
+
+        Returns:
+            Number of items inserted
+        """
+        count = 0
+        try:
+            with self._write_txn() as conn:
+                for todo in todos:
+                    self._insert(conn, todo)
+                    count += 1
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to import TODOs into {self.db_path}: {e}")
+        return count
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """
+        All TODOs as a todos.json document.
+
+        Returns:
+            Document owned by the caller
+        """
+        return {"version": "1.0", "last_updated": datetime.now().isoformat(),
+                "todos": self.get_all_todos()}
+
+    def write(self, data: Dict[str, Any]):
+        """
+        Replace all TODOs with those of a todos.json document.
+
+        Args:
+            data: todos.json document
+        """
+        try:
+            with self._write_txn() as conn:
+                self._replace_all(conn, data)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to write {self.db_path}: {e}")
+
+    def _replace_all(self, conn: sqlite3.Connection, data: Mapping[str, Any]):
+        conn.execute("DELETE FROM todos")
+        for todo in data.get("todos", []):
+            self._insert(conn, todo)
+
+    @contextmanager
+    def transaction(
+        self,
+        default: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Read-modify-write of the whole document in one write transaction,
+        like TodoStorage.transaction(): the block modifies the todos.json
+        document in place and all TODOs are replaced with it on exit.
+        Nothing is written if the block raises. Prefer add_todo / update /
+        delete_todo, which touch only one row.
+
+        Args:
+            default: Accepted for interface compatibility; the database always
+                holds a document, so it is never used
+
+        Yields:
+            todos.json document (owned by the transaction)
+        """
+        try:
+            with self._write_txn() as conn:
+                data = self.read()
+                yield data
+                self._replace_all(conn, data)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to write {self.db_path}: {e}")
+
+    def get_all_todos(self) -> List[Dict[str, Any]]:
+        """
+        Get all TODO items.
+
+        Returns:
+            List of TODO dictionaries
+        """
+        return [self._row_to_todo(row) for row in self._query(TODO_SELECT + "ORDER BY t.seq")]
+
+    def query_todos(
+        self,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        priority: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        TODO items matching every given filter, selected in SQL.
+
+        Args:
+            status: Only items with this status
+            tags: Only items carrying any of these tags
+            priority: Only items with this priority
+
+        Returns:
+            List of TODO dictionaries
+        """
+        conditions, params = [], []
+        if status:
+            conditions.append("t.status = ?")
+            params.append(status)
+        if priority:
+            conditions.append("t.priority = ?")
+            params.append(priority)
+        if tags:
+            placeholders = ', '.join('?' * len(tags))
+            conditions.append(f"t.seq IN (SELECT todo_seq FROM todo_tags "
+                              f"WHERE tag IN ({placeholders}))")
+            params.extend(tags)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        rows = self._query(TODO_SELECT + where + "ORDER BY t.seq", params)
+        return [self._row_to_todo(row) for row in rows]
+
+    def add_todo(self, todo: Dict[str, Any]) -> bool:
+        """
+        Add a new TODO item.
+
+        Args:
+            todo: TODO dictionary with all required fields
+
+        Returns:
+            True if added successfully
+        """
+        try:
+            with self._write_txn() as conn:
+                self._insert(conn, todo)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to add TODO {todo.get('id')}: {e}")
+        logger.info(f"Added TODO: {todo['id']}")
+        return True
+
+    def update(
+        self,
+        todo_id: str,
+        fn: Callable[[Mapping[str, Any]], Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a TODO item from its current state, in one write transaction.
+
+        Args:
+            todo_id: ID of TODO to update
+            fn: Called with the current item; returns the fields to update
+
+        Returns:
+            The updated TODO dictionary, or None if not found
+
+        Raises:
+            ValueError: fn changed the TODO's id (ids are immutable)
+        """
+        try:
+            with self._write_txn() as conn:
+                row = conn.execute("SELECT seq FROM todos WHERE id = ?", (todo_id,)).fetchone()
+                if row is None:
+                    logger.warning(f"TODO not found for update: {todo_id}")
+                    return None
+                seq = row[0]
+                todo = self._row_to_todo(conn.execute(TODO_SELECT + "WHERE t.seq = ?",
+                                                      (seq,)).fetchone())
+                updates = {**validate_todo_changes(todo_id, fn(todo)),
+                           "updated_at": datetime.now().isoformat()}
+                extra = _extra_fields(updates)
+                todo.update(updates)
+
+                columns = [column for column in TODO_COLUMNS if column in updates]
+                assignments = [f"{column} = ?" for column in columns]
+                params = [updates[column] for column in columns]
+                if extra:
+                    assignments.append("extra = ?")
+                    params.append(json.dumps(_extra_fields(todo)))
+                conn.execute(f"UPDATE todos SET {', '.join(assignments)} WHERE seq = ?",
+                             params + [seq])
+                if "tags" in updates:
+                    conn.execute("DELETE FROM todo_tags WHERE todo_seq = ?", (seq,))
+                    _insert_tags(conn, seq, updates["tags"])
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to update TODO {todo_id}: {e}")
+        logger.info(f"Updated TODO: {todo_id}")
+        return todo
+
+    def update_todo(self, todo_id: str, updates: Dict[str, Any]) -> bool:
+        """
+        Update an existing TODO item.
+
+        Args:
+            todo_id: ID of TODO to update
+            updates: Dictionary of fields to update
+
+        Returns:
+            True if updated, False if not found
+        """
+        return self.update(todo_id, lambda todo: updates) is not None
+
+    def delete_todo(self, todo_id: str) -> bool:
+        """
+        Delete a TODO item.
+
+        Args:
+            todo_id: ID of TODO to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        try:
+            with self._write_txn() as conn:
+                deleted = conn.execute("DELETE FROM todos WHERE id = ?", (todo_id,)).rowcount
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to delete TODO {todo_id}: {e}")
+        if not deleted:
+            logger.warning(f"TODO not found for deletion: {todo_id}")
+            return False
+        logger.info(f"Deleted TODO: {todo_id}")
+        return True
+
+    def get_todo_by_id(self, todo_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific TODO by ID.
+
+        Args:
+            todo_id: ID of TODO to retrieve
+
+        Returns:
+            TODO dictionary or None if not found
+        """
+        rows = self._query(TODO_SELECT + "WHERE t.id = ?", (todo_id,))
+        return self._row_to_todo(rows[0]) if rows else None
+
+
+class SQLiteMindMapStorage(SQLiteStorage):
+    """Mind map storage in SQLite, with the MindMapStorage interface."""
+
+    schema = MINDMAP_SCHEMA
+
+    def _save(self, mindmap: Dict[str, Any], created_at: Optional[str] = None):
+        with self._write_txn() as conn:
+            conn.execute(
+                "INSERT INTO mindmaps (id, title, created_at, document) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET title = excluded.title, document = excluded.document",
+                (mindmap["id"], mindmap["title"], created_at or datetime.now().isoformat(),
+                 json.dumps(mindmap)))
+
+    def save_mindmap(self, mindmap: Dict[str, Any]) -> bool:
+        """
+        Save a mind map.
+
+        Args:
+            mindmap: Mind map dictionary
+
+        Returns:
+            True if saved successfully
+        """
+        try:
+            self._save(mindmap)
+            logger.info(f"Saved mind map: {mindmap['id']}")
+            return True
+        except (sqlite3.Error, StorageError) as e:
+            logger.error(f"Error saving mind map {mindmap.get('id')}: {e}")
+            return False
+
+    def load_mindmap(self, mindmap_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a mind map.
+
+        Args:
+            mindmap_id: ID of mind map to load
+
+        Returns:
+            Mind map dictionary or None if not found
+        """
+        try:
+            rows = self._query("SELECT document FROM mindmaps WHERE id = ?", (mindmap_id,))
+        except StorageError as e:
+            logger.error(f"Error loading mind map {mindmap_id}: {e}")
+            return None
+        if not rows:
+            logger.warning(f"Mind map not found: {mindmap_id}")
+            return None
+        return json.loads(rows[0][0])
+
+    def delete_mindmap(self, mindmap_id: str) -> bool:
+        """
+        Delete a mind map.
+
+        Args:
+            mindmap_id: ID of mind map to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        try:
+            with self._write_txn() as conn:
+                deleted = conn.execute("DELETE FROM mindmaps WHERE id = ?", (mindmap_id,)).rowcount
+        except (sqlite3.Error, StorageError) as e:
+            logger.error(f"Error deleting mind map {mindmap_id}: {e}")
+            return False
+        if not deleted:
+            logger.warning(f"Mind map not found for deletion: {mindmap_id}")
+            return False
+        logger.info(f"Deleted mind map: {mindmap_id}")
+        return True
+
+    def list_mindmaps(self) -> List[Dict[str, str]]:
+        """
+        List all mind maps.
+
+        Returns:
+            List of {id, title, created_at} dictionaries
+        """
+        try:
+            rows = self._query("SELECT id, title, created_at FROM mindmaps ORDER BY seq")
+        except StorageError as e:
+            logger.error(f"Error listing mind maps: {e}")
+            return []
+        return [{"id": mindmap_id, "title": title, "created_at": created_at}
+                for mindmap_id, title, created_at in rows]
+
+
+def _is_empty(storage: SQLiteStorage, table: str) -> bool:
+    return not storage._query(f"SELECT 1 FROM {table} LIMIT 1")
+
+
+def migrate_todos(json_path: Path, db_path: Path, force: bool = False) -> int:
+    """
+    One-shot import of a todos.json (and its journal, if any) into SQLite.
+
+    Args:
+        json_path: Existing todos.json
+        db_path: Target database
+        force: Replace TODOs already in the database instead of refusing
+
+    Returns:
+        Number of TODOs migrated
+    """
+    json_path = Path(json_path)
+    if not json_path.exists():
+        raise StorageError(f"No TODO file at {json_path}")
+    backend = "journal" if Path(str(json_path) + ".journal").exists() else "json"
+    data = open_todo_storage(json_path, backend).read() or {"todos": []}
+
+    storage = SQLiteTodoStorage(db_path)
+    try:
+        if not force and not _is_empty(storage, "todos"):
+            raise StorageError(f"{db_path} already holds TODOs; use force to replace them")
+        storage.write(data)
+    finally:
+        storage.close()
+    logger.info(f"Migrated {len(data['todos'])} TODOs from {json_path} to {db_path}")
+    return len(data["todos"])
+
+
+def migrate_mindmaps(mindmaps_dir: Path, db_path: Path, force: bool = False) -> int:
+    """
+    One-shot import of a JSON mind map directory (index.json + {id}.json) into SQLite.
+
+    Args:
+        mindmaps_dir: Existing mind map directory
+        db_path: Target database
+        force: Replace mind maps already in the database instead of refusing
+
+    Returns:
+        Number of mind maps migrated
+    """
+    index_file = Path(mindmaps_dir) / "index.json"
+    if not index_file.exists():
+        raise StorageError(f"No mind map index at {index_file}")
+    with open(index_file, 'r') as f:
+        entries = json.load(f).get("mindmaps", [])
+
+    storage = SQLiteMindMapStorage(db_path)
+    migrated = 0
+    try:
+        if not _is_empty(storage, "mindmaps"):
+            if not force:
+                raise StorageError(f"{db_path} already holds mind maps; use force to replace them")
+            with storage._write_txn() as conn:
+                conn.execute("DELETE FROM mindmaps")
+        for entry in entries:
+            file_path = Path(mindmaps_dir) / f"{entry['id']}.json"
+            if not file_path.exists():
+                logger.warning(f"Skipping mind map missing on disk: {entry['id']}")
+                continue
+            with open(file_path, 'r') as f:
+                storage._save(json.load(f), created_at=entry.get("created_at"))
+            migrated += 1
+    finally:
+        storage.close()
+    logger.info(f"Migrated {migrated} mind maps from {mindmaps_dir} to {db_path}")
+    return migrated
@@ -2,8 +2,9 @@
 """
 JSON Storage Abstraction for MCP Thought-to-Action System
 
-Provides atomic writes, file locking, and backup utilities for:
-- TODO lists (todos.json)
+Provides atomic writes, reader/writer file locking, a validated in-process
+read cache, and backup utilities for:
+- TODO lists (todos.json, optionally with an append-only journal)
 - Mind maps (mindmaps/{id}.json)
 - System metadata (metadata.json)
 
@@ -12,20 +13,218 @@ Following existing patterns from agent_coordinator.py and cluster_stories.py.
 
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Iterator, List, Mapping, Optional, Sequence, Tuple
 import fcntl
 import time
 
 logger = logging.getLogger("mcp_server.storage")
 
+# Seconds to wait for a file lock before giving up
+DEFAULT_LOCK_TIMEOUT = 5.0
+
+# Parsed documents kept by the process-wide read cache
+DEFAULT_CACHE_ENTRIES = 64
+
+# TODO storage backends selectable by name (see open_todo_storage)
+TODO_BACKENDS = ("json", "journal", "sqlite")
+
+# Mind map storage backends selectable by name (see open_mindmap_storage)
+MINDMAP_BACKENDS = ("json", "sqlite")
+
+# When a journaled TodoStorage fsyncs its appends: every append, at most
+# once per FSYNC_INTERVAL seconds, or never (left to the OS)
+FSYNC_POLICIES = ("always", "interval", "never")
+FSYNC_INTERVAL = 1.0
+
+# Journal entries before compaction is considered; compaction then waits until
+# the journal holds at least as many entries as there are todos, which keeps
+# the snapshot rewrite amortized O(1) per mutation
+DEFAULT_COMPACT_THRESHOLD = 1000
+
 
 class StorageError(Exception):
     """Base exception for storage operations."""
     pass
 
 
+class LockStats:
+    """Thread-safe counters of lock acquisitions and the time spent waiting for them."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {"shared": 0, "exclusive": 0, "contended": 0, "timeouts": 0}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def record(self, shared: bool, waited: float, contended: bool, acquired: bool):
+        """Record one lock attempt."""
+        with self._lock:
+            if acquired:
+                self._counts["shared" if shared else "exclusive"] += 1
+            else:
+                self._counts["timeouts"] += 1
+            if contended:
+                self._counts["contended"] += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counts plus total and maximum lock-wait seconds."""
+        with self._lock:
+            return {
+                **self._counts,
+                "wait_seconds_total": self._wait_total,
+                "wait_seconds_max": self._wait_max,
+            }
+
+
+def _wait_for_flock(fd: int, operation: int, timeout: float) -> bool:
+    """
+    Block in flock() for at most timeout seconds, without polling.
+
+    flock() has no timeout of its own, so the blocking call runs in a helper
+    thread. If the timeout passes first, the waiter is abandoned: once it does
+    get the lock it releases it and closes fd itself.
+
+    Returns:
+        True if the lock is held on fd, False otherwise (fd is then closed by the waiter)
+    """
+    done = threading.Event()
+    guard = threading.Lock()
+    state = {"acquired": False, "abandoned": False}
+
+    def wait():
+        try:
+            fcntl.flock(fd, operation)
+            locked = True
+        except OSError:
+            locked = False
+        with guard:
+            if locked and not state["abandoned"]:
+                state["acquired"] = True
+            else:
+                if locked:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+        done.set()
+
+    threading.Thread(target=wait, name="flock-wait", daemon=True).start()
+    done.wait(timeout)
+    with guard:
+        state["abandoned"] = not state["acquired"]
+        return state["acquired"]
+
+
+def validate_todo_changes(todo_id: str, changes: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Check the fields an update returned; every TODO backend applies the same rule.
+
+    Raises:
+        ValueError: changes would give the TODO a different id
+    """
+    if changes.get("id", todo_id) != todo_id:
+        raise ValueError(f"Cannot change the id of TODO {todo_id}")
+    return changes
+
+
+def _freeze_list(items: list) -> tuple:
+    return tuple(_freeze_list(item) if type(item) is list else item for item in items)
+
+
+def _freeze_object(obj: dict) -> Mapping[str, Any]:
+    """json object_hook: objects become mappingproxies and their lists tuples."""
+    for key, value in obj.items():
+        if type(value) is list:
+            obj[key] = _freeze_list(value)
+    return MappingProxyType(obj)
+
+
+# JSON scalars, copied by reference in _thaw
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _thaw(value: Any) -> Any:
+    """Mutable deep copy of a read-only view (dicts and lists again)."""
+    # Exact type checks first: an isinstance test against the Mapping ABC
+    # costs more than parsing the value from JSON would
+    kind = type(value)
+    if kind is MappingProxyType or kind is dict:
+        return {key: item if type(item) in _JSON_SCALARS else _thaw(item) for key, item in value.items()}
+    if kind is tuple or kind is list:
+        return [item if type(item) in _JSON_SCALARS else _thaw(item) for item in value]
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(st_mtime_ns, st_size, st_ino) of a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class DocumentCache:
+    """
+    Process-wide LRU cache of parsed JSON documents, as read-only views.
+
+    An entry is only served while the file's (st_mtime_ns, st_size, st_ino)
+    signature is unchanged, so writes by this or any other process (atomic
+    renames always change the inode) invalidate it. Views are built from
+    MappingProxyType and tuples, so callers cannot mutate the cached data.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # path -> (file signature, view), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int, int], Mapping[str, Any]]]" \
+            = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, key: str, signature: Tuple[int, int, int]) -> Optional[Mapping[str, Any]]:
+        """Cached view if its signature matches, else None; counts a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def put(self, key: str, signature: Tuple[int, int, int], view: Mapping[str, Any]):
+        """Cache a view, evicting the least recently used documents beyond max_entries."""
+        with self._lock:
+            self._entries[key] = (signature, view)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str):
+        """Drop a document from the cache."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Cumulative hits and misses, plus the number of cached documents."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+
+# Shared by every JSONStorage unless one is given its own
+DOCUMENT_CACHE = DocumentCache()
+
+
 class JSONStorage:
     """
     Base class for JSON file storage with atomic writes and file locking.
@@ -33,59 +232,85 @@ class JSONStorage:
     Features:
     - Automatic directory creation
     - Atomic writes (write to temp, then rename)
-    - File locking for concurrent access
+    - Reader/writer file locking: shared for reads, exclusive for write()
+    - Lock-wait metrics (lock_stats)
+    - Cached read-only views (read_view), validated against the file's
+      mtime, size and inode
     - Backup on corruption
     - Version tracking
     """
 
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+                 cache: Optional[DocumentCache] = None):
         """
         Initialize storage for a JSON file.
 
         Args:
             file_path: Path to the JSON file
+            lock_timeout: Seconds to wait for the file lock before raising StorageError
+            cache: Read cache for read_view() (default: the process-wide DOCUMENT_CACHE)
         """
         self.file_path = Path(file_path)
         self.lock_file = Path(str(file_path) + ".lock")
+        self.lock_timeout = lock_timeout
+        self.lock_stats = LockStats()
+        self.cache = cache if cache is not None else DOCUMENT_CACHE
+        self._cache_key = str(self.file_path.resolve())
         self._ensure_directory()
 
     def _ensure_directory(self):
         """Create parent directory if it doesn't exist."""
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def _acquire_lock(self, timeout: int = 5) -> Optional[int]:
+    def _acquire_lock(self, shared: bool = False, timeout: Optional[float] = None) -> Optional[int]:
         """
-        Acquire file lock with timeout.
+        Acquire the file lock, blocking until it is free or the timeout passes.
+
+        Readers share the lock; a writer holds it exclusively. The wait is
+        recorded in lock_stats.
 
         Args:
-            timeout: Maximum seconds to wait for lock
+            shared: Take a shared (read) lock instead of an exclusive one
+            timeout: Maximum seconds to wait (default: self.lock_timeout)
 
         Returns:
-            File descriptor if lock acquired, None otherwise
+            File descriptor holding the lock, None on timeout
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                fd = open(self.lock_file, 'w')
-                fcntl.flock(fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                return fd.fileno()
-            except (IOError, OSError):
-                time.sleep(0.1)  # Wait 100ms before retry
-
-        logger.warning(f"Failed to acquire lock for {self.file_path} after {timeout}s")
-        return None
+        timeout = self.lock_timeout if timeout is None else timeout
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        # The lock file is never unlinked: a waiter locking a deleted inode
+        # would not exclude a process that re-created the file
+        fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        start = time.perf_counter()
+        try:
+            fcntl.flock(fd, operation | fcntl.LOCK_NB)
+            self.lock_stats.record(shared, 0.0, contended=False, acquired=True)
+            return fd
+        except BlockingIOError:
+            pass
+        except OSError:
+            os.close(fd)
+            raise
+
+        acquired = _wait_for_flock(fd, operation, timeout)
+        waited = time.perf_counter() - start
+        self.lock_stats.record(shared, waited, contended=True, acquired=acquired)
+        if not acquired:
+            logger.warning(f"Failed to acquire lock for {self.file_path} after {timeout}s")
+            return None
+        logger.debug(f"Waited {waited * 1000:.1f}ms for {'shared' if shared else 'exclusive'} lock "
+                     f"on {self.file_path}")
+        return fd
 
     def _release_lock(self, fd: int):
         """Release file lock."""
         if fd is not None:
             try:
                 fcntl.flock(fd, fcntl.LOCK_UN)
-                import os
-                os.close(fd)
-                if self.lock_file.exists():
-                    self.lock_file.unlink()
-            except Exception as e:
+            except OSError as e:
                 logger.warning(f"Error releasing lock: {e}")
+            finally:
+                os.close(fd)
 
     def _read_raw(self) -> Optional[Dict[str, Any]]:
         """
@@ -108,6 +333,39 @@ class JSONStorage:
             logger.error(f"Error reading {self.file_path}: {e}")
             return None
 
+    def _read_view_raw(self) -> Optional[Mapping[str, Any]]:
+        """
+        Read-only view of the JSON file, from the cache when unchanged (internal use).
+
+        Returns:
+            Read-only view or None if file doesn't exist
+        """
+        signature = _file_signature(self.file_path)
+        if signature is None:
+            return None
+        view = self.cache.get(self._cache_key, signature)
+        if view is not None:
+            return view
+
+        try:
+            with open(self.file_path, 'r') as f:
+                view = json.load(f, object_hook=_freeze_object)
+            if type(view) is list:
+                view = _freeze_list(view)
+        except json.JSONDecodeError as e:
+            logger.error(f"Corrupted JSON in {self.file_path}: {e}")
+            self._backup_corrupted_file()
+            return None
+        except Exception as e:
+            logger.error(f"Error reading {self.file_path}: {e}")
+            return None
+        self.cache.put(self._cache_key, signature, view)
+        return view
+
+    def _encode(self, data: Dict[str, Any]) -> str:
+        """Serialize data for the file (pretty-printed JSON)."""
+        return json.dumps(data, indent=2)
+
     def _write_raw(self, data: Dict[str, Any]):
         """
         Write JSON file atomically without locking (internal use).
@@ -122,10 +380,12 @@ class JSONStorage:
         temp_file = Path(str(self.file_path) + ".tmp")
         try:
             with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(self._encode(data))
 
             # Atomic rename
             temp_file.replace(self.file_path)
+            # Drop the superseded view now rather than on the next signature check
+            self.cache.discard(self._cache_key)
             logger.debug(f"Wrote {self.file_path}")
         except Exception as e:
             logger.error(f"Error writing {self.file_path}: {e}")
@@ -150,12 +410,14 @@ class JSONStorage:
 
     def read(self) -> Optional[Dict[str, Any]]:
         """
-        Read JSON file with locking.
+        Read JSON file under a shared lock (concurrent readers don't block each other).
+
+        Always parses the file; use read_view() when the data is not modified.
 
         Returns:
-            Parsed JSON data or None if file doesn't exist
+            Parsed JSON data (owned by the caller) or None if file doesn't exist
         """
-        fd = self._acquire_lock()
+        fd = self._acquire_lock(shared=True)
         if fd is None:
             raise StorageError(f"Could not acquire lock for {self.file_path}")
 
@@ -164,22 +426,76 @@ class JSONStorage:
         finally:
             self._release_lock(fd)
 
+    def read_view(self) -> Optional[Mapping[str, Any]]:
+        """
+        Read-only view of the JSON file under a shared lock.
+
+        Served from the cache while the file is unchanged, so repeated reads
+        skip parsing. Objects are MappingProxyType and arrays tuples; copy
+        (e.g. dict(view)) before modifying.
+
+        Returns:
+            Read-only view or None if file doesn't exist
+        """
+        fd = self._acquire_lock(shared=True)
+        if fd is None:
+            raise StorageError(f"Could not acquire lock for {self.file_path}")
+
+        try:
+            return self._read_view_raw()
+        finally:
+            self._release_lock(fd)
+
     def write(self, data: Dict[str, Any]):
         """
-        Write JSON file with locking.
+        Write JSON file under an exclusive lock.
 
         Args:
             data: Data to write
         """
+        with self._exclusive():
+            self._write_raw(data)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the exclusive lock for the duration of the block."""
         fd = self._acquire_lock()
         if fd is None:
             raise StorageError(f"Could not acquire lock for {self.file_path}")
 
         try:
-            self._write_raw(data)
+            yield
         finally:
             self._release_lock(fd)
 
+    @contextmanager
+    def transaction(
+        self,
+        default: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Read-modify-write under one exclusive lock: the file is read once,
+        the block modifies the document in place, and it is written once on
+        exit. Nothing is written if the block raises.
+
+        Usage:
+            with storage.transaction(default={"todos": []}) as data:
+                data["todos"].append(todo)
+
+        Args:
+            default: Document to start from if the file doesn't exist
+
+        Yields:
+            Parsed JSON data (owned by the transaction), or default
+        """
+        with self._exclusive():
+            data = self._read_raw()
+            if data is None:
+                data = default
+            yield data
+            if data is not None:
+                self._write_raw(data)
+
 
 class TodoStorage(JSONStorage):
     """
@@ -206,10 +522,32 @@ class TodoStorage(JSONStorage):
     }
     """
 
-    def __init__(self, file_path: Path):
-        super().__init__(file_path)
+    def __init__(self, file_path: Path, lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+                 cache: Optional[DocumentCache] = None):
+        super().__init__(file_path, lock_timeout=lock_timeout, cache=cache)
         self._ensure_initialized()
 
+    def _encode(self, data: Dict[str, Any]) -> str:
+        """
+        Serialize data with one TODO per line.
+
+        json.dumps() with indent falls back to the pure-Python encoder, which
+        takes most of a rewrite on large lists; items without indent go through
+        the C encoder. The top level stays indented as in other JSON files.
+        """
+        todos = data.get("todos")
+        if not isinstance(todos, list):
+            return super()._encode(data)
+
+        fields = []
+        for key, value in data.items():
+            if key == "todos" and todos:
+                items = ",\n".join(f"    {json.dumps(todo)}" for todo in todos)
+                fields.append(f'  "todos": [\n{items}\n  ]')
+            else:
+                fields.append(f"  {json.dumps(key)}: {json.dumps(value)}")
+        return "{\n" + ",\n".join(fields) + "\n}"
+
     def _ensure_initialized(self):
         """Initialize file with empty structure if it doesn't exist."""
         if not self.file_path.exists():
@@ -221,17 +559,21 @@ class TodoStorage(JSONStorage):
             self.write(initial_data)
             logger.info(f"Initialized TODO storage at {self.file_path}")
 
+    def _todo_views(self) -> Sequence[Mapping[str, Any]]:
+        """Read-only views of all TODO items (see read_view); copy what is returned."""
+        data = self.read_view()
+        if data is None:
+            return ()
+        return data.get("todos", ())
+
     def get_all_todos(self) -> List[Dict[str, Any]]:
         """
         Get all TODO items.
 
         Returns:
-            List of TODO dictionaries
+            List of TODO dictionaries (copies; use read_view() for zero-copy reads)
         """
-        data = self.read()
-        if data is None:
-            return []
-        return data.get("todos", [])
+        return [_thaw(todo) for todo in self._todo_views()]
 
     def add_todo(self, todo: Dict[str, Any]) -> bool:
         """
@@ -243,15 +585,42 @@ class TodoStorage(JSONStorage):
         Returns:
             True if added successfully
         """
-        data = self.read()
-        if data is None:
-            data = {"version": "1.0", "todos": []}
-
-        data["todos"].append(todo)
-        self.write(data)
+        with self.transaction(default={"version": "1.0", "todos": []}) as data:
+            data["todos"].append(todo)
         logger.info(f"Added TODO: {todo['id']}")
         return True
 
+    def update(
+        self,
+        todo_id: str,
+        fn: Callable[[Mapping[str, Any]], Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a TODO item from its current state, in one locked read-modify-write.
+
+        Args:
+            todo_id: ID of TODO to update
+            fn: Called with the current item (read-only); returns the fields to update
+
+        Returns:
+            The updated TODO dictionary, or None if not found
+
+        Raises:
+            ValueError: fn changed the TODO's id (ids are immutable)
+        """
+        with self._exclusive():
+            data = self._read_raw()
+            todo = next((t for t in (data or {}).get("todos", []) if t["id"] == todo_id), None)
+            if todo is None:
+                logger.warning(f"TODO not found for update: {todo_id}")
+                return None
+
+            todo.update(validate_todo_changes(todo_id, fn(MappingProxyType(todo))))
+            todo["updated_at"] = datetime.now().isoformat()
+            self._write_raw(data)
+        logger.info(f"Updated TODO: {todo_id}")
+        return todo
+
     def update_todo(self, todo_id: str, updates: Dict[str, Any]) -> bool:
         """
         Update an existing TODO item.
@@ -263,20 +632,7 @@ class TodoStorage(JSONStorage):
         Returns:
             True if updated, False if not found
         """
-        data = self.read()
-        if data is None:
-            return False
-
-        for todo in data["todos"]:
-            if todo["id"] == todo_id:
-                todo.update(updates)
-                todo["updated_at"] = datetime.now().isoformat()
-                self.write(data)
-                logger.info(f"Updated TODO: {todo_id}")
-                return True
-
-        logger.warning(f"TODO not found for update: {todo_id}")
-        return False
+        return self.update(todo_id, lambda todo: updates) is not None
 
     def delete_todo(self, todo_id: str) -> bool:
         """
@@ -288,17 +644,18 @@ class TodoStorage(JSONStorage):
         Returns:
             True if deleted, False if not found
         """
-        data = self.read()
-        if data is None:
-            return False
+        with self._exclusive():
+            data = self._read_raw()
+            if data is None:
+                return False
 
-        original_count = len(data["todos"])
-        data["todos"] = [t for t in data["todos"] if t["id"] != todo_id]
+            original_count = len(data["todos"])
+            data["todos"] = [t for t in data["todos"] if t["id"] != todo_id]
 
-        if len(data["todos"]) < original_count:
-            self.write(data)
-            logger.info(f"Deleted TODO: {todo_id}")
-            return True
+            if len(data["todos"]) < original_count:
+                self._write_raw(data)
+                logger.info(f"Deleted TODO: {todo_id}")
+                return True
 
         logger.warning(f"TODO not found for deletion: {todo_id}")
         return False
@@ -313,16 +670,487 @@ class TodoStorage(JSONStorage):
         Returns:
             TODO dictionary or None if not found
         """
-        data = self.read()
-        if data is None:
-            return None
-
-        for todo in data["todos"]:
+        for todo in self._todo_views():
             if todo["id"] == todo_id:
-                return todo
+                return _thaw(todo)
 
         return None
 
+    def query_todos(
+        self,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        priority: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        TODO items matching every given filter.
+
+        Args:
+            status: Only items with this status
+            tags: Only items carrying any of these tags
+            priority: Only items with this priority
+
+        Returns:
+            List of the matching TODO dictionaries
+        """
+        return [
+            _thaw(todo) for todo in self._todo_views()
+            if (not status or todo["status"] == status)
+            and (not tags or any(tag in todo["tags"] for tag in tags))
+            and (not priority or todo["priority"] == priority)
+        ]
+
+
+class JournaledTodoStorage(TodoStorage):
+    """
+    TodoStorage whose mutations are O(1) appends to a journal.
+
+    todos.json stays the snapshot, in the usual format. Each add, update and
+    delete appends one compact JSON line to todos.json.journal instead of
+    rewriting it. The in-memory state is the snapshot plus a replay of the
+    journal, kept current by replaying only lines other processes appended.
+    Once the journal holds more entries than compact_threshold and than there
+    are todos, it is folded into a new snapshot (compaction).
+
+    Journal lines:
+        {"op":"begin","generation":3}      first line; must match the snapshot
+        {"op":"add","todo":{...}}
+        {"op":"update","id":"todo_...","changes":{...}}
+        {"op":"delete","id":"todo_..."}
+
+    Compaction writes the snapshot (with "journal_generation" bumped) before
+    it replaces the journal. A crash in between leaves a journal of the older
+    generation, which is then ignored because its entries are in the snapshot.
+
+    Usage:
+        storage = JournaledTodoStorage(Path(".tmp/user_data/todos.json"), fsync="always")
+        storage.add_todo(todo)
+        storage.export(Path("todos_export.json"))
+    """
+
+    def __init__(self, file_path: Path, lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+                 cache: Optional[DocumentCache] = None, fsync: str = "interval",
+                 compact_threshold: int = DEFAULT_COMPACT_THRESHOLD):
+        """
+        Initialize journaled TODO storage.
+
+        Args:
+            file_path: Path to the todos.json snapshot (journal: todos.json.journal)
+            lock_timeout: Seconds to wait for the file lock before raising StorageError
+            cache: Read cache for the snapshot (default: DOCUMENT_CACHE)
+            fsync: Journal fsync policy: always, interval or never
+            compact_threshold: Minimum journal entries before compaction
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Invalid fsync policy: {fsync}. "
+                             f"Must be one of {', '.join(FSYNC_POLICIES)}")
+        self.journal_file = Path(str(file_path) + ".journal")
+        self.fsync = fsync
+        self.compact_threshold = compact_threshold
+        self._mutex = threading.RLock()
+        self._todos: Dict[str, Mapping[str, Any]] = {}
+        self._todos_view: Optional[Tuple[Mapping[str, Any], ...]] = None
+        self._version = "1.0"
+        self._generation = 0
+        self._snapshot_signature: Optional[Tuple[int, int, int]] = None
+        self._journal_inode: Optional[int] = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._journal_stale = False
+        self._last_fsync = 0.0
+        super().__init__(file_path, lock_timeout=lock_timeout, cache=cache)
+
+    # ---- state -------------------------------------------------------------
+
+    def _apply(self, entry: Mapping[str, Any]):
+        """Apply one journal entry to the in-memory state."""
+        op = entry.get("op")
+        if op == "add":
+            todo = entry["todo"]
+            self._todos[todo["id"]] = todo
+        elif op == "update":
+            todo = self._todos.get(entry["id"])
+            if todo is not None:
+                self._todos[entry["id"]] = MappingProxyType({**todo, **entry["changes"]})
+        elif op == "delete":
+            self._todos.pop(entry["id"], None)
+        else:
+            logger.warning(f"Skipping unknown journal entry in {self.journal_file}: {op}")
+            return
+        self._todos_view = None
+
+    def _replay(self, f) -> int:
+        """
+        Apply the complete journal lines from the current offset of f.
+
+        A torn last line (no newline yet) is left for a later replay.
+
+        Returns:
+            Number of bytes consumed
+        """
+        data = f.read()
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line, object_hook=_freeze_object)
+            except json.JSONDecodeError as e:
+                logger.error(f"Skipping corrupted journal line in {self.journal_file}: {e}")
+                continue
+            if entry.get("op") == "begin":
+                if entry.get("generation") != self._generation:
+                    # Entries of an older generation are already in the snapshot
+                    self._journal_stale = True
+                    return end
+                continue
+            self._apply(entry)
+            self._journal_entries += 1
+        return end
+
+    def _load(self):
+        """Rebuild the state from the snapshot plus a full journal replay (lock held)."""
+        self._snapshot_signature = _file_signature(self.file_path)
+        view = self._read_view_raw() or {}
+        self._version = view.get("version", "1.0")
+        self._generation = view.get("journal_generation", 0)
+        self._todos = {todo["id"]: todo for todo in view.get("todos", ())}
+        self._todos_view = None
+        self._journal_inode = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._journal_stale = False
+        try:
+            with open(self.journal_file, 'rb') as f:
+                self._journal_inode = os.fstat(f.fileno()).st_ino
+                self._journal_offset = self._replay(f)
+        except FileNotFoundError:
+            pass
+
+    def _sync(self):
+        """Catch up with changes made by other processes (lock held)."""
+        journal_signature = _file_signature(self.journal_file)
+        journal_inode = journal_signature[2] if journal_signature else None
+        if (_file_signature(self.file_path) != self._snapshot_signature
+                or journal_inode != self._journal_inode
+                or (journal_signature and journal_signature[1] < self._journal_offset)):
+            self._load()
+        elif (journal_signature and journal_signature[1] > self._journal_offset
+              and not self._journal_stale):
+            with open(self.journal_file, 'rb') as f:
+                f.seek(self._journal_offset)
+                self._journal_offset += self._replay(f)
+
+    def _lock_or_raise(self, shared: bool) -> int:
+        """Take the file lock, raising StorageError on timeout; returns the fd."""
+        fd = self._acquire_lock(shared=shared)
+        if fd is None:
+            raise StorageError(f"Could not acquire lock for {self.file_path}")
+        return fd
+
+    # ---- journal -----------------------------------------------------------
+
+    def _append(self, entry: Dict[str, Any]):
+        """Append an entry to the journal and apply it (exclusive lock held)."""
+        if self._journal_stale or self._journal_inode is None:
+            self._reset_journal()
+        elif _file_signature(self.journal_file)[1] > self._journal_offset:
+            # Drop a torn line left by a writer that crashed mid-append
+            os.truncate(self.journal_file, self._journal_offset)
+
+        line = json.dumps(entry, separators=(',', ':')).encode('utf-8') + b"\n"
+        try:
+            with open(self.journal_file, 'ab') as f:
+                f.write(line)
+                f.flush()
+                now = time.monotonic()
+                if self.fsync == "always" or (self.fsync == "interval"
+                                              and now - self._last_fsync >= FSYNC_INTERVAL):
+                    os.fsync(f.fileno())
+                    self._last_fsync = now
+        except OSError as e:
+            raise StorageError(f"Failed to append to {self.journal_file}: {e}")
+        self._journal_offset += len(line)
+        self._journal_entries += 1
+        # Applied as read back from JSON, exactly as a replay would see it
+        self._apply(json.loads(line, object_hook=_freeze_object))
+
+        if self._journal_entries >= max(self.compact_threshold, len(self._todos)):
+            self._compact()
+
+    def _reset_journal(self):
+        """Atomically replace the journal with an empty one for the current generation."""
+        temp_file = Path(str(self.journal_file) + ".tmp")
+        try:
+            with open(temp_file, 'wb') as f:
+                header = {"op": "begin", "generation": self._generation}
+                f.write(json.dumps(header).encode('utf-8') + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            temp_file.replace(self.journal_file)
+        except OSError as e:
+            if temp_file.exists():
+                temp_file.unlink()
+            raise StorageError(f"Failed to write {self.journal_file}: {e}")
+        stat = os.stat(self.journal_file)
+        self._journal_inode = stat.st_ino
+        self._journal_offset = stat.st_size
+        self._journal_entries = 0
+        self._journal_stale = False
+
+    def _document(self) -> Dict[str, Any]:
+        """The current state as a todos.json document (mutable copy)."""
+        return {
+            "version": self._version,
+            "last_updated": datetime.now().isoformat(),
+            "todos": [_thaw(todo) for todo in self._todos.values()],
+        }
+
+    def _write_snapshot(self, data: Dict[str, Any]):
+        """Write data as the next snapshot generation and start its journal (exclusive lock held)."""
+        data["journal_generation"] = self._generation + 1
+        self._write_raw(data)
+        self._generation += 1
+        self._snapshot_signature = _file_signature(self.file_path)
+        self._reset_journal()
+
+    def _compact(self):
+        """Fold the journal into a new snapshot (exclusive lock held)."""
+        entries = self._journal_entries
+        start = time.perf_counter()
+        self._write_snapshot(self._document())
+        logger.info(f"Compacted {entries} journal entries into {self.file_path} "
+                    f"in {time.perf_counter() - start:.2f}s")
+
+    # ---- JSONStorage / TodoStorage interface --------------------------------
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        """
+        Current state (snapshot plus journal) as a todos.json document.
+
+        Returns:
+            Document owned by the caller, or None if nothing is stored yet
+        """
+        with self._mutex:
+            fd = self._lock_or_raise(shared=True)
+            try:
+                self._sync()
+                if self._snapshot_signature is None:
+                    return None
+                return self._document()
+            finally:
+                self._release_lock(fd)
+
+    def read_view(self) -> Optional[Mapping[str, Any]]:
+        """Read-only view of the current state as a todos.json document."""
+        with self._mutex:
+            fd = self._lock_or_raise(shared=True)
+            try:
+                self._sync()
+                if self._snapshot_signature is None:
+                    return None
+                return MappingProxyType({"version": self._version, "todos": self._current_todos()})
+            finally:
+                self._release_lock(fd)
+
+    def write(self, data: Dict[str, Any]):
+        """
+        Replace the whole state with data: written as a new snapshot, journal emptied.
+
+        Args:
+            data: todos.json document
+        """
+        with self._mutex:
+            fd = self._lock_or_raise(shared=False)
+            try:
+                self._sync()
+                self._write_snapshot(data)
+                self._load()
+            finally:
+                self._release_lock(fd)
+
+    @contextmanager
+    def transaction(
+        self,
+        default: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Read-modify-write of the whole document under one exclusive lock.
+
+        The result is written as a new snapshot (like write()); prefer
+        add_todo / update / delete_todo, which append one journal entry.
+
+        Args:
+            default: Document to start from if nothing is stored yet
+
+        Yields:
+            todos.json document (owned by the transaction), or default
+        """
+        with self._mutex:
+            fd = self._lock_or_raise(shared=False)
+            try:
+                self._sync()
+                data = self._document() if self._snapshot_signature is not None else default
+                yield data
+                if data is not None:
+                    self._write_snapshot(data)
+                    self._load()
+            finally:
+                self._release_lock(fd)
+
+    def _current_todos(self) -> Tuple[Mapping[str, Any], ...]:
+        if self._todos_view is None:
+            self._todos_view = tuple(self._todos.values())
+        return self._todos_view
+
+    def _todo_views(self) -> Sequence[Mapping[str, Any]]:
+        with self._mutex:
+            fd = self._lock_or_raise(shared=True)
+            try:
+                self._sync()
+                return self._current_todos()
+            finally:
+                self._release_lock(fd)
+
+    def get_todo_by_id(self, todo_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific TODO by ID.
+
+        Args:
+            todo_id: ID of TODO to retrieve
+
+        Returns:
+            TODO dictionary or None if not found
+        """
+        with self._mutex:
+            fd = self._lock_or_raise(shared=True)
+            try:
+                self._sync()
+                todo = self._todos.get(todo_id)
+            finally:
+                self._release_lock(fd)
+        return None if todo is None else _thaw(todo)
+
+    def add_todo(self, todo: Dict[str, Any]) -> bool:
+        """
+        Add a new TODO item (one journal append).
+
+        Args:
+            todo: TODO dictionary with all required fields
+
+        Returns:
+            True if added successfully
+        """
+        with self._mutex:
+            fd = self._lock_or_raise(shared=False)
+            try:
+                self._sync()
+                self._append({"op": "add", "todo": todo})
+            finally:
+                self._release_lock(fd)
+        logger.info(f"Added TODO: {todo['id']}")
+        return True
+
+    def update(
+        self,
+        todo_id: str,
+        fn: Callable[[Mapping[str, Any]], Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a TODO item from its current state (one journal append).
+
+        Args:
+            todo_id: ID of TODO to update
+            fn: Called with the current item (read-only); returns the fields to update
+
+        Returns:
+            The updated TODO dictionary, or None if not found
+
+        Raises:
+            ValueError: fn changed the TODO's id (ids are immutable)
+        """
+        with self._mutex:
+            fd = self._lock_or_raise(shared=False)
+            try:
+                self._sync()
+                todo = self._todos.get(todo_id)
+                if todo is None:
+                    logger.warning(f"TODO not found for update: {todo_id}")
+                    return None
+                changes = {**validate_todo_changes(todo_id, fn(todo)),
+                           "updated_at": datetime.now().isoformat()}
+                self._append({"op": "update", "id": todo_id, "changes": changes})
+                todo = self._todos[todo_id]
+            finally:
+                self._release_lock(fd)
+        logger.info(f"Updated TODO: {todo_id}")
+        return _thaw(todo)
+
+    def delete_todo(self, todo_id: str) -> bool:
+        """
+        Delete a TODO item (one journal append).
+
+        Args:
+            todo_id: ID of TODO to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        with self._mutex:
+            fd = self._lock_or_raise(shared=False)
+            try:
+                self._sync()
+                if todo_id not in self._todos:
+                    logger.warning(f"TODO not found for deletion: {todo_id}")
+                    return False
+                self._append({"op": "delete", "id": todo_id})
+            finally:
+                self._release_lock(fd)
+        logger.info(f"Deleted TODO: {todo_id}")
+        return True
+
+    def compact(self):
+        """Fold the journal into the todos.json snapshot now."""
+        with self._mutex:
+            fd = self._lock_or_raise(shared=False)
+            try:
+                self._sync()
+                self._compact()
+            finally:
+                self._release_lock(fd)
+
+    def export(self, path: Path):
+        """
+        Write the current state to path in the plain todos.json format.
+
+        Args:
+            path: Destination file (readable by the json backend)
+        """
+        data = self.read() or {"version": "1.0", "todos": []}
+        JSONStorage(path, lock_timeout=self.lock_timeout, cache=self.cache).write(data)
+
+
+def open_todo_storage(file_path: Path, backend: str = "json", **kwargs) -> TodoStorage:
+    """
+    Open TODO storage with the named backend.
+
+    Args:
+        file_path: Path to todos.json
+        backend: "json" (whole-file rewrites), "journal" (append-only journal) or
+            "sqlite" (todos.sqlite3 next to file_path, see sqlite_storage.py)
+        **kwargs: Backend options (e.g. fsync for "journal")
+
+    Returns:
+        TodoStorage instance (SQLiteTodoStorage for "sqlite", same interface)
+    """
+    if backend == "json":
+        return TodoStorage(file_path, **kwargs)
+    if backend == "journal":
+        return JournaledTodoStorage(file_path, **kwargs)
+    if backend == "sqlite":
+        from .sqlite_storage import SQLiteTodoStorage
+        return SQLiteTodoStorage(Path(file_path).with_suffix(".sqlite3"), **kwargs)
+    raise ValueError(f"Unknown TODO storage backend: {backend}. "
+                     f"Must be one of {', '.join(TODO_BACKENDS)}")
+
 
 class MindMapStorage:
     """
@@ -491,3 +1319,23 @@ class MindMapStorage:
                 json.dump(index, f, indent=2)
         except Exception as e:
             logger.error(f"Error removing from index: {e}")
+
+
+def open_mindmap_storage(mindmaps_dir: Path, backend: str = "json") -> MindMapStorage:
+    """
+    Open mind map storage with the named backend.
+
+    Args:
+        mindmaps_dir: Mind map directory
+        backend: "json" (one file per mind map) or "sqlite" (mindmaps.sqlite3 in mindmaps_dir)
+
+    Returns:
+        MindMapStorage instance (SQLiteMindMapStorage for "sqlite", same interface)
+    """
+    if backend == "json":
+        return MindMapStorage(mindmaps_dir)
+    if backend == "sqlite":
+        from .sqlite_storage import SQLiteMindMapStorage
+        return SQLiteMindMapStorage(Path(mindmaps_dir) / "mindmaps.sqlite3")
+    raise ValueError(f"Unknown mind map storage backend: {backend}. "
+                     f"Must be one of {', '.join(MINDMAP_BACKENDS)}")
@@ -10,10 +10,10 @@ import logging
 import uuid
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
-from typing import List, Optional, Dict, Any
+from typing import List, Mapping, Optional, Dict, Any
 from pathlib import Path
 
-from .storage import TodoStorage
+from .storage import open_todo_storage
 
 logger = logging.getLogger("mcp_server.todo_tools")
 
@@ -41,9 +41,11 @@ class TodoItem:
         return asdict(self)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'TodoItem':
-        """Create TodoItem from dictionary."""
-        return cls(**data)
+    def from_dict(cls, data: Mapping[str, Any]) -> 'TodoItem':
+        """Create TodoItem from a dictionary or a read-only storage view."""
+        item = cls(**data)
+        item.tags = list(item.tags)
+        return item
 
     def __post_init__(self):
         """Validate fields after initialization."""
@@ -94,15 +96,16 @@ class TodoManager:
         print(result.message)
     """
 
-    def __init__(self, storage_file: Path):
+    def __init__(self, storage_file: Path, backend: str = "json"):
         """
         Initialize TODO manager.
 
         Args:
             storage_file: Path to todos.json file
+            backend: Storage backend: json, journal or sqlite (see storage.open_todo_storage)
         """
-        self.storage = TodoStorage(storage_file)
-        logger.info(f"TODO manager initialized with storage: {storage_file}")
+        self.storage = open_todo_storage(storage_file, backend)
+        logger.info(f"TODO manager initialized with {backend} storage: {storage_file}")
 
     def _generate_todo_id(self) -> str:
         """
@@ -218,23 +221,16 @@ class TodoManager:
             ListTodosOutput with filtered TODOs and count
         """
         try:
-            # Get all TODOs
-            all_todos = self.storage.get_all_todos()
-            todos = [TodoItem.from_dict(t) for t in all_todos]
+            # Filtering happens in the storage backend (in SQL for sqlite)
+            matches = self.storage.query_todos(status=status, tags=tags, priority=priority)
+            todos = [TodoItem.from_dict(t) for t in matches]
 
-            # Apply filters
             filters_applied = {}
-
             if status:
-                todos = [t for t in todos if t.status == status]
                 filters_applied['status'] = status
-
             if tags:
-                todos = [t for t in todos if any(tag in t.tags for tag in tags)]
                 filters_applied['tags'] = tags
-
             if priority:
-                todos = [t for t in todos if t.priority == priority]
                 filters_applied['priority'] = priority
 
             logger.info(f"Listed {len(todos)} TODOs (filters: {filters_applied})")
@@ -278,16 +274,7 @@ class TodoManager:
             UpdateTodoOutput with success status and updated TODO
         """
         try:
-            # Get existing TODO
-            todo_dict = self.storage.get_todo_by_id(todo_id)
-            if not todo_dict:
-                return UpdateTodoOutput(
-                    success=False,
-                    todo=None,
-                    message=f"TODO not found: {todo_id}"
-                )
-
-            # Build updates dictionary
+            # Build updates dictionary (validated before the storage is locked)
             updates = {}
             if title is not None:
                 if not title.strip():
@@ -310,10 +297,6 @@ class TodoManager:
                     )
                 updates['status'] = status
 
-                # Set completed_at if status is completed
-                if status == 'completed' and not todo_dict.get('completed_at'):
-                    updates['completed_at'] = datetime.now().isoformat()
-
             if priority is not None:
                 if priority not in ['low', 'medium', 'high']:
                     return UpdateTodoOutput(
@@ -329,11 +312,20 @@ class TodoManager:
             if due_date is not None:
                 updates['due_date'] = due_date
 
-            # Update in storage
-            self.storage.update_todo(todo_id, updates)
+            def changes(current: Mapping[str, Any]) -> Dict[str, Any]:
+                # Set completed_at if status is completed
+                if status == 'completed' and not current.get('completed_at'):
+                    return {**updates, 'completed_at': datetime.now().isoformat()}
+                return updates
 
-            # Get updated TODO
-            updated_dict = self.storage.get_todo_by_id(todo_id)
+            # One locked read-modify-write; returns the updated TODO
+            updated_dict = self.storage.update(todo_id, changes)
+            if updated_dict is None:
+                return UpdateTodoOutput(
+                    success=False,
+                    todo=None,
+                    message=f"TODO not found: {todo_id}"
+                )
             updated_todo = TodoItem.from_dict(updated_dict)
 
             logger.info(f"Updated TODO: {todo_id}")
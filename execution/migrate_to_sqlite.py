@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+One-shot migration of the MCP JSON stores to the SQLite backend.
+
+Copies todos.json (including a pending todos.json.journal) into todos.sqlite3
+and the mind map directory (index.json + {id}.json) into mindmaps.sqlite3,
+the files the sqlite backends open. The JSON files are left untouched.
+Afterwards set MCP_TODO_BACKEND=sqlite and MCP_MINDMAP_BACKEND=sqlite.
+
+Usage:
+    python3 execution/migrate_to_sqlite.py
+    python3 execution/migrate_to_sqlite.py --todo-file .tmp/user_data/todos.json --skip-mindmaps
+    python3 execution/migrate_to_sqlite.py --force          # replace data already migrated
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Sibling modules in execution/
+sys.path.insert(0, str(Path(__file__).parent))
+
+from mcp_tools.sqlite_storage import migrate_mindmaps, migrate_todos
+from mcp_tools.storage import StorageError
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Migrate the MCP JSON stores to SQLite")
+    parser.add_argument("--todo-file", type=Path, default=Path(".tmp/user_data/todos.json"),
+                        help="todos.json to migrate (default: .tmp/user_data/todos.json)")
+    parser.add_argument("--mindmap-dir", type=Path, default=Path(".tmp/user_data/mindmaps"),
+                        help="Mind map directory to migrate (default: .tmp/user_data/mindmaps)")
+    parser.add_argument("--skip-todos", action="store_true", help="Do not migrate TODOs")
+    parser.add_argument("--skip-mindmaps", action="store_true", help="Do not migrate mind maps")
+    parser.add_argument("--force", action="store_true",
+                        help="Replace data already in the target databases")
+    args = parser.parse_args()
+
+    try:
+        if not args.skip_todos:
+            target = args.todo_file.with_suffix(".sqlite3")
+            count = migrate_todos(args.todo_file, target, force=args.force)
+            print(f"✓ Migrated {count:,} TODOs to {target}")
+        if not args.skip_mindmaps:
+            target = args.mindmap_dir / "mindmaps.sqlite3"
+            count = migrate_mindmaps(args.mindmap_dir, target, force=args.force)
+            print(f"✓ Migrated {count:,} mind maps to {target}")
+    except (StorageError, OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -10,19 +10,93 @@ This script implements Layer 3 (Execution) for log analysis:
 - Outputs structured data for Agent Alpha (The Investigator)
 """
 
+import argparse
+import mmap
+import os
+import queue
 import re
 import sys
-from collections import defaultdict, Counter
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from collections import defaultdict, deque, Counter
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from itertools import chain, compress, islice, repeat
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+# Sibling modules in execution/
+sys.path.insert(0, str(Path(__file__).parent))
+
+from log_artifacts import write_artifact
+from log_causality import DEFAULT_WINDOW_SECONDS, CausalityGraph
+from log_checkpoint import CheckpointError, RowSummary, complete_lines_end, load_checkpoint, save_checkpoint
+from log_compression import (CompressionError, decompress_stream, detect_compression, file_compression,
+                             member_ranges, open_decompressed)
+from log_fleet import AGGREGATE_SUFFIX, FleetAggregate
+from log_index import LogIndexError, build_index
+from log_noise import NoiseStore, NoiseStoreError
+from log_templates import TemplateMiner
+from log_timeline import (MICROS_PER_MINUTE, Burst, ErrorHistogram, TimestampDecoder, epoch_micros,
+                          find_bursts, format_minute, iter_histogram_lines, render_bar, utc_offset_of)
+
+
+# macOS log format: TIMESTAMP THREAD LEVEL FLAGS PID SEQ PROCESS: (SUBSYSTEM) [CATEGORY] MESSAGE
+# Example: 2026-01-08 11:45:23.123456-0500 0x1a2b3c Error 0x0 1234 0 kernel: (AppleACPIPlatform) Message
+# Compiled once at import time; every parse path shares it.
+LOG_LINE_PATTERN = re.compile(
+    r'^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d+[+-]\d{4})\s+(\w+)\s+(Default|Info|Debug|Error|Fault|Warning)'
+    r'\s+\S+\s+(\d+)\s+\d+\s+([^:]+):\s+(?:\(([^)]+)\))?\s*(?:\[([^\]]+)\])?\s*(.*)$'
+)
+
+LEVELS = ('Default', 'Info', 'Debug', 'Error', 'Fault', 'Warning')
+LEVEL_CODES = {level: code for code, level in enumerate(LEVELS)}
+ERROR_LEVELS = ('Error', 'Fault')
+ERROR_LEVEL_CODES = frozenset(LEVEL_CODES[level] for level in ERROR_LEVELS)
+WARNING_LEVEL_CODE = LEVEL_CODES['Warning']
+
+# Cheap byte-level test for Error/Fault lines, applied before decoding when
+# only errors are wanted. Lines containing a token are still confirmed by
+# LOG_LINE_PATTERN, so a false positive only costs one regex match.
+ERROR_LINE_TOKENS = (b' Error ', b' Fault ')
+
+# Default number of lines parsed per batch by LogAnalyzer.add_log_lines
+DEFAULT_CHUNK_SIZE = 65536
+
+# Maximum lines buffered between the stdin reader and the --follow loop
+FOLLOW_QUEUE_SIZE = 10000
+
+SYSTEM_PROCESSES = frozenset(['kernel', 'launchd', 'WindowServer', 'com.apple.xpc.launchd',
+                              'systemd', 'CoreServicesUIAgent', 'loginwindow'])
+APPLE_APPS = frozenset(['Safari', 'Mail', 'Photos', 'Music', 'Notes'])
+CATEGORY_TYPES = ('System', 'Apple Apps', 'Third-Party Apps')
+
+
+@lru_cache(maxsize=None)
+def categorize_process(process_name: str) -> str:
+    """Categorize a process name into System, Apple Apps, or Third-Party Apps."""
+    if process_name in SYSTEM_PROCESSES or process_name.startswith('com.apple'):
+        return "System"
+    elif process_name in APPLE_APPS:
+        return "Apple Apps"
+    else:
+        return "Third-Party Apps"
 
 
 class LogEntry:
     """Represents a single log entry from macOS unified logging."""
 
+    __slots__ = ('raw', 'timestamp', 'epoch_micros', 'thread_id', 'level', 'process_id',
+                 'process_name', 'subsystem', 'category', 'message')
+
     def __init__(self, raw_line: str):
         self.raw = raw_line
         self.timestamp = None
+        self.epoch_micros = None
         self.thread_id = None
         self.level = "Default"
         self.process_id = None
@@ -34,12 +108,10 @@ class LogEntry:
 
     def _parse(self):
         """Parse macOS log format: TIMESTAMP THREAD LEVEL FLAGS PID SEQ PROCESS: (SUBSYSTEM) [CATEGORY] MESSAGE"""
-        # Example: 2026-01-08 11:45:23.123456-0500 0x1a2b3c Error 0x0 1234 0 kernel: (AppleACPIPlatform) Message
-        pattern = r'^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d+[+-]\d{4})\s+(\w+)\s+(Default|Info|Debug|Error|Fault|Warning)\s+\S+\s+(\d+)\s+\d+\s+([^:]+):\s+(?:\(([^)]+)\))?\s*(?:\[([^\]]+)\])?\s*(.*)$'
-
-        match = re.match(pattern, self.raw.strip())
+        match = LOG_LINE_PATTERN.match(self.raw.strip())
         if match:
             self.timestamp = match.group(1)
+            self.epoch_micros = epoch_micros(self.timestamp)
             self.thread_id = match.group(2)
             self.level = match.group(3)
             self.process_id = match.group(4)
@@ -58,153 +130,1693 @@ class LogEntry:
 
     def category_type(self) -> str:
         """Categorize the log source into System, User, or Apps."""
-        system_processes = ['kernel', 'launchd', 'WindowServer', 'com.apple.xpc.launchd',
-                          'systemd', 'CoreServicesUIAgent', 'loginwindow']
+        return categorize_process(self.process_name)
 
-        if self.process_name in system_processes or self.process_name.startswith('com.apple'):
-            return "System"
-        elif self.process_name in ['Safari', 'Mail', 'Photos', 'Music', 'Notes']:
-            return "Apple Apps"
-        else:
-            return "Third-Party Apps"
+
+class StringTable:
+    """Interns repeated strings and hands out compact integer codes."""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, value: str) -> int:
+        """Return the code for value, adding it to the table if new."""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            value = sys.intern(value)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def remap(self, other: 'StringTable') -> Optional[array]:
+        """
+        Merge other's values into this table.
+
+        Returns:
+            array mapping other's codes to codes in this table, or None if
+            other's codes are already valid here unchanged
+        """
+        mapping = array('I', (self.code(value) for value in other.values))
+        if all(new == old for old, new in enumerate(mapping)):
+            return None
+        return mapping
+
+
+class TextColumn:
+    """
+    Append-only string column packed into one str block per batch.
+
+    Rows are buffered in a pending list and joined into a single block on
+    flush(), so each stored row costs its characters plus a 4-byte end offset
+    instead of a full str object and list slot.
+    """
+
+    def __init__(self):
+        self.blocks: List[str] = []
+        self.block_starts = array('Q')  # First row index of each block
+        self.ends = array('I')          # End offset of each row within its block
+        self.pending: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.ends) + len(self.pending)
+
+    def append(self, value: str):
+        self.pending.append(value)
+
+    def flush(self):
+        """Pack pending rows into a new block."""
+        if not self.pending:
+            return
+        self.block_starts.append(len(self.ends))
+        offset = 0
+        ends_append = self.ends.append
+        for value in self.pending:
+            offset += len(value)
+            ends_append(offset)
+        self.blocks.append(''.join(self.pending))
+        self.pending = []
+
+    def extend(self, other: 'TextColumn'):
+        """Append all rows of other, sharing its packed blocks."""
+        self.flush()
+        other.flush()
+        offset = len(self.ends)
+        self.block_starts.extend(offset + start for start in other.block_starts)
+        self.ends.extend(other.ends)
+        self.blocks.extend(other.blocks)
+
+    def __iter__(self) -> Iterator[str]:
+        """All rows in order (cheaper than indexing row by row)."""
+        self.flush()
+        ends = self.ends
+        stops = chain(islice(self.block_starts, 1, None), (len(ends),))
+        for block, first, stop in zip(self.blocks, self.block_starts, stops):
+            start = 0
+            for row in range(first, stop):
+                end = ends[row]
+                yield block[start:end]
+                start = end
+
+    def __getitem__(self, index: int) -> str:
+        if self.pending:
+            self.flush()
+        block = bisect_right(self.block_starts, index) - 1
+        start = self.ends[index - 1] if index > self.block_starts[block] else 0
+        return self.blocks[block][start:self.ends[index]]
+
+
+class LogColumns:
+    """
+    Columnar, memory-compact storage for parsed log entries.
+
+    Each field lives in its own column so a batch parse appends a handful of
+    small values per line instead of building one LogEntry object per line:
+    - levels, pids: typed arrays
+    - times: int64 epoch microseconds, for sorting, windowing and histograms
+    - process/subsystem/category: integer codes into shared StringTables
+    - timestamps, thread ids, messages: packed TextColumns (timestamps keep
+      the original text and UTC offset for display)
+    - raw lines: only kept when requested (keep_raw=True)
+    """
+
+    def __init__(self, keep_raw: bool = False):
+        self.timestamps = TextColumn()
+        self.times = array('q')
+        self.thread_ids = TextColumn()
+        self.levels = array('B')
+        self.pids = array('q')
+        self.processes = StringTable()
+        self.subsystems = StringTable()
+        self.categories = StringTable()
+        self.process_codes = array('I')
+        self.subsystem_codes = array('I')
+        self.category_codes = array('I')
+        self.messages = TextColumn()
+        self.raw: Optional[TextColumn] = TextColumn() if keep_raw else None
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def flush(self):
+        """Pack any buffered text rows."""
+        for column in (self.timestamps, self.thread_ids, self.messages, self.raw):
+            if column is not None:
+                column.flush()
+
+    def extend(self, other: 'LogColumns'):
+        """Append all rows of other, re-coding its interned strings into this store."""
+        if (self.raw is None) != (other.raw is None):
+            raise ValueError("Cannot merge log stores with different keep_raw settings")
+
+        for table, codes, other_table, other_codes in (
+            (self.processes, self.process_codes, other.processes, other.process_codes),
+            (self.subsystems, self.subsystem_codes, other.subsystems, other.subsystem_codes),
+            (self.categories, self.category_codes, other.categories, other.category_codes),
+        ):
+            mapping = table.remap(other_table)
+            if mapping is None:
+                codes.extend(other_codes)
+            else:
+                codes.extend(mapping[code] for code in other_codes)
+
+        self.levels.extend(other.levels)
+        self.pids.extend(other.pids)
+        self.timestamps.extend(other.timestamps)
+        self.times.extend(other.times)
+        self.thread_ids.extend(other.thread_ids)
+        self.messages.extend(other.messages)
+        if self.raw is not None:
+            self.raw.extend(other.raw)
+
+    def level(self, index: int) -> str:
+        return LEVELS[self.levels[index]]
+
+    def process(self, index: int) -> str:
+        return self.processes.values[self.process_codes[index]]
+
+    def subsystem(self, index: int) -> str:
+        return self.subsystems.values[self.subsystem_codes[index]]
+
+    def category(self, index: int) -> str:
+        return self.categories.values[self.category_codes[index]]
+
+    def entry(self, index: int) -> LogEntry:
+        """Materialize the entry at index as a LogEntry object."""
+        entry = LogEntry.__new__(LogEntry)
+        entry.raw = self.raw[index] if self.raw is not None else None
+        entry.timestamp = self.timestamps[index]
+        entry.epoch_micros = self.times[index]
+        entry.thread_id = self.thread_ids[index]
+        entry.level = self.level(index)
+        entry.process_id = str(self.pids[index])
+        entry.process_name = self.process(index)
+        entry.subsystem = self.subsystem(index)
+        entry.category = self.category(index)
+        entry.message = self.messages[index]
+        return entry
+
+
+class EntryView(Sequence):
+    """Read-only sequence of LogEntry objects backed by LogColumns."""
+
+    def __init__(self, columns: LogColumns, indices: Optional[Sequence] = None):
+        self._columns = columns
+        self._indices = indices
+
+    def __len__(self) -> int:
+        if self._indices is None:
+            return len(self._columns)
+        return len(self._indices)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if self._indices is None:
+            return self._columns.entry(range(len(self._columns))[i])
+        return self._columns.entry(self._indices[i])
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        entry = self._columns.entry
+        indices = range(len(self._columns)) if self._indices is None else self._indices
+        for index in indices:
+            yield entry(index)
 
 
 class LogAnalyzer:
     """Analyzes parsed logs and generates reports for the multi-agent system."""
 
-    def __init__(self):
-        self.entries: List[LogEntry] = []
-        self.errors: List[LogEntry] = []
-        self.warnings: List[LogEntry] = []
+    def __init__(self, keep_raw: bool = False, errors_only: bool = False):
+        """
+        Initialize an empty analyzer.
+
+        Args:
+            keep_raw: Also retain each raw input line (off by default to save memory)
+            errors_only: Keep only Error/Fault entries; all other levels are dropped
+        """
+        self.errors_only = errors_only
+        self.columns = LogColumns(keep_raw=keep_raw)
+        # Error/warning views are row indices into self.columns, not copies
+        self.error_indices = array('I')
+        self.warning_indices = array('I')
+        # Message templates of errors, mined lazily in error order (see error_templates)
+        self.templates = TemplateMiner()
+        self.error_template_ids = array('I')
+        # Known-noise templates left out of root causes and causal chains (see use_noise_store)
+        self.known_noise: Optional[NoiseStore] = None
+        # Counters of rows parsed by earlier runs, restored from a checkpoint
+        # (see from_checkpoint_state); empty for a fresh analyzer
+        self.earlier = RowSummary()
+
+    def __getstate__(self):
+        # The noise store belongs to a run, not to the parsed state (worker results)
+        state = self.__dict__.copy()
+        state['known_noise'] = None
+        return state
+
+    @classmethod
+    def from_checkpoint_state(cls, state: Dict[str, Any], keep_raw: bool = False,
+                              errors_only: bool = False) -> 'LogAnalyzer':
+        """
+        Analyzer resumed from checkpoint_state(): no rows yet, but the earlier
+        counters, string tables and template miner to merge new lines into.
+
+        Raises:
+            KeyError, TypeError, ValueError: state is damaged
+        """
+        analyzer = cls(keep_raw=keep_raw, errors_only=errors_only)
+        cols = analyzer.columns
+        for table, values in ((cols.processes, state["processes"]),
+                              (cols.subsystems, state["subsystems"]),
+                              (cols.categories, state["categories"])):
+            for value in values:
+                table.code(value)
+        analyzer.templates = TemplateMiner.from_dict(state["templates"])
+        analyzer.earlier = RowSummary.from_dict(state["rows"])
+        return analyzer
+
+    def checkpoint_state(self) -> Dict[str, Any]:
+        """
+        JSON-compatible aggregates of everything parsed so far, for a checkpoint.
+
+        Rows are folded into a RowSummary and saved with the string tables and
+        the template miner only, so the state grows with the number of
+        distinct templates and minutes, not lines (see log_checkpoint.py).
+        """
+        cols = self.columns
+        summary = RowSummary()
+        summary.entries = self.entry_count
+        summary.first_error_timestamp = self.earlier.first_error_timestamp
+        if summary.first_error_timestamp is None and self.error_indices:
+            summary.first_error_timestamp = cols.timestamps[self.error_indices[0]]
+        summary.warnings.update(self.earlier.warnings)
+        summary.warnings.update(map(cols.process_codes.__getitem__, self.warning_indices))
+        for *key, count in self._error_groups():
+            summary.errors[tuple(key)] += count
+        return {
+            "processes": cols.processes.values,
+            "subsystems": cols.subsystems.values,
+            "categories": cols.categories.values,
+            "templates": self.templates.to_dict(),
+            "rows": summary.to_dict(),
+        }
+
+    @property
+    def entries(self) -> EntryView:
+        """All valid entries held in the columns, in input order."""
+        return EntryView(self.columns)
+
+    @property
+    def errors(self) -> EntryView:
+        """Error and Fault entries held in the columns, in input order."""
+        return EntryView(self.columns, self.error_indices)
+
+    @property
+    def warnings(self) -> EntryView:
+        """Warning entries held in the columns, in input order."""
+        return EntryView(self.columns, self.warning_indices)
+
+    @property
+    def entry_count(self) -> int:
+        """Entries in the whole log, including rows summarized by a checkpoint."""
+        return len(self.columns) + self.earlier.entries
+
+    @property
+    def error_count(self) -> int:
+        """Errors in the whole log, including rows summarized by a checkpoint."""
+        return len(self.error_indices) + self.earlier.error_count
+
+    @property
+    def warning_count(self) -> int:
+        """Warnings in the whole log, including rows summarized by a checkpoint."""
+        return len(self.warning_indices) + self.earlier.warning_count
 
     def add_log_line(self, line: str):
         """Parse and add a log line."""
-        entry = LogEntry(line)
-        if entry.message:  # Valid parse
-            self.entries.append(entry)
-            if entry.is_error():
-                self.errors.append(entry)
-            elif entry.is_warning():
-                self.warnings.append(entry)
+        self._parse_chunk((line,))
 
-    def generate_distribution_graph(self) -> str:
-        """Generate a text-based distribution of errors by category and severity."""
-        if not self.errors and not self.warnings:
-            return "No errors or warnings found in logs."
+    def add_log_lines(self, lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Parse and add many log lines using the batch (columnar) path.
 
-        report = []
-        report.append("\n" + "="*80)
-        report.append("ERROR DISTRIBUTION GRAPH")
-        report.append("="*80 + "\n")
+        Args:
+            lines: Any iterable of raw log lines (file object, list, generator)
+            chunk_size: Number of lines pulled from the iterable per batch
 
-        # Group by category type
+        Returns:
+            Number of valid entries added
+        """
+        iterator = iter(lines)
+        added = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            added += self._parse_chunk(chunk)
+        return added
+
+    def error_templates(self) -> array:
+        """
+        Template cluster id of every error, aligned with error_indices.
+
+        Errors are mined incrementally in input order, so the result is the
+        same whether rows arrived in one parse, in batches, or via merge().
+        """
+        mined = len(self.error_template_ids)
+        if mined < len(self.error_indices):
+            add_message = self.templates.add_message
+            messages = self.columns.messages
+            self.error_template_ids.extend(
+                add_message(messages[index]) for index in self.error_indices[mined:]
+            )
+        return self.error_template_ids
+
+    def error_times(self) -> array:
+        """Epoch microseconds of every error's timestamp, aligned with error_indices."""
+        return array('q', map(self.columns.times.__getitem__, self.error_indices))
+
+    def error_minutes(self) -> array:
+        """Epoch minute of every error's timestamp, aligned with error_indices."""
+        return array('q', (micros // MICROS_PER_MINUTE for micros in self.error_times()))
+
+    def _error_groups(self) -> Iterator[Tuple[int, int, int, int, int, int]]:
+        """
+        Every error of the log as (process code, subsystem code, level code,
+        template id, epoch minute, count): the checkpointed groups first, then
+        one group of 1 per error held in the columns.
+        """
+        for key, count in self.earlier.errors.items():
+            yield (*key, count)
+        cols = self.columns
+        process_codes = cols.process_codes
+        subsystem_codes = cols.subsystem_codes
+        levels = cols.levels
+        for index, template_id, minute in zip(self.error_indices, self.error_templates(),
+                                              self.error_minutes()):
+            yield process_codes[index], subsystem_codes[index], levels[index], template_id, minute, 1
+
+    def error_histogram(self) -> Optional[ErrorHistogram]:
+        """Errors per minute of log time (None if there are no errors)."""
+        if not self.earlier.errors:
+            return ErrorHistogram.from_minutes(self.error_minutes())
+        minutes = Counter()
+        for (_, _, _, _, minute), count in self.earlier.errors.items():
+            minutes[minute] += count
+        minutes.update(self.error_minutes())
+        first, last = min(minutes), max(minutes)
+        get = minutes.get
+        return ErrorHistogram(first, 1, array('q', (get(minute, 0) for minute in range(first, last + 1))))
+
+    def error_bursts(self) -> List[Burst]:
+        """Windows where the per-minute error rate spikes (EWMA z-score), in time order."""
+        return find_bursts(self.error_histogram())
+
+    def use_noise_store(self, store: Optional[NoiseStore]):
+        """Leave errors whose (process, template) is known noise out of root causes and causal chains."""
+        self.known_noise = store
+
+    def _noise_filter(self) -> Optional[Callable[[int, int], int]]:
+        """
+        Function of (process code, template id) returning 1 if novel, 0 if known noise.
+
+        Each distinct pair is looked up in the store once; after that a call
+        costs one dict lookup. None when no noise store is in use.
+        """
+        if self.known_noise is None:
+            return None
+        process_names = self.columns.processes.values
+        template = self.templates.template
+        is_known = self.known_noise.is_known
+        flags: Dict[Tuple[int, int], int] = {}
+
+        def novel(process_code: int, template_id: int) -> int:
+            key = (process_code, template_id)
+            flag = flags.get(key)
+            if flag is None:
+                flag = flags[key] = 0 if is_known(process_names[process_code], template(template_id)) else 1
+            return flag
+        return novel
+
+    def novel_errors(self) -> Optional[bytearray]:
+        """
+        1 for every novel error and 0 for known noise, aligned with error_indices.
+
+        Returns:
+            The flags, or None when no noise store is in use
+        """
+        novel = self._noise_filter()
+        if novel is None:
+            return None
+        process_codes = self.columns.process_codes
+        return bytearray(novel(process_codes[index], template_id)
+                         for index, template_id in zip(self.error_indices, self.error_templates()))
+
+    def known_noise_templates(self) -> List[Tuple[str, str, int]]:
+        """
+        Known-noise templates present in this log.
+
+        Returns:
+            (process, template, errors) tuples, most errors first (empty
+            without a noise store)
+        """
+        novel = self._noise_filter()
+        if novel is None:
+            return []
+        counts = Counter()
+        for code, _, _, template_id, _, count in self._error_groups():
+            if not novel(code, template_id):
+                counts[code, template_id] += count
+        names = self.columns.processes.values
+        return [(names[code], self.templates.template(template_id), count)
+                for (code, template_id), count in counts.most_common()]
+
+    def learn_noise(self, store: NoiseStore) -> int:
+        """
+        Record every error template of this log as known noise (not saved).
+
+        Returns:
+            Number of templates that were new to the store
+        """
+        names = self.columns.processes.values
+        template = self.templates.template
+        pairs = {(code, template_id) for code, _, _, template_id, _, _ in self._error_groups()}
+        return store.add((names[code], template(template_id)) for code, template_id in pairs)
+
+    def _log_timezone(self):
+        """UTC offset of the logs, taken from the first error's timestamp."""
+        return utc_offset_of(self.earlier.first_error_timestamp
+                             or self.columns.timestamps[self.error_indices[0]])
+
+    def merge(self, other: 'LogAnalyzer'):
+        """
+        Append everything parsed by other (e.g. a later shard of the same file).
+
+        Rows keep their relative order, so merging shards in file order yields
+        exactly the state of a single sequential parse.
+        """
+        if other.earlier.entries:
+            raise ValueError("Cannot merge an analyzer resumed from a checkpoint into another")
+        offset = len(self.columns)
+        self.columns.extend(other.columns)
+        self.error_indices.extend(offset + index for index in other.error_indices)
+        self.warning_indices.extend(offset + index for index in other.warning_indices)
+
+    def _parse_chunk(self, chunk: Iterable[str]) -> int:
+        """Parse one batch of lines straight into the column arrays."""
+        cols = self.columns
+        match = LOG_LINE_PATTERN.match
+        level_codes = LEVEL_CODES
+        error_codes = ERROR_LEVEL_CODES
+        warning_code = WARNING_LEVEL_CODE
+        errors_only = self.errors_only
+
+        # Bind append methods once per chunk instead of once per line
+        # TextColumns are flushed once at the end of the chunk, so their
+        # pending lists can be appended to directly
+        ts_append = cols.timestamps.pending.append
+        time_append = cols.times.append
+        # One decoder per chunk: consecutive lines share its minute prefix cache
+        decode_time = TimestampDecoder()
+        tid_append = cols.thread_ids.pending.append
+        level_append = cols.levels.append
+        pid_append = cols.pids.append
+        # Known names hit the table dicts directly; only new names call code()
+        proc_get = cols.processes.codes.get
+        proc_code = cols.processes.code
+        proc_append = cols.process_codes.append
+        subsys_get = cols.subsystems.codes.get
+        subsys_code = cols.subsystems.code
+        subsys_append = cols.subsystem_codes.append
+        cat_get = cols.categories.codes.get
+        cat_code = cols.categories.code
+        cat_append = cols.category_codes.append
+        msg_append = cols.messages.pending.append
+        raw_append = cols.raw.pending.append if cols.raw is not None else None
+        err_append = self.error_indices.append
+        warn_append = self.warning_indices.append
+
+        index = len(cols)
+        start = index
+        for line in chunk:
+            m = match(line.strip())
+            if m is None:
+                continue
+            timestamp, thread_id, level, pid, process, subsystem, category, message = m.groups()
+            message = message.strip()
+            if not message:
+                continue
+            level = level_codes[level]
+            if errors_only and level not in error_codes:
+                continue
+
+            process = process.strip()
+            subsystem = subsystem or "Unknown"
+            category = category or "General"
+            code = proc_get(process)
+            proc_append(proc_code(process) if code is None else code)
+            code = subsys_get(subsystem)
+            subsys_append(subsys_code(subsystem) if code is None else code)
+            code = cat_get(category)
+            cat_append(cat_code(category) if code is None else code)
+
+            ts_append(timestamp)
+            time_append(decode_time(timestamp))
+            tid_append(thread_id)
+            level_append(level)
+            pid_append(int(pid))
+            msg_append(message)
+            if raw_append is not None:
+                raw_append(line)
+
+            if level in error_codes:
+                err_append(index)
+            elif level == warning_code:
+                warn_append(index)
+            index += 1
+
+        cols.flush()
+        return index - start
+
+    # Each report section is produced by a line generator. The generate_*
+    # methods join those lines into a string; write_full_report streams them
+    # to a file handle without building the whole report in memory.
+
+    def category_distribution(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count errors and warnings per source category.
+
+        Returns:
+            {category_type: {'Error': n, 'Fault': n, 'Warning': n}}, in
+            first-seen category order
+        """
         category_counts = defaultdict(lambda: {'Error': 0, 'Fault': 0, 'Warning': 0})
 
-        for entry in self.errors + self.warnings:
-            cat_type = entry.category_type()
-            category_counts[cat_type][entry.level] += 1
+        cols = self.columns
+        process_names = cols.processes.values
+        process_codes = cols.process_codes
+        levels = cols.levels
+        for (code, _, level, _, _), count in self.earlier.errors.items():
+            category_counts[categorize_process(process_names[code])][LEVELS[level]] += count
+        for code, count in self.earlier.warnings.items():
+            category_counts[categorize_process(process_names[code])]['Warning'] += count
+        for index in chain(self.error_indices, self.warning_indices):
+            cat_type = categorize_process(process_names[process_codes[index]])
+            category_counts[cat_type][LEVELS[levels[index]]] += 1
+        return dict(category_counts)
+
+    def _iter_distribution_lines(self) -> Iterator[str]:
+        if not self.error_count and not self.warning_count:
+            yield "No errors or warnings found in logs."
+            return
+
+        yield "\n" + "="*80
+        yield "ERROR DISTRIBUTION GRAPH"
+        yield "="*80 + "\n"
+
+        # Group by category type
+        category_counts = self.category_distribution()
+        # Bars are scaled to the largest count so they stay readable at any volume
+        peak = max(max(counts.values()) for counts in category_counts.values())
 
         # Display distribution
-        for cat_type in ['System', 'Apple Apps', 'Third-Party Apps']:
+        for cat_type in CATEGORY_TYPES:
             if cat_type in category_counts:
                 counts = category_counts[cat_type]
                 total = sum(counts.values())
-                report.append(f"{cat_type}: {total} issues")
+                yield f"{cat_type}: {total} issues"
                 for level in ['Fault', 'Error', 'Warning']:
                     if counts[level] > 0:
-                        bar = '█' * counts[level]
-                        report.append(f"  {level:10} [{counts[level]:2}] {bar}")
-                report.append("")
+                        bar = render_bar(counts[level], peak)
+                        yield f"  {level:10} [{counts[level]:2}] {bar}"
+                yield ""
 
-        return "\n".join(report)
+    def _iter_timeline_lines(self, max_rows: int = 60) -> Iterator[str]:
+        histogram = self.error_histogram()
+        if histogram is None:
+            return
 
-    def map_error_flow(self) -> str:
-        """Map the flow of errors to identify causality chains."""
-        if not self.errors:
-            return "No errors to map."
+        yield "\n" + "="*80
+        yield "ERROR TIMELINE"
+        yield "="*80 + "\n"
 
-        report = []
-        report.append("\n" + "="*80)
-        report.append("ERROR FLOW ANALYSIS (Chronological)")
-        report.append("="*80 + "\n")
-
-        for i, entry in enumerate(self.errors, 1):
-            arrow = "→" if i < len(self.errors) else "✗"
-            report.append(f"{arrow} [{entry.level}] {entry.category_type()} | {entry.process_name}")
-            report.append(f"  Time: {entry.timestamp}")
-            report.append(f"  Subsystem: {entry.subsystem}")
-            report.append(f"  Message: {entry.message}")
-            report.append("")
+        tz = self._log_timezone()
+        shown = histogram.rebin(max_rows)
+        unit = "minute" if shown.bucket_minutes == 1 else f"{shown.bucket_minutes} minutes"
+        yield f"Errors per {unit}:"
+        yield from iter_histogram_lines(histogram, tz, max_rows)
 
-        return "\n".join(report)
+        bursts = self.error_bursts()
+        yield ""
+        if not bursts:
+            yield "No error bursts detected."
+            return
+        yield f"Error bursts ({len(bursts)}):"
+        for burst in bursts:
+            yield (f"  {format_minute(burst.first_minute, tz)} → {format_minute(burst.last_minute, tz)[11:]}"
+                   f"  {burst.errors} errors, peak {burst.peak}/min (z={burst.max_z:.1f})")
 
-    def identify_root_causes(self) -> str:
-        """Identify potential root causes based on error patterns."""
-        if not self.errors:
-            return "No errors to analyze."
+    def _error_runs(self, collapse: bool) -> Iterator[Tuple[int, int, int, Optional[str]]]:
+        """
+        Group errors into runs for the flow section.
 
-        report = []
-        report.append("\n" + "="*80)
-        report.append("POTENTIAL ROOT CAUSES")
-        report.append("="*80 + "\n")
+        Yields:
+            (first_index, last_index, count, template) per run. Without
+            collapse every error is its own run and template is None; with
+            collapse, consecutive errors sharing level, process, subsystem and
+            message template form one run.
+        """
+        if not collapse:
+            for index in self.error_indices:
+                yield index, index, 1, None
+            return
+
+        cols = self.columns
+        levels = cols.levels
+        process_codes = cols.process_codes
+        subsystem_codes = cols.subsystem_codes
+        template = self.templates.template
+
+        run_key = None
+        first = last = count = 0
+        for index, template_id in zip(self.error_indices, self.error_templates()):
+            key = (levels[index], process_codes[index], subsystem_codes[index], template_id)
+            if key == run_key:
+                last = index
+                count += 1
+                continue
+            if run_key is not None:
+                yield first, last, count, template(run_key[3])
+            run_key, first, last, count = key, index, index, 1
+        if run_key is not None:
+            yield first, last, count, template(run_key[3])
+
+    def _iter_error_flow_lines(self, collapse: bool = False) -> Iterator[str]:
+        if not self.error_indices:
+            yield "No errors appended since the checkpoint." if self.earlier.errors else "No errors to map."
+            return
+
+        yield "\n" + "="*80
+        yield "ERROR FLOW ANALYSIS (Chronological)"
+        yield "="*80 + "\n"
+        if self.earlier.errors:
+            # Only counters of the rows before the checkpoint offset are kept
+            yield (f"Errors appended since the checkpoint; {self.earlier.error_count} earlier "
+                   f"errors are counted above but not listed.")
+            yield ""
+
+        cols = self.columns
+        runs = self._error_runs(collapse)
+        current = next(runs)
+        while current is not None:
+            upcoming = next(runs, None)
+            first, last, count, template = current
+            arrow = "→" if upcoming is not None else "✗"
+            process = cols.process(first)
+            if count == 1:
+                yield f"{arrow} [{cols.level(first)}] {categorize_process(process)} | {process}"
+                yield f"  Time: {cols.timestamps[first]}"
+                yield f"  Subsystem: {cols.subsystem(first)}"
+                yield f"  Message: {cols.messages[first]}"
+            else:
+                yield f"{arrow} [{cols.level(first)}] {categorize_process(process)} | {process} ×{count}"
+                yield f"  Time: {cols.timestamps[first]} → {cols.timestamps[last]}"
+                yield f"  Subsystem: {cols.subsystem(first)}"
+                yield f"  Message: {template}"
+            yield ""
+            current = upcoming
+
+    def root_causes(self, limit: int = 5, templates_per_process: int = 3) -> List[Dict[str, Any]]:
+        """
+        Rank processes by error count and summarize their top message templates.
+
+        Errors inside a burst window (see error_bursts) count twice towards
+        the ranking, so processes driving a spike rank above steady background
+        noise of similar volume.
 
-        # Group by process
-        process_errors = defaultdict(list)
-        for entry in self.errors:
-            process_errors[entry.process_name].append(entry)
+        Returns:
+            Up to `limit` dicts, highest score first (ties keep first-seen order):
+            {process, category, error_count, fault_count, subsystem,
+             burst_errors, first_burst, templates: [{template, count}, ...]}
+            first_burst is the start ("YYYY-MM-DD HH:MM") of the earliest
+            burst the process contributed to, or None
+        """
+        # Count errors per (process, message template); all counters are
+        # bounded by the number of distinct templates/subsystems, not errors
+        cols = self.columns
+        fault_code = LEVEL_CODES['Fault']
+        process_counts = Counter()
+        fault_counts = Counter()
+        subsystem_counts = Counter()
+        template_counts = Counter()
+        novel = self._noise_filter()
+        for code, subsystem, level, template_id, _, count in self._error_groups():
+            if novel is not None and not novel(code, template_id):
+                continue
+            process_counts[code] += count
+            template_counts[code, template_id] += count
+            subsystem_counts[code, subsystem] += count
+            if level == fault_code:
+                fault_counts[code] += count
+
+        # Attribute errors inside burst windows to their processes
+        burst_counts = Counter()
+        first_bursts: Dict[int, Burst] = {}
+        bursts = self.error_bursts()
+        if bursts:
+            starts = [burst.first_minute for burst in bursts]
+            for code, _, _, template_id, minute, count in self._error_groups():
+                if novel is not None and not novel(code, template_id):
+                    continue
+                position = bisect_right(starts, minute) - 1
+                if position >= 0 and minute in bursts[position]:
+                    burst = bursts[position]
+                    burst_counts[code] += count
+                    if code not in first_bursts or burst.first_minute < first_bursts[code].first_minute:
+                        first_bursts[code] = burst
 
         # Find processes with multiple errors (likely culprits)
-        sorted_processes = sorted(process_errors.items(), key=lambda x: len(x[1]), reverse=True)
-
-        for process, errors in sorted_processes[:5]:  # Top 5
-            report.append(f"Process: {process} ({len(errors)} errors)")
-            # Group by message pattern
-            messages = Counter([e.message for e in errors])
-            for msg, count in messages.most_common(3):
-                report.append(f"  [{count}x] {msg[:80]}...")
-            report.append("")
+        sorted_processes = sorted(process_counts.items(),
+                                  key=lambda x: x[1] + burst_counts[x[0]], reverse=True)
 
-        return "\n".join(report)
+        process_names = cols.processes.values
+        subsystem_names = cols.subsystems.values
+        template = self.templates.template
+        causes = []
+        for code, error_count in sorted_processes[:limit]:
+            templates = Counter({template_id: count for (process_code, template_id), count
+                                 in template_counts.items() if process_code == code})
+            subsystems = Counter({subsystem: count for (process_code, subsystem), count
+                                  in subsystem_counts.items() if process_code == code})
+            process = process_names[code]
+            first_burst = first_bursts.get(code)
+            causes.append({
+                "process": process,
+                "category": categorize_process(process),
+                "error_count": error_count,
+                "fault_count": fault_counts[code],
+                "subsystem": subsystem_names[subsystems.most_common(1)[0][0]],
+                "burst_errors": burst_counts[code],
+                "first_burst": format_minute(first_burst.first_minute, self._log_timezone())
+                               if first_burst else None,
+                "templates": [{"template": template(template_id), "count": count}
+                              for template_id, count in templates.most_common(templates_per_process)],
+            })
+        return causes
+
+    def causality_graph(self, window_seconds: float = DEFAULT_WINDOW_SECONDS) -> CausalityGraph:
+        """Precedence graph between processes (by process code) of the errors, known noise excluded."""
+        process_codes = self.columns.process_codes
+        novel = self.novel_errors()
+        if novel is None:
+            return CausalityGraph.build(self.error_times(),
+                                        [process_codes[index] for index in self.error_indices],
+                                        window_seconds)
+        return CausalityGraph.build(array('q', compress(self.error_times(), novel)),
+                                    [process_codes[index] for index in compress(self.error_indices, novel)],
+                                    window_seconds)
+
+    def causal_sources(self, limit: int = 3,
+                       window_seconds: float = DEFAULT_WINDOW_SECONDS) -> List[Dict[str, Any]]:
+        """
+        Processes whose errors most often precede errors in other processes.
+
+        Returns:
+            Up to `limit` dicts, strongest source first:
+            {process, score, downstream: [{process, count, reverse}, ...], chain}
+            where count is how many of the downstream process's errors followed
+            this process's errors within window_seconds, reverse the opposite
+            direction, and chain the strongest forward path from the source
+        """
+        graph = self.causality_graph(window_seconds)
+        names = self.columns.processes.values
+        return [{
+            "process": names[source.process],
+            "score": source.score,
+            "downstream": [{"process": names[target], "count": count, "reverse": reverse}
+                           for target, count, reverse in source.downstream],
+            "chain": [names[code] for code in graph.chain(source.process)],
+        } for source in graph.sources(limit)]
+
+    def _iter_causality_lines(self, window_seconds: float = DEFAULT_WINDOW_SECONDS) -> Iterator[str]:
+        if not self.error_indices:
+            return
 
-    def generate_full_report(self) -> str:
+        yield "\n" + "="*80
+        yield "CAUSAL CHAINS"
+        yield "="*80 + "\n"
+        if self.earlier.errors:
+            yield "Errors appended since the checkpoint only."
+            yield ""
+
+        sources = self.causal_sources(window_seconds=window_seconds)
+        if not sources:
+            yield f"No process consistently errors before others (within {window_seconds:g}s)."
+            return
+        yield f"Likely upstream sources (errors followed by other processes' errors within {window_seconds:g}s):"
+        yield ""
+        for source in sources:
+            yield f"Source: {source['process']} (score +{source['score']})"
+            for item in source['downstream']:
+                yield f"  → {item['process']} ×{item['count']} (reverse ×{item['reverse']})"
+            if len(source['chain']) > 1:
+                yield f"  Chain: {' → '.join(source['chain'])}"
+            yield ""
+
+    def _iter_noise_lines(self, limit: int = 10) -> Iterator[str]:
+        if self.known_noise is None or not self.error_count:
+            return
+
+        yield "\n" + "="*80
+        yield "KNOWN NOISE"
+        yield "="*80 + "\n"
+
+        known = self.known_noise_templates()
+        suppressed = sum(count for _, _, count in known)
+        yield (f"{suppressed} of {self.error_count} errors match {len(known)} known-noise "
+               f"templates and are left out of causal chains and root causes.")
+        for process, template, count in known[:limit]:
+            yield f"  {count:>6}×  {process}: {template[:80]}"
+        if len(known) > limit:
+            yield f"  ... and {len(known) - limit} more"
+
+    def _iter_root_cause_lines(self) -> Iterator[str]:
+        if not self.error_count:
+            yield "No errors to analyze."
+            return
+
+        yield "\n" + "="*80
+        yield "POTENTIAL ROOT CAUSES"
+        yield "="*80 + "\n"
+
+        causes = self.root_causes()
+        if not causes:
+            yield "No novel errors: every error matches a known-noise template."
+        for cause in causes:  # Top 5
+            yield f"Process: {cause['process']} ({cause['error_count']} errors)"
+            if cause['burst_errors']:
+                yield f"  Burst: {cause['burst_errors']} errors in spikes, first at {cause['first_burst']}"
+            # Group by message template
+            for item in cause['templates']:
+                yield f"  [{item['count']}x] {item['template'][:80]}..."
+            yield ""
+
+    def _iter_full_report_lines(self, collapse: bool = False,
+                                causality_window: float = DEFAULT_WINDOW_SECONDS) -> Iterator[str]:
+        yield "="*80
+        yield "MULTI-AGENT LOG ANALYSIS REPORT"
+        yield "Phase 1: DIAGNOSTIC (Agent Alpha - The Investigator)"
+        yield "="*80
+        if self.errors_only:
+            # Only Error/Fault lines were parsed, so the other totals are unknown
+            yield "\nScan: errors-only (Error/Fault lines only; other levels were skipped)"
+            yield "Total Log Entries: not counted"
+            yield f"Errors (Error + Fault): {self.error_count}"
+            yield "Warnings: not counted"
+            yield "Info/Debug: not counted"
+        else:
+            yield f"\nTotal Log Entries: {self.entry_count}"
+            yield f"Errors (Error + Fault): {self.error_count}"
+            yield f"Warnings: {self.warning_count}"
+            yield f"Info/Debug: {self.entry_count - self.error_count - self.warning_count}"
+
+        # Sections are separated by a single newline, as in generate_full_report
+        yield "\n".join(self._iter_distribution_lines())
+        yield from self._iter_timeline_lines()
+        yield from self._iter_error_flow_lines(collapse)
+        yield from self._iter_causality_lines(causality_window)
+        yield from self._iter_noise_lines()
+        yield from self._iter_root_cause_lines()
+
+    def generate_distribution_graph(self) -> str:
+        """Generate a text-based distribution of errors by category and severity."""
+        return "\n".join(self._iter_distribution_lines())
+
+    def map_error_flow(self, collapse: bool = False) -> str:
+        """
+        Map the flow of errors to identify causality chains.
+
+        Args:
+            collapse: Run-length encode consecutive errors with the same level,
+                process, subsystem and message template into one ×N entry
+        """
+        return "\n".join(self._iter_error_flow_lines(collapse))
+
+    def identify_causal_chains(self, window_seconds: float = DEFAULT_WINDOW_SECONDS) -> str:
+        """
+        Identify processes whose errors open cascades in other processes.
+
+        Args:
+            window_seconds: Δt within which a later error counts as following
+        """
+        return "\n".join(self._iter_causality_lines(window_seconds))
+
+    def identify_root_causes(self) -> str:
+        """Identify potential root causes based on error patterns."""
+        return "\n".join(self._iter_root_cause_lines())
+
+    def generate_full_report(self, collapse: bool = False,
+                             causality_window: float = DEFAULT_WINDOW_SECONDS) -> str:
         """Generate complete diagnostic report for Agent Alpha."""
+        return "\n".join(self._iter_full_report_lines(collapse, causality_window))
+
+    def write_full_report(self, out: TextIO, collapse: bool = False,
+                          causality_window: float = DEFAULT_WINDOW_SECONDS):
+        """
+        Stream the complete diagnostic report to a file handle.
+
+        Writes exactly generate_full_report() plus a trailing newline, one
+        line at a time, so memory does not grow with the number of errors.
+
+        Args:
+            out: Writable text stream (file, sys.stdout, ...)
+            collapse: Collapse repeated errors in the flow section (see map_error_flow)
+            causality_window: Δt in seconds for the causal chains section
+        """
+        write = out.write
+        for line in self._iter_full_report_lines(collapse, causality_window):
+            write(line)
+            write("\n")
+
+    def artifact_records(self, causality_window: float = DEFAULT_WINDOW_SECONDS) -> Iterator[Dict[str, Any]]:
+        """Phase 1 results as artifact records (see log_artifacts.py)."""
+        total = self.entry_count
+        counted = not self.errors_only
+        yield {
+            "type": "summary",
+            # Errors-only scans leave the non-error totals unknown (null)
+            **({"scan": "errors_only"} if self.errors_only else {}),
+            "total_entries": total if counted else None,
+            "errors": self.error_count,
+            "warnings": self.warning_count if counted else None,
+            "info_debug": (total - self.error_count - self.warning_count
+                           if counted else None),
+            **({"known_noise_errors": sum(count for _, _, count in self.known_noise_templates())}
+               if self.known_noise is not None else {}),
+        }
+        category_counts = self.category_distribution()
+        for cat_type in CATEGORY_TYPES:
+            if cat_type in category_counts:
+                counts = category_counts[cat_type]
+                yield {"type": "category", "category": cat_type, "total": sum(counts.values()), **counts}
+        if self.error_count:
+            tz = self._log_timezone()
+            for burst in self.error_bursts():
+                yield {
+                    "type": "burst",
+                    "start": format_minute(burst.first_minute, tz),
+                    "end": format_minute(burst.last_minute, tz),
+                    "errors": burst.errors,
+                    "peak_per_minute": burst.peak,
+                    "max_z": round(burst.max_z, 2),
+                }
+        for rank, source in enumerate(self.causal_sources(window_seconds=causality_window), 1):
+            yield {"type": "causal_source", "rank": rank, "window_seconds": causality_window, **source}
+        for rank, cause in enumerate(self.root_causes(), 1):
+            yield {"type": "root_cause", "rank": rank, **cause}
+
+    def write_artifact(self, path: str, causality_window: float = DEFAULT_WINDOW_SECONDS):
+        """Write the Phase 1 JSON Lines artifact for downstream phases."""
+        write_artifact(path, 1, self.artifact_records(causality_window))
+
+    def index_rows(self) -> Iterator[Tuple]:
+        """Every entry as a log_index.build_index row, in input order."""
+        cols = self.columns
+        processes = cols.processes.values
+        subsystems = cols.subsystems.values
+        categories = cols.categories.values
+        for micros, timestamp, thread_id, level, pid, process, subsystem, category, message in zip(
+                cols.times, cols.timestamps, cols.thread_ids, cols.levels, cols.pids,
+                cols.process_codes, cols.subsystem_codes, cols.category_codes, cols.messages):
+            yield (micros, timestamp, LEVELS[level], pid, processes[process],
+                   subsystems[subsystem], categories[category], thread_id, message)
+
+    def write_index(self, path: str, source: str = "") -> int:
+        """
+        Write a SQLite index of every entry for ad-hoc queries (see log_index.py).
+
+        Returns:
+            Number of entries indexed
+        """
+        utc_offset = self.columns.timestamps[0][-5:] if len(self.columns) else "+0000"
+        return build_index(path, self.index_rows(), source=source, utc_offset=utc_offset)
+
+    def fleet_aggregate(self, host: str) -> FleetAggregate:
+        """Mergeable error counters of this log for fleet analysis (see log_fleet.py)."""
+        processes = self.columns.processes.values
+        categories = [categorize_process(process) for process in processes]
+        template = self.templates.template
+        errors = chain.from_iterable(
+            repeat((processes[code], categories[code], template(template_id), minute), count)
+            for code, _, _, template_id, minute, count in self._error_groups()
+        )
+        return FleetAggregate.for_host(host, self.entry_count, self.warning_count, errors)
+
+
+class RollingCounter:
+    """
+    Sliding-window counter built from fixed-width time buckets.
+
+    Memory is bounded by (window / bucket) buckets times the number of
+    distinct keys seen inside the window, independent of stream length.
+    """
+
+    def __init__(self, window_seconds: float, bucket_seconds: float):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.buckets: Deque[Tuple[int, Counter]] = deque()
+        self.totals: Counter = Counter()
+
+    def add(self, key, now: float, count: int = 1):
+        """Count key at time now (seconds, monotonic)."""
+        bucket_id = int(now // self.bucket_seconds)
+        if not self.buckets or self.buckets[-1][0] != bucket_id:
+            self.expire(now)
+            self.buckets.append((bucket_id, Counter()))
+        self.buckets[-1][1][key] += count
+        self.totals[key] += count
+
+    def expire(self, now: float):
+        """Drop buckets that have slid out of the window."""
+        oldest = int((now - self.window_seconds) // self.bucket_seconds)
+        while self.buckets and self.buckets[0][0] <= oldest:
+            _, expired = self.buckets.popleft()
+            self.totals.subtract(expired)
+            for key in expired:
+                if self.totals[key] <= 0:
+                    del self.totals[key]
+
+
+class LogStreamMonitor:
+    """
+    Bounded-memory analyzer for unbounded log streams (e.g. `log stream`).
+
+    Lines are parsed and counted into rolling-window counters per level,
+    process and category, then discarded. Only the most recent few errors
+    are retained, so memory stays flat no matter how long the stream runs.
+    """
+
+    def __init__(self, window_seconds: float = 300.0, bucket_seconds: float = 10.0,
+                 recent_errors: int = 10, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the monitor.
+
+        Args:
+            window_seconds: Length of the sliding window reported on
+            bucket_seconds: Granularity at which old counts expire
+            recent_errors: Number of latest errors kept for the report
+            clock: Time source in seconds (monotonic by default)
+        """
+        self.window = RollingCounter(window_seconds, bucket_seconds)
+        self.recent_errors: Deque[Tuple[str, str, str, str]] = deque(maxlen=recent_errors)
+        self.clock = clock
+        self.total_lines = 0
+
+    def add_log_line(self, line: str) -> bool:
+        """Parse and count one line; returns True if it was a valid entry."""
+        self.total_lines += 1
+        m = LOG_LINE_PATTERN.match(line.strip())
+        if m is None:
+            return False
+        timestamp, _thread_id, level, _pid, process, _subsystem, _category, message = m.groups()
+        message = message.strip()
+        if not message:
+            return False
+
+        now = self.clock()
+        window = self.window
+        window.add(('level', level), now)
+        if level in ERROR_LEVELS or level == 'Warning':
+            process = process.strip()
+            window.add(('process', process), now)
+            window.add(('category', categorize_process(process)), now)
+            if level in ERROR_LEVELS:
+                self.recent_errors.append((level, process, timestamp, message))
+        return True
+
+    def _counts(self, kind: str) -> List[Tuple[str, int]]:
+        """Window counts for one key kind, largest first."""
+        counts = [(key[1], count) for key, count in self.window.totals.items() if key[0] == kind]
+        return sorted(counts, key=lambda item: (-item[1], item[0]))
+
+    def generate_report(self) -> str:
+        """Generate an incremental report for the current window."""
+        self.window.expire(self.clock())
+        levels = dict(self._counts('level'))
+        errors = sum(levels.get(level, 0) for level in ERROR_LEVELS)
+
         report = []
         report.append("="*80)
-        report.append("MULTI-AGENT LOG ANALYSIS REPORT")
-        report.append("Phase 1: DIAGNOSTIC (Agent Alpha - The Investigator)")
+        report.append(f"ROLLING LOG REPORT - last {self.window.window_seconds:g}s "
+                      f"({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
         report.append("="*80)
-        report.append(f"\nTotal Log Entries: {len(self.entries)}")
-        report.append(f"Errors (Error + Fault): {len(self.errors)}")
-        report.append(f"Warnings: {len(self.warnings)}")
-        report.append(f"Info/Debug: {len(self.entries) - len(self.errors) - len(self.warnings)}")
+        report.append(f"Window Entries: {sum(levels.values())} (lines read so far: {self.total_lines})")
+        report.append(f"Errors (Error + Fault): {errors}")
+        report.append(f"Warnings: {levels.get('Warning', 0)}")
+        report.append("")
+
+        if levels:
+            report.append("By level:")
+            for level in LEVELS:
+                if levels.get(level):
+                    report.append(f"  {level:10} {levels[level]}")
+            report.append("")
+
+        categories = self._counts('category')
+        if categories:
+            report.append("By category (errors + warnings):")
+            for category, count in categories:
+                report.append(f"  {category:18} {count}")
+            report.append("")
+
+        processes = self._counts('process')
+        if processes:
+            report.append("Top processes (errors + warnings):")
+            for process, count in processes[:5]:
+                report.append(f"  {process}: {count}")
+            report.append("")
 
-        report.append(self.generate_distribution_graph())
-        report.append(self.map_error_flow())
-        report.append(self.identify_root_causes())
+        if self.recent_errors:
+            report.append("Most recent errors:")
+            for level, process, timestamp, message in self.recent_errors:
+                report.append(f"  [{level}] {timestamp} {process}: {message[:80]}")
+            report.append("")
 
         return "\n".join(report)
 
 
+def follow_stream(stream: TextIO, monitor: LogStreamMonitor, interval: float,
+                  out: TextIO = sys.stdout):
+    """
+    Consume a stream until EOF, printing a window report every `interval` seconds.
+
+    A reader thread feeds lines through a bounded queue so reports are emitted
+    on schedule even while the stream is quiet.
+    """
+    lines: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=FOLLOW_QUEUE_SIZE)
+
+    def reader():
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    next_report = time.monotonic() + interval
+    try:
+        while True:
+            try:
+                line = lines.get(timeout=max(0.0, next_report - time.monotonic()))
+            except queue.Empty:
+                line = ''
+            if line is None:
+                break
+            if line:
+                monitor.add_log_line(line)
+            if time.monotonic() >= next_report:
+                print(monitor.generate_report(), file=out, flush=True)
+                next_report = time.monotonic() + interval
+    except KeyboardInterrupt:
+        pass
+    print(monitor.generate_report(), file=out, flush=True)
+
+
+def shard_offsets(path: str, shards: int, start: int = 0,
+                  end: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Split a file into up to `shards` byte ranges that start and end on line boundaries.
+
+    Args:
+        path: File to split
+        shards: Maximum number of ranges
+        start: Byte offset to start from (must be a line start)
+        end: Byte offset to stop at (default: end of file)
+
+    Returns:
+        List of (start, end) byte offsets covering [start, end), in order
+    """
+    end = os.path.getsize(path) if end is None else end
+    bounds = [start]
+    with open(path, 'rb') as f:
+        for k in range(1, shards):
+            target = start + (end - start) * k // shards
+            if target <= bounds[-1]:
+                continue
+            # Back up one byte so a target already on a line start stays put
+            f.seek(target - 1)
+            f.readline()
+            boundary = f.tell()
+            if bounds[-1] < boundary < end:
+                bounds.append(boundary)
+    bounds.append(end)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_shard(path: str, start: int, end: int) -> Iterator[str]:
+    """Yield decoded lines from the byte range [start, end) of a file."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode('utf-8', errors='replace')
+
+
+def iter_mmap_lines(path: str, start: int = 0, end: Optional[int] = None,
+                    tokens: Optional[Tuple[bytes, ...]] = None) -> Iterator[str]:
+    """
+    Yield decoded lines from a memory-mapped file.
+
+    With tokens, the mapping is searched (mmap.find) for the next occurrence
+    of any token and only the line containing it is decoded; lines without a
+    token are skipped without ever being touched from Python.
+
+    Args:
+        path: File to read
+        start: Byte offset of the first line (must be a line start)
+        end: Byte offset to stop at (default: end of file)
+        tokens: Byte strings a line must contain (any of them) to be yielded
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            find = mm.find
+            position = start
+            if not tokens:
+                while position < end:
+                    newline = find(b'\n', position, end)
+                    stop = end if newline < 0 else newline + 1
+                    yield mm[position:stop].decode('utf-8', errors='replace')
+                    position = stop
+                return
+
+            rfind = mm.rfind
+            # Next hit of each token at or after position (-1 once exhausted)
+            hits = [find(token, position, end) for token in tokens]
+            while True:
+                live = [hit for hit in hits if hit >= 0]
+                if not live:
+                    break
+                hit = min(live)
+                newline = rfind(b'\n', position, hit)
+                line_start = position if newline < 0 else newline + 1
+                newline = find(b'\n', hit, end)
+                stop = end if newline < 0 else newline + 1
+                yield mm[line_start:stop].decode('utf-8', errors='replace')
+                position = stop
+                for i, token in enumerate(tokens):
+                    if 0 <= hits[i] < stop:
+                        hits[i] = find(token, stop, end)
+
+
+def _shard_lines(path: str, start: int, end: int, errors_only: bool) -> Iterator[str]:
+    """Pick the reader for a byte range: prefiltered mmap scan or plain line reads."""
+    if errors_only:
+        return iter_mmap_lines(path, start, end, tokens=ERROR_LINE_TOKENS)
+    return _read_shard(path, start, end)
+
+
+def _parse_shard(path: str, start: int, end: int, keep_raw: bool, errors_only: bool) -> LogAnalyzer:
+    """Worker entry point: parse one shard into its own analyzer."""
+    analyzer = LogAnalyzer(keep_raw=keep_raw, errors_only=errors_only)
+    analyzer.add_log_lines(_shard_lines(path, start, end, errors_only))
+    return analyzer
+
+
+def _parse_compressed_range(path: str, compression: str, start: int, end: int, keep_raw: bool,
+                            errors_only: bool) -> Tuple[str, LogAnalyzer, Optional[str]]:
+    """
+    Worker entry point: decompress and parse one member range of a compressed file.
+
+    Member boundaries need not fall on line boundaries, so the text before
+    the first line break (head) and after the last one (tail) is returned
+    unparsed for the parent to join with the neighbouring ranges.
+
+    Returns:
+        (head, analyzer of the complete lines in between, tail); tail is None
+        when the range contains no line break at all (head is then all of it)
+    """
+    analyzer = LogAnalyzer(keep_raw=keep_raw, errors_only=errors_only)
+    tail = ''
+
+    def complete_lines(lines: Iterator[str]) -> Iterator[str]:
+        nonlocal tail
+        for line in lines:
+            if line.endswith('\n'):
+                yield line
+            else:
+                tail = line
+
+    with open_decompressed(path, compression, start, end) as f:
+        lines = iter(f)
+        head = next(lines, '')
+        if not head.endswith('\n'):
+            return head, analyzer, None
+        analyzer.add_log_lines(complete_lines(lines))
+    return head, analyzer, tail
+
+
+def _parse_compressed(path: str, compression: str, workers: int, keep_raw: bool,
+                      errors_only: bool, start: int, end: Optional[int]) -> LogAnalyzer:
+    """
+    Parse a gzip/bzip2/zstd log file.
+
+    Independent members are decompressed and parsed in worker processes when
+    there are several; otherwise (or if a split point turns out not to be a
+    member boundary) the file is decompressed in a background thread while
+    this process parses.
+    """
+    ranges = member_ranges(path, compression, workers, start, end) if workers > 1 else []
+    if len(ranges) > 1:
+        try:
+            analyzer = LogAnalyzer(keep_raw=keep_raw, errors_only=errors_only)
+            with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+                results = executor.map(
+                    _parse_compressed_range,
+                    [path] * len(ranges),
+                    [compression] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges],
+                    [keep_raw] * len(ranges),
+                    [errors_only] * len(ranges),
+                )
+                # Lines split across ranges are joined and parsed here, between
+                # the ranges they came from, to keep input order
+                carry = ''
+                for head, shard, tail in results:
+                    if tail is None:
+                        carry += head
+                        continue
+                    analyzer.add_log_line(carry + head)
+                    analyzer.merge(shard)
+                    carry = tail
+                if carry:
+                    analyzer.add_log_line(carry)
+            return analyzer
+        except CompressionError:
+            pass  # A split point was not a member boundary; decompress sequentially
+
+    analyzer = LogAnalyzer(keep_raw=keep_raw, errors_only=errors_only)
+    with open_decompressed(path, compression, start, end) as f:
+        analyzer.add_log_lines(f)
+    return analyzer
+
+
+def parse_file(path: str, workers: int = 1, keep_raw: bool = False,
+               errors_only: bool = False, start: int = 0,
+               end: Optional[int] = None) -> LogAnalyzer:
+    """
+    Parse a log file, optionally sharded across worker processes.
+
+    Shards are merged back in file order, so the resulting analyzer (and its
+    report) is identical to a single-process parse. gzip, bzip2 and zstd
+    files (detected by magic bytes) are decompressed on the fly.
+
+    Args:
+        path: Log file to parse
+        workers: Number of worker processes (1 = parse in this process)
+        keep_raw: Retain raw lines in the resulting store
+        errors_only: Only decode and parse lines that look like Error/Fault
+            entries (memory-mapped scan with a byte-level prefilter)
+        start: Byte offset to start parsing at (must be a line start, or a
+            member start for compressed files)
+        end: Byte offset to stop at (default: end of file)
+
+    Returns:
+        LogAnalyzer holding every parsed entry
+    """
+    compression = file_compression(path)
+    if compression:
+        return _parse_compressed(path, compression, workers, keep_raw, errors_only, start, end)
+
+    if workers <= 1:
+        analyzer = LogAnalyzer(keep_raw=keep_raw, errors_only=errors_only)
+        if errors_only:
+            analyzer.add_log_lines(iter_mmap_lines(path, start, end, tokens=ERROR_LINE_TOKENS))
+        elif start or end is not None:
+            analyzer.add_log_lines(_read_shard(path, start, os.path.getsize(path) if end is None else end))
+        else:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                analyzer.add_log_lines(f)
+        return analyzer
+
+    shards = shard_offsets(path, workers, start, end)
+    analyzer = LogAnalyzer(keep_raw=keep_raw, errors_only=errors_only)
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+        results = executor.map(
+            _parse_shard,
+            [path] * len(shards),
+            [start for start, _ in shards],
+            [end for _, end in shards],
+            [keep_raw] * len(shards),
+            [errors_only] * len(shards),
+        )
+        # executor.map yields in submission order, keeping the merge deterministic
+        for shard in results:
+            analyzer.merge(shard)
+    return analyzer
+
+
+def parse_file_incremental(path: str, checkpoint_path: str, workers: int = 1,
+                           keep_raw: bool = False,
+                           errors_only: bool = False) -> Tuple[LogAnalyzer, int]:
+    """
+    Parse only what was appended to a log file since the last checkpoint.
+
+    The saved counters are extended with the new lines and written back with
+    the new offset. Only complete lines are consumed; a partially written
+    last line is left for the next run. If the checkpoint is missing,
+    unreadable or does not match the file (rotated, truncated, rewritten,
+    other options), the whole file is parsed.
+
+    Args:
+        path: Log file to parse
+        checkpoint_path: Checkpoint file to resume from and update
+        workers: Number of worker processes for the new bytes
+        keep_raw: Retain raw lines in the resulting store
+        errors_only: Only analyze Error/Fault entries
+
+    Returns:
+        (analyzer, byte offset the run resumed from). The analyzer's counters
+        cover the whole file; its rows only the lines parsed by this run.
+    """
+    options = {"keep_raw": keep_raw, "errors_only": errors_only}
+    analyzer, offset = None, 0
+    resumed = load_checkpoint(checkpoint_path, path, options)
+    if resumed is not None:
+        state, offset = resumed
+        try:
+            analyzer = LogAnalyzer.from_checkpoint_state(state, keep_raw=keep_raw, errors_only=errors_only)
+        except (KeyError, TypeError, ValueError, IndexError, AttributeError):
+            # A damaged state is treated like no checkpoint
+            offset = 0
+    if analyzer is None:
+        analyzer = LogAnalyzer(keep_raw=keep_raw, errors_only=errors_only)
+
+    # A compressed log only grows by whole members, so all of it is consumed
+    end = os.path.getsize(path) if file_compression(path) else complete_lines_end(path, offset)
+    if end > offset:
+        analyzer.merge(parse_file(path, workers=workers, keep_raw=keep_raw,
+                                  errors_only=errors_only, start=offset, end=end))
+    save_checkpoint(checkpoint_path, path, end, analyzer.checkpoint_state(), options)
+    return analyzer, offset
+
+
+def stdin_lines() -> Iterable[str]:
+    """Lines piped to stdin, decompressed first if the data is gzip, bzip2 or zstd."""
+    compression = detect_compression(sys.stdin.buffer.peek(4)[:4])
+    return decompress_stream(sys.stdin.buffer, compression) if compression else sys.stdin
+
+
+def fleet_host_name(path: str) -> str:
+    """Host name of a per-host log file: its name without log and compression suffixes."""
+    name = Path(path).name
+    for suffix in ('.gz', '.bz2', '.zst', '.txt', '.log'):
+        if name.endswith(suffix) and len(name) > len(suffix):
+            name = name[:-len(suffix)]
+    return name
+
+
+def _aggregate_host(path: str, errors_only: bool) -> Tuple[str, Optional[FleetAggregate], Optional[str]]:
+    """
+    Worker entry point: parse one host's log into its fleet aggregate.
+
+    Returns:
+        (host, aggregate, None), or (host, None, error message) if the log
+        could not be read
+    """
+    host = fleet_host_name(path)
+    try:
+        return host, parse_file(path, errors_only=errors_only).fleet_aggregate(host), None
+    except (OSError, CompressionError) as e:
+        return host, None, str(e)
+
+
+def analyze_fleet(directory: str, workers: int = 1, errors_only: bool = False) -> FleetAggregate:
+    """
+    Analyze a directory holding one log file per host.
+
+    Each host's log is parsed in a worker process and reduced to a small
+    FleetAggregate; the parent only merges aggregates. Files named
+    *.fleet.json are aggregates saved by an earlier fleet run (e.g. one per
+    site) and are merged as they are, so fleets can be rolled up in stages.
+    Hidden files are ignored; unreadable logs are reported on stderr and skipped.
+
+    Args:
+        directory: Directory of per-host logs (plain or gzip/bzip2/zstd)
+        workers: Number of hosts parsed concurrently
+        errors_only: Only analyze Error/Fault entries
+
+    Returns:
+        FleetAggregate over every host
+    """
+    paths = sorted(str(path) for path in Path(directory).iterdir()
+                   if path.is_file() and not path.name.startswith('.'))
+    saved = [path for path in paths if path.endswith(AGGREGATE_SUFFIX)]
+    logs = [path for path in paths if not path.endswith(AGGREGATE_SUFFIX)]
+
+    fleet = FleetAggregate()
+    for path in saved:
+        try:
+            fleet.merge(FleetAggregate.load(path))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: skipping aggregate {path}: {e}", file=sys.stderr)
+
+    def merge_results(results):
+        for host, aggregate, error in results:
+            if aggregate is None:
+                print(f"Warning: skipping host {host}: {error}", file=sys.stderr)
+            else:
+                fleet.merge(aggregate)
+
+    if workers <= 1 or len(logs) <= 1:
+        merge_results(_aggregate_host(path, errors_only) for path in logs)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(logs))) as executor:
+            merge_results(executor.map(_aggregate_host, logs, [errors_only] * len(logs)))
+    return fleet
+
+
 def main():
     """Main entry point for log analysis."""
-    if len(sys.argv) < 2:
-        print("Usage: python parse_macos_logs.py <log_file>")
+    parser = argparse.ArgumentParser(
+        description="Parse and analyze macOS unified logs (Phase 1: Diagnostic)"
+    )
+    parser.add_argument("log_file", nargs="?", help="Log file to analyze, or '-' for stdin")
+    parser.add_argument("--workers", type=int,
+                        help="Parse the file in N worker processes (default: 1; "
+                             "with --fleet, hosts in parallel, default: one per CPU)")
+    parser.add_argument("--errors-only", action="store_true",
+                        help="Only analyze Error/Fault entries, skipping other lines before decoding")
+    parser.add_argument("--fleet", metavar="DIR",
+                        help="Analyze one log file per host in DIR and report errors common "
+                             "across hosts vs host-specific ones")
+    parser.add_argument("--save-aggregate", metavar="PATH",
+                        help="With --fleet, also save the merged aggregate (name it *.fleet.json "
+                             "to merge it into a higher-level --fleet run)")
+    parser.add_argument("--json", metavar="PATH",
+                        help="Also write a JSON Lines artifact for agent_debate.py / agent_coordinator.py")
+    parser.add_argument("--index", metavar="PATH",
+                        help="Also write every parsed entry to a SQLite/FTS5 index for log_index.py queries")
+    parser.add_argument("--noise", metavar="PATH",
+                        help="Leave error templates recorded in this known-noise store out of "
+                             "causal chains and root causes")
+    parser.add_argument("--learn-noise", metavar="PATH",
+                        help="Record every error template of this log as known noise in PATH")
+    parser.add_argument("--collapse", action="store_true",
+                        help="Collapse consecutive repeated errors in the flow section into one ×N entry")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="Resume from (and update) a checkpoint, parsing only lines appended since")
+    parser.add_argument("--causality-window", type=float, default=DEFAULT_WINDOW_SECONDS, metavar="SECS",
+                        help="Errors within SECS of each other count as cause → effect "
+                             f"(default: {DEFAULT_WINDOW_SECONDS:g})")
+    parser.add_argument("--follow", action="store_true",
+                        help="Consume stdin continuously and print rolling-window reports")
+    parser.add_argument("--interval", type=float, default=30.0,
+                        help="Seconds between --follow reports (default: 30)")
+    parser.add_argument("--window", type=float, default=300.0,
+                        help="Sliding window length in seconds for --follow (default: 300)")
+    args = parser.parse_args()
+
+    if args.follow:
+        if args.log_file not in (None, '-'):
+            parser.error("--follow reads from stdin; pipe logs in instead of passing a file")
+        monitor = LogStreamMonitor(window_seconds=args.window)
+        follow_stream(sys.stdin, monitor, args.interval)
+        return
+
+    if args.fleet:
+        if args.log_file is not None:
+            parser.error("--fleet reads every file in DIR; do not pass a log file as well")
+        if not os.path.isdir(args.fleet):
+            print(f"Error: {args.fleet} is not a directory", file=sys.stderr)
+            sys.exit(1)
+        fleet = analyze_fleet(args.fleet, workers=args.workers or os.cpu_count() or 1,
+                              errors_only=args.errors_only)
+        fleet.write_report(sys.stdout)
+        if args.save_aggregate:
+            fleet.save(args.save_aggregate)
+        return
+
+    if args.log_file is None:
+        print("Usage: python parse_macos_logs.py [--workers N] [--errors-only] [--checkpoint PATH] <log_file>")
         print("Or pipe logs: log show --last 1h | python parse_macos_logs.py -")
+        print("Or follow:    log stream | python parse_macos_logs.py --follow")
+        print("Or a fleet:   python parse_macos_logs.py --fleet logs_by_host/")
         sys.exit(1)
 
-    analyzer = LogAnalyzer()
+    # Read from file or stdin; compressed input is decompressed on the fly
+    if args.log_file == '-' and args.checkpoint:
+        parser.error("--checkpoint needs a log file; stdin has no offset to resume from")
+    try:
+        if args.log_file == '-':
+            analyzer = LogAnalyzer(errors_only=args.errors_only)
+            analyzer.add_log_lines(stdin_lines())
+        elif args.checkpoint:
+            analyzer, offset = parse_file_incremental(args.log_file, args.checkpoint, workers=args.workers or 1,
+                                                      errors_only=args.errors_only)
+            if offset:
+                print(f"Resumed from checkpoint at byte {offset:,}", file=sys.stderr)
+        else:
+            analyzer = parse_file(args.log_file, workers=args.workers or 1, errors_only=args.errors_only)
+        if args.noise:
+            analyzer.use_noise_store(NoiseStore(args.noise))
+    except (CheckpointError, CompressionError, NoiseStoreError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
-    # Read from file or stdin
-    if sys.argv[1] == '-':
-        for line in sys.stdin:
-            analyzer.add_log_line(line)
-    else:
-        with open(sys.argv[1], 'r') as f:
-            for line in f:
-                analyzer.add_log_line(line)
+    # Stream the report section by section
+    analyzer.write_full_report(sys.stdout, collapse=args.collapse, causality_window=args.causality_window)
+
+    if args.json:
+        analyzer.write_artifact(args.json, causality_window=args.causality_window)
+
+    if args.index:
+        try:
+            analyzer.write_index(args.index, source=os.path.abspath(args.log_file) if args.log_file != '-' else '-')
+        except LogIndexError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
 
-    # Generate and print report
-    print(analyzer.generate_full_report())
+    if args.learn_noise:
+        try:
+            store = NoiseStore(args.learn_noise)
+            added = analyzer.learn_noise(store)
+            store.save()
+        except NoiseStoreError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Known noise: added {added} templates to {args.learn_noise} ({len(store)} total)",
+              file=sys.stderr)
 
 
 if __name__ == '__main__':
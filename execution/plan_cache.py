@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Persistent LRU cache of rendered master plan sections (Phase 3).
+
+The same root cause and fix recur from run to run, and so does most of the
+plan Agent Gamma renders for them. PlanCache keeps those renderings in a
+small JSON file, bounded to the most recently used entries, with hit/miss
+counters that survive between runs:
+
+    cache = PlanCache()                    # .tmp/plan_cache.json
+    body = cache.get(key)
+    if body is None:
+        cache.put(key, render())
+    cache.save()
+    print(cache.stats())
+
+A cache file that is missing, unreadable or from another format version is
+treated as empty; the cache only ever costs a re-render. Runs sharing a
+cache file do not merge their changes: the last one to save wins.
+"""
+
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+# Bump whenever the cached values change shape
+PLAN_CACHE_VERSION = 1
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / ".tmp" / "plan_cache.json"
+
+# Plans kept before the least recently used one is evicted
+DEFAULT_MAX_ENTRIES = 128
+
+
+class PlanCacheError(Exception):
+    """Raised when the cache file cannot be written."""
+    pass
+
+
+class PlanCache:
+    """Size-bounded LRU mapping of plan signatures to rendered text, persisted as JSON."""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            path: Cache file (default: .tmp/plan_cache.json in the project root)
+            max_entries: Maximum number of cached plans
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()  # least recently used first
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != PLAN_CACHE_VERSION:
+            return
+        self._entries.update(data.get("entries", []))
+        for name in self._stats:
+            self._stats[name] = int(data.get("stats", {}).get(name, 0))
+        self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached text for key (marking it most recently used), or None; counts a hit or miss."""
+        value = self._entries.get(key)
+        if value is None:
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return value
+
+    def put(self, key: str, value: str):
+        """Cache text for key, evicting the least recently used entries beyond max_entries."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self._stats = dict.fromkeys(self._stats, 0)
+
+    def save(self):
+        """
+        Write the cache atomically (unique temp file + rename).
+
+        Concurrent runs never see a torn file, but the last writer wins: a
+        run's save replaces the file with its own entries and counters, so
+        entries and stats added meanwhile by another run are dropped.
+        """
+        temp = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name + '.',
+                                        suffix='.tmp')
+            with open(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": PLAN_CACHE_VERSION,
+                    "stats": self._stats,
+                    "entries": list(self._entries.items()),
+                }, f, ensure_ascii=False)
+            os.replace(temp, self.path)
+        except OSError as e:
+            if temp is not None and os.path.exists(temp):
+                os.unlink(temp)
+            raise PlanCacheError(f"Could not write plan cache {self.path}: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Cumulative hits, misses and evictions, plus current and maximum size."""
+        return {**self._stats, "entries": len(self._entries), "max_entries": self.max_entries}
+
+    def format_stats(self) -> str:
+        """One-line summary of stats() for the command line."""
+        stats = self.stats()
+        lookups = stats["hits"] + stats["misses"]
+        rate = f"{stats['hits'] / lookups:.0%}" if lookups else "n/a"
+        return (f"Plan cache: {stats['hits']} hits, {stats['misses']} misses (hit rate {rate}), "
+                f"{stats['entries']}/{stats['max_entries']} entries, {stats['evictions']} evicted")
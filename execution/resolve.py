@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Single-process resolution pipeline: Diagnostic → Debate → Master Plan.
+
+Runs all three phases in one interpreter and hands results between them as
+in-memory artifact records, instead of writing each phase's text report and
+re-parsing it in the next process:
+
+    from resolve import resolve
+    plan = resolve("system_errors.txt")
+    print(plan.root_cause.primary_issue)
+    print(plan.markdown)
+
+The command line writes the same files as the separate phase scripts, on
+request, so scripts/resolve_system_issues.sh can stay a thin wrapper:
+
+    resolve.py logs.txt --phase1-report p1.txt --phase1-json p1.jsonl \\
+                        --phase2-report p2.txt --phase2-json p2.jsonl -o plan.md
+"""
+
+import argparse
+import io
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Union
+
+# Sibling modules in execution/
+sys.path.insert(0, str(Path(__file__).parent))
+
+from agent_coordinator import AgentGamma, MasterPlan
+from agent_debate import (AgentAlpha, AgentBeta, Critique, DebateFacilitator, ProposedFix,
+                          error_patterns_from_records, phase2_artifact_records)
+from log_artifacts import write_artifact
+from log_causality import DEFAULT_WINDOW_SECONDS
+from log_checkpoint import CheckpointError
+from log_compression import CompressionError
+from log_index import LogIndexError
+from log_noise import NoiseStore, NoiseStoreError
+from parse_macos_logs import LogAnalyzer, parse_file, parse_file_incremental, stdin_lines
+from plan_cache import PlanCache
+
+# A log file path, '-' for stdin, an iterable of log lines, or an already
+# populated LogAnalyzer
+LogSource = Union[str, os.PathLike, Iterable[str], LogAnalyzer]
+
+
+class ResolveError(Exception):
+    """Raised when the pipeline cannot produce a plan (e.g. the log has no errors)."""
+    pass
+
+
+@dataclass
+class PipelineRun:
+    """Everything one pipeline run produced, phase by phase."""
+    analyzer: LogAnalyzer
+    phase1_records: List[Dict[str, Any]]
+    facilitator: DebateFacilitator
+    best_fix: ProposedFix
+    best_critique: Critique
+    plan: MasterPlan
+
+    def phase2_records(self) -> List[Dict[str, Any]]:
+        """Phase 2 results as artifact records (see log_artifacts.py)."""
+        return phase2_artifact_records(self.facilitator, self.best_fix, self.best_critique)
+
+
+def analyze(log_source: LogSource, workers: int = 1, errors_only: bool = False,
+            checkpoint: Optional[str] = None) -> LogAnalyzer:
+    """
+    Phase 1: parse a log source into a LogAnalyzer.
+
+    Args:
+        log_source: Log file path, '-' for stdin, iterable of lines, or a LogAnalyzer
+        workers: Worker processes for a log file (see parse_file)
+        errors_only: Only analyze Error/Fault entries
+        checkpoint: Resume from (and update) this checkpoint; log files only
+    """
+    if isinstance(log_source, LogAnalyzer):
+        return log_source
+    if isinstance(log_source, (str, os.PathLike)) and str(log_source) != '-':
+        if checkpoint:
+            return parse_file_incremental(str(log_source), checkpoint, workers=workers,
+                                          errors_only=errors_only)[0]
+        return parse_file(str(log_source), workers=workers, errors_only=errors_only)
+
+    if checkpoint:
+        raise ResolveError("A checkpoint needs a log file; streamed lines have no offset to resume from")
+    analyzer = LogAnalyzer(errors_only=errors_only)
+    analyzer.add_log_lines(stdin_lines() if log_source == '-' else log_source)
+    return analyzer
+
+
+def run_pipeline(log_source: LogSource, workers: int = 1, errors_only: bool = False,
+                 checkpoint: Optional[str] = None,
+                 causality_window: float = DEFAULT_WINDOW_SECONDS,
+                 debate_out: Optional[TextIO] = None,
+                 plan_cache: Optional[PlanCache] = None,
+                 noise_store: Optional[NoiseStore] = None) -> PipelineRun:
+    """
+    Run Diagnostic → Debate → Master Plan on in-memory objects.
+
+    Args:
+        log_source: See analyze()
+        workers: Worker processes for a log file
+        errors_only: Only analyze Error/Fault entries
+        checkpoint: Phase 1 checkpoint to resume from and update
+        causality_window: Δt in seconds for causal chains
+        debate_out: Stream for the Phase 2 transcript (default: discarded)
+        plan_cache: Reuse master plan sections for a recurring root cause and
+            fix (default: render every time)
+        noise_store: Known-noise templates to leave out of causal chains and
+            root causes, so the debate only sees novel errors
+
+    Returns:
+        PipelineRun with every phase's result
+    """
+    analyzer = analyze(log_source, workers=workers, errors_only=errors_only, checkpoint=checkpoint)
+    if noise_store is not None:
+        analyzer.use_noise_store(noise_store)
+    phase1_records = list(analyzer.artifact_records(causality_window))
+
+    errors = error_patterns_from_records(phase1_records)
+    if not errors:
+        if analyzer.error_count:
+            raise ResolveError("Every error matches known noise. Nothing to resolve.")
+        raise ResolveError("No errors found in the log. Nothing to resolve.")
+
+    facilitator = DebateFacilitator(AgentAlpha(), AgentBeta(),
+                                    out=debate_out if debate_out is not None else io.StringIO())
+    best_fix, best_critique, _ = facilitator.conduct_debate(errors)
+    facilitator.print_consensus(best_fix, best_critique)
+
+    gamma = AgentGamma(cache=plan_cache)
+    plan = gamma.build_master_plan(
+        gamma.root_cause_from_records(phase1_records),
+        gamma.decision_from_records(phase2_artifact_records(facilitator, best_fix, best_critique)),
+    )
+    return PipelineRun(analyzer, phase1_records, facilitator, best_fix, best_critique, plan)
+
+
+def resolve(log_source: LogSource, **options) -> MasterPlan:
+    """
+    Produce a master plan for a log source in this process.
+
+    Args:
+        log_source: Log file path, '-' for stdin, iterable of lines, or a LogAnalyzer
+        **options: workers, errors_only, checkpoint, causality_window, plan_cache,
+            noise_store (see run_pipeline)
+
+    Returns:
+        MasterPlan with the root cause, consensus decision and rendered markdown
+    """
+    return run_pipeline(log_source, **options).plan
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run the full log resolution pipeline (Diagnostic → Debate → Master Plan) in one process"
+    )
+    parser.add_argument("log_file", help="Log file to analyze, or '-' for stdin")
+    parser.add_argument("-o", "--output", metavar="PATH",
+                        help="Write the master plan here instead of stdout")
+    parser.add_argument("--phase1-report", metavar="PATH", help="Also write the Phase 1 text report")
+    parser.add_argument("--phase1-json", metavar="PATH", help="Also write the Phase 1 JSON Lines artifact")
+    parser.add_argument("--index", metavar="PATH",
+                        help="Also write every parsed entry to a SQLite/FTS5 index for log_index.py queries")
+    parser.add_argument("--phase2-report", metavar="PATH", help="Also write the Phase 2 debate transcript")
+    parser.add_argument("--phase2-json", metavar="PATH", help="Also write the Phase 2 JSON Lines artifact")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Parse the file in N worker processes (default: 1)")
+    parser.add_argument("--errors-only", action="store_true",
+                        help="Only analyze Error/Fault entries, skipping other lines before decoding")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="Resume Phase 1 from (and update) a checkpoint, parsing only lines appended since")
+    parser.add_argument("--causality-window", type=float, default=DEFAULT_WINDOW_SECONDS, metavar="SECS",
+                        help=f"Δt for causal chains in seconds (default: {DEFAULT_WINDOW_SECONDS:g})")
+    parser.add_argument("--noise", metavar="PATH",
+                        help="Leave error templates in this known-noise store (parse_macos_logs.py "
+                             "--learn-noise) out of the analysis")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Render the whole master plan instead of reusing cached sections")
+    parser.add_argument("--cache", metavar="PATH", help="Plan cache file (default: .tmp/plan_cache.json)")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print plan cache hit/miss statistics to stderr")
+    args = parser.parse_args()
+
+    plan_cache = None if args.no_cache else PlanCache(args.cache)
+    phase2_report = open(args.phase2_report, 'w') if args.phase2_report else None
+    try:
+        noise_store = NoiseStore(args.noise) if args.noise else None
+        run = run_pipeline(args.log_file, workers=args.workers, errors_only=args.errors_only,
+                           checkpoint=args.checkpoint, causality_window=args.causality_window,
+                           debate_out=phase2_report, plan_cache=plan_cache, noise_store=noise_store)
+    except (ResolveError, CheckpointError, CompressionError, NoiseStoreError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if phase2_report:
+            phase2_report.close()
+
+    if args.phase1_report:
+        with open(args.phase1_report, 'w') as f:
+            run.analyzer.write_full_report(f, causality_window=args.causality_window)
+    if args.phase1_json:
+        write_artifact(args.phase1_json, 1, run.phase1_records)
+    if args.index:
+        try:
+            run.analyzer.write_index(args.index, source=os.path.abspath(args.log_file) if args.log_file != '-' else '-')
+        except LogIndexError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    if args.phase2_json:
+        write_artifact(args.phase2_json, 2, run.phase2_records())
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(run.plan.markdown + "\n")
+    else:
+        print(run.plan.markdown)
+    if args.cache_stats and plan_cache is not None:
+        print(plan_cache.format_stats(), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
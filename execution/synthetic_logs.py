@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic macOS unified-log generator for benchmarks.
+
+Lines look like `log show` output and are fully determined by the seed and
+the configuration: size, level mix, number of distinct processes, and error
+bursts (stretches where one process floods the log with errors). The default
+configuration reproduces the fixture benchmark_log_parsing.py has always used.
+
+Usage:
+    python3 execution/synthetic_logs.py --lines 1000000 -o .tmp/synthetic.txt
+    python3 execution/synthetic_logs.py --lines 200000 --processes 500 --bursts 3 \\
+        --levels Default=60,Error=30,Fault=10 -o .tmp/bursty.txt
+"""
+
+import argparse
+import random
+import sys
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+PROCESSES = [
+    ("kernel", "com.apple.kernel", "AppleACPIPlatform"),
+    ("launchd", "com.apple.xpc.launchd", "service"),
+    ("WindowServer", "com.apple.WindowServer", "display"),
+    ("Safari", "com.apple.Safari", "WebProcess"),
+    ("Mail", "com.apple.mail", "IMAP"),
+    ("Slack", "com.tinyspeck.slackmacgap", "network"),
+    ("Dropbox", "com.getdropbox.dropbox", "sync"),
+    ("applicationd", "com.apple.appstored", "install"),
+]
+
+MESSAGES = [
+    "Failed to load framework at /System/Library/Frameworks/Foo.framework (error {n})",
+    "Memory allocation of {n} bytes failed",
+    "Service com.apple.service.{n} exited with abnormal code: 1",
+    "Connection {n} invalidated after timeout",
+    "ACPI: table checksum mismatch at 0x{n:x}",
+    "Sandbox: deny(1) file-read-data /private/var/db/{n}",
+]
+
+# Roughly the mix of a `log show` capture without a --level filter
+LEVEL_WEIGHTS = (("Default", 70), ("Info", 15), ("Debug", 5), ("Error", 6), ("Fault", 2), ("Warning", 2))
+
+START_DATE = date(2026, 1, 8)
+
+
+@dataclass(frozen=True)
+class SyntheticLogConfig:
+    """Shape of a synthetic log."""
+    level_weights: Tuple[Tuple[str, int], ...] = LEVEL_WEIGHTS
+    # Distinct processes; beyond the built-in eight, third-party apps are invented
+    processes: int = len(PROCESSES)
+    # Error bursts, spread evenly over the log
+    bursts: int = 0
+    burst_lines: int = 5000
+    # Share of the lines inside a burst that are the burst's errors
+    burst_share: float = 0.9
+    lines_per_second: int = 100
+    utc_offset: str = "-0500"
+    seed: int = 42
+
+    def process_table(self) -> List[Tuple[str, str, str]]:
+        """(process, subsystem, category) for each of the configured processes."""
+        table = PROCESSES[:self.processes]
+        for k in range(len(table), self.processes):
+            table.append((f"App{k}", f"com.example.app{k}", "general"))
+        return table
+
+
+def parse_level_weights(text: str) -> Tuple[Tuple[str, int], ...]:
+    """Parse a level mix like 'Default=60,Error=30,Fault=10'."""
+    weights = []
+    for item in text.split(','):
+        level, _, weight = (part.strip() for part in item.partition('='))
+        if level not in dict(LEVEL_WEIGHTS) or not weight.isdigit():
+            raise ValueError(f"Invalid level weight {item!r}; expected Level=N with Level one of "
+                             f"{', '.join(dict(LEVEL_WEIGHTS))}")
+        weights.append((level, int(weight)))
+    if not any(weight for _, weight in weights):
+        raise ValueError("Level weights must not all be zero")
+    return tuple(weights)
+
+
+def generate_lines(count: int, config: SyntheticLogConfig = SyntheticLogConfig()) -> Iterator[str]:
+    """Yield `count` synthetic unified-log lines, deterministically for a given config."""
+    rng = random.Random(config.seed)
+    levels = [level for level, weight in config.level_weights for _ in range(weight)]
+    processes = config.process_table()
+    starts = [(k + 1) * count // (config.bursts + 1) for k in range(config.bursts)]
+    burst_at = {start: k for k, start in enumerate(starts)}
+    burst, burst_end = None, -1
+    day, day_text = -1, ""
+    for i in range(count):
+        if i in burst_at:
+            burst, burst_end = burst_at[i], i + config.burst_lines
+        elif i >= burst_end:
+            burst = None
+
+        if burst is not None and rng.random() < config.burst_share:
+            process, subsystem, category = processes[burst % len(processes)]
+            level = "Error"
+            message = MESSAGES[burst % len(MESSAGES)].format(n=rng.randrange(1, 1 << 20))
+        else:
+            process, subsystem, category = rng.choice(processes)
+            level = rng.choice(levels)
+            message = rng.choice(MESSAGES).format(n=rng.randrange(1, 1 << 20))
+
+        minute, second = divmod(i // config.lines_per_second, 60)
+        hour, minute = divmod(minute, 60)
+        if hour // 24 != day:
+            day = hour // 24
+            day_text = (START_DATE + timedelta(days=day)).isoformat()
+        yield (
+            f"{day_text} {hour % 24:02d}:{minute:02d}:{second:02d}.{i % 1000000:06d}{config.utc_offset} "
+            f"0x{rng.randrange(1 << 24):x} {level:<10} 0x0 {rng.randrange(1, 99999)} 0 "
+            f"{process}: ({subsystem}) [{category}] {message}\n"
+        )
+
+
+def write_fixture(path: Path, count: int, config: SyntheticLogConfig = SyntheticLogConfig()):
+    """Write a synthetic fixture to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        f.writelines(generate_lines(count, config))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic macOS unified log")
+    parser.add_argument("--lines", type=int, default=100_000, help="Number of lines (default: 100k)")
+    parser.add_argument("--levels", default=",".join(f"{level}={weight}" for level, weight in LEVEL_WEIGHTS),
+                        help="Level mix as Level=weight pairs (default: %(default)s)")
+    parser.add_argument("--processes", type=int, default=len(PROCESSES),
+                        help=f"Distinct processes (default: {len(PROCESSES)})")
+    parser.add_argument("--bursts", type=int, default=0, help="Error bursts spread over the log (default: 0)")
+    parser.add_argument("--burst-lines", type=int, default=5000, help="Lines per burst (default: 5000)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("-o", "--output", type=Path, help="Write here instead of stdout")
+    args = parser.parse_args()
+    if args.processes < 1:
+        parser.error("--processes must be at least 1")
+
+    try:
+        config = SyntheticLogConfig(level_weights=parse_level_weights(args.levels), processes=args.processes,
+                                    bursts=args.bursts, burst_lines=args.burst_lines, seed=args.seed)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.output:
+        write_fixture(args.output, args.lines, config)
+    else:
+        sys.stdout.writelines(generate_lines(args.lines, config))
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@
 # USAGE:
 #   ./scripts/resolve_system_issues.sh <log_file.txt>     # Analyze existing logs
 #   ./scripts/resolve_system_issues.sh --live             # Capture live logs
+#   ./scripts/resolve_system_issues.sh --follow [SECS]    # Monitor log stream
 #
 # EXAMPLES:
 #   # Capture logs manually and analyze:
@@ -20,6 +21,9 @@
 #   # Or capture and analyze in one step:
 #   ./scripts/resolve_system_issues.sh --live
 #
+#   # Or monitor continuously, reporting the last 5 minutes every 60s:
+#   ./scripts/resolve_system_issues.sh --follow 60
+#
 # PHASES:
 #   Phase 1 - DIAGNOSTIC (Agent Alpha - The Investigator)
 #     Parses logs, categorizes errors, identifies patterns
@@ -35,13 +39,22 @@
 #
 # OUTPUT FILES (saved to .tmp/):
 #   - phase1_diagnostic.txt    # Diagnostic analysis
+#   - phase1_diagnostic.jsonl  # Machine-readable Phase 1 hand-off
+#   - phase1_<log>.ckpt        # Phase 1 resume point for an existing log file
 #   - phase2_debate.txt        # Agent debate consensus
+#   - phase2_debate.jsonl      # Machine-readable Phase 2 hand-off
 #   - master_plan_TIMESTAMP.md # Final implementation plan
+#   - plan_cache.json          # Plan sections reused when the same issue recurs
+#
+#   All phases run in one process (execution/resolve.py) and hand results
+#   over in memory; the .txt reports are kept for humans and the .jsonl
+#   artifacts let a single phase be re-run by hand.
 #
 # REQUIREMENTS:
 #   - Python 3
 #   - macOS system (for log show command)
-#   - Scripts: parse_macos_logs.py, agent_debate.py, agent_coordinator.py
+#   - Scripts: resolve.py (runs parse_macos_logs.py, agent_debate.py,
+#     agent_coordinator.py in-process)
 #
 # SEE ALSO:
 #   - HVAC_Docs/Development_Docs/multi-agents-log-resolution.md
@@ -86,6 +99,7 @@ if [ $# -eq 0 ]; then
     echo -e "${YELLOW}Usage:${NC}"
     echo "  $0 <log_file.txt>          # Analyze existing log file"
     echo "  $0 --live                  # Capture live logs (1 hour)"
+    echo "  $0 --follow [SECS]         # Monitor live stream, report every SECS (default 30)"
     echo ""
     echo -e "${YELLOW}Examples:${NC}"
     echo "  # Capture logs and analyze"
@@ -109,8 +123,14 @@ mkdir -p "$TMP_DIR"
 # Log File Handling
 ################################################################################
 
-# Handle live capture mode vs existing file
-if [ "$1" == "--live" ]; then
+# Handle follow mode, live capture mode, or existing file
+if [ "$1" == "--follow" ]; then
+    # Follow mode: rolling-window Phase 1 reports on the live stream (Ctrl+C to stop)
+    # Memory stays flat, so this can run for days; no debate/master plan is generated.
+    echo -e "${YELLOW}📡 Following live system logs (Ctrl+C to stop)...${NC}"
+    log stream --level error | python3 "$PROJECT_ROOT/execution/parse_macos_logs.py" --follow --interval "${2:-30}"
+    exit 0
+elif [ "$1" == "--live" ]; then
     # Live capture mode: grab last hour of error-level logs
     echo -e "${YELLOW}📡 Capturing live system logs (last 1 hour)...${NC}"
     LOG_FILE="$TMP_DIR/captured_logs_$(date +%Y%m%d_%H%M%S).txt"
@@ -129,57 +149,56 @@ else
 fi
 
 ################################################################################
-# PHASE 1: DIAGNOSTIC ANALYSIS
+# PHASES 1-3: DIAGNOSTIC → DEBATE → MASTER PLAN
 ################################################################################
 
+# All three phases run in one Python process (execution/resolve.py), handing
+# results over in memory; the reports and artifacts are written for humans
+# and for re-running a single phase by hand.
+PHASE1_OUTPUT="$TMP_DIR/phase1_diagnostic.txt"
+PHASE1_ARTIFACT="$TMP_DIR/phase1_diagnostic.jsonl"
+PHASE2_OUTPUT="$TMP_DIR/phase2_debate.txt"
+PHASE2_ARTIFACT="$TMP_DIR/phase2_debate.jsonl"
+MASTER_PLAN="$TMP_DIR/master_plan_$(date +%Y%m%d_%H%M%S).md"
+
+# Existing (rolling) log files resume from a checkpoint and parse only new lines
+RESOLVE_ARGS=()
+if [ "$1" != "--live" ]; then
+    RESOLVE_ARGS=(--checkpoint "$TMP_DIR/phase1_$(basename "$LOG_FILE").ckpt")
+fi
+python3 "$PROJECT_ROOT/execution/resolve.py" "$LOG_FILE" "${RESOLVE_ARGS[@]}" \
+    --phase1-report "$PHASE1_OUTPUT" --phase1-json "$PHASE1_ARTIFACT" \
+    --phase2-report "$PHASE2_OUTPUT" --phase2-json "$PHASE2_ARTIFACT" \
+    --output "$MASTER_PLAN"
+
 echo ""
 echo -e "${BLUE}═══════════════════════════════════════════════════════════════${NC}"
 echo -e "${BLUE}PHASE 1: DIAGNOSTIC (Agent Alpha - The Investigator)${NC}"
 echo -e "${BLUE}═══════════════════════════════════════════════════════════════${NC}"
 echo ""
 
-# Run diagnostic analysis on logs
-PHASE1_OUTPUT="$TMP_DIR/phase1_diagnostic.txt"
-python3 "$PROJECT_ROOT/execution/parse_macos_logs.py" "$LOG_FILE" > "$PHASE1_OUTPUT"
-
 # Display Phase 1 summary
 echo -e "${GREEN}✓${NC} Phase 1 Complete - Diagnostic Report Generated"
 echo ""
 grep -A 3 "Total Log Entries:" "$PHASE1_OUTPUT" || true
 echo ""
 
-################################################################################
-# PHASE 2: AGENT DEBATE AND DELIBERATION
-################################################################################
-
 echo -e "${BLUE}═══════════════════════════════════════════════════════════════${NC}"
 echo -e "${BLUE}PHASE 2: DELIBERATION (Agent Alpha & Agent Beta)${NC}"
 echo -e "${BLUE}═══════════════════════════════════════════════════════════════${NC}"
 echo ""
 
-# Run agent debate to reach consensus on best fix
-PHASE2_OUTPUT="$TMP_DIR/phase2_debate.txt"
-python3 "$PROJECT_ROOT/execution/agent_debate.py" "$PHASE1_OUTPUT" > "$PHASE2_OUTPUT"
-
 # Display Phase 2 summary
 echo -e "${GREEN}✓${NC} Phase 2 Complete - Consensus Reached"
 echo ""
 grep -A 2 "Selected Fix:" "$PHASE2_OUTPUT" || true
 echo ""
 
-################################################################################
-# PHASE 3: MASTER PLAN GENERATION
-################################################################################
-
 echo -e "${BLUE}═══════════════════════════════════════════════════════════════${NC}"
 echo -e "${BLUE}PHASE 3: MASTER PLAN (Agent Gamma - The Coordinator)${NC}"
 echo -e "${BLUE}═══════════════════════════════════════════════════════════════${NC}"
 echo ""
 
-# Generate comprehensive master plan with implementation steps
-MASTER_PLAN="$TMP_DIR/master_plan_$(date +%Y%m%d_%H%M%S).md"
-python3 "$PROJECT_ROOT/execution/agent_coordinator.py" "$PHASE1_OUTPUT" "$PHASE2_OUTPUT" > "$MASTER_PLAN"
-
 echo -e "${GREEN}✓${NC} Phase 3 Complete - Master Plan Generated"
 echo ""
 
@@ -197,7 +216,9 @@ echo -e "${BLUE}═════════════════════
 echo ""
 echo -e "${YELLOW}📁 Output files saved to:${NC}"
 echo "  Phase 1 (Diagnostic):  $PHASE1_OUTPUT"
+echo "                         $PHASE1_ARTIFACT"
 echo "  Phase 2 (Debate):      $PHASE2_OUTPUT"
+echo "                         $PHASE2_ARTIFACT"
 echo "  Master Plan:           $MASTER_PLAN"
 echo ""
 echo -e "${YELLOW}📋 Next steps:${NC}"